@@ -21,6 +21,50 @@ from pathlib import Path
 
 import numpy as np
 
+from .motifs import _popcount
+from .voxel_encoder import _read_gray_frames
+
+# SWAR popcount masks for 64-bit lanes
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+
+
+def _encode_windows(frames: np.ndarray, t: int) -> np.ndarray:
+    """
+    Encode consecutive ``t``-frame windows into 64-bit words in one pass.
+
+    Each window is binarized against its own mean and its first 64
+    pixels are packed into a little-endian word. Trailing frames that
+    do not fill a whole window are ignored.
+
+    Args:
+        frames: Array of shape (T, H, W).
+        t: Frames per window.
+
+    Returns:
+        ``uint64`` array with one word per window.
+    """
+    n = frames.shape[0] // t
+    if n == 0:
+        return np.empty(0, dtype=np.uint64)
+    rows = frames[: n * t].reshape(n, -1)
+    thresholds = rows.mean(axis=1)
+    bits = rows[:, :64] > thresholds[:, None]
+    packed = np.zeros((n, 8), dtype=np.uint8)
+    packed_bits = np.packbits(bits, axis=1)
+    packed[:, : packed_bits.shape[1]] = packed_bits
+    return packed.view("<u8").ravel().astype(np.uint64)
+
+
+def _popcount64(words: np.ndarray) -> np.ndarray:
+    """Per-element set-bit count of a ``uint64`` array (SWAR popcount)."""
+    x = words - ((words >> np.uint64(1)) & _M1)
+    x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+    x = (x + (x >> np.uint64(4))) & _M4
+    return (x * _H01) >> np.uint64(56)
+
 
 class MotifType(Enum):
     """Classification of delta patterns into semantic motifs."""
@@ -49,6 +93,16 @@ class Delta:
         timestamp_ms: The timestamp in milliseconds.
     """
 
+    # Spelled out rather than dataclass(slots=True), which needs 3.10
+    __slots__ = (
+        "frame_index",
+        "voxel_index",
+        "delta_word",
+        "motif",
+        "magnitude",
+        "timestamp_ms",
+    )
+
     frame_index: int
     voxel_index: tuple[int, int]
     delta_word: int
@@ -66,6 +120,91 @@ class Delta:
         return self.delta_word.to_bytes(8, byteorder="little")
 
 
+# MotifType members keyed by their enum value
+_MOTIF_BY_VALUE = {m.value: m for m in MotifType}
+
+
+@dataclass
+class DeltaBatch:
+    """
+    Deltas stored as parallel arrays rather than one object per delta.
+
+    Every delta in a DeltaStream is at voxel (0, 0), so no voxel index
+    array is kept.
+
+    Attributes:
+        frame_index: int64 array of shape (N,) with each delta's frame.
+        delta_word: uint64 array of shape (N,) with the XOR delta words.
+        bit_count: uint64 array of shape (N,) with set bits per word.
+        motif: int64 array of shape (N,) with ``MotifType`` values.
+        timestamp_ms: float64 array of shape (N,) with timestamps.
+    """
+
+    frame_index: np.ndarray
+    delta_word: np.ndarray
+    bit_count: np.ndarray
+    motif: np.ndarray
+    timestamp_ms: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.delta_word)
+
+    @property
+    def magnitude(self) -> np.ndarray:
+        """Change strength per delta (0.0 to 1.0)."""
+        return self.bit_count / 64.0
+
+    @property
+    def is_event(self) -> np.ndarray:
+        """Boolean mask of deltas that are significant events."""
+        return (self.delta_word != 0) & (self.magnitude > 0.1)
+
+    def select(self, mask: np.ndarray) -> DeltaBatch:
+        """Return the deltas where *mask* is True as a new batch."""
+        return DeltaBatch(
+            frame_index=self.frame_index[mask],
+            delta_word=self.delta_word[mask],
+            bit_count=self.bit_count[mask],
+            motif=self.motif[mask],
+            timestamp_ms=self.timestamp_ms[mask],
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize every delta word, 8 little-endian bytes each."""
+        return self.delta_word.astype("<u8").tobytes()
+
+    def delta(self, i: int) -> Delta:
+        """Materialize the delta at index *i* as a Delta object."""
+        return Delta(
+            frame_index=int(self.frame_index[i]),
+            voxel_index=(0, 0),
+            delta_word=int(self.delta_word[i]),
+            motif=_MOTIF_BY_VALUE[int(self.motif[i])],
+            magnitude=int(self.bit_count[i]) / 64.0,
+            timestamp_ms=float(self.timestamp_ms[i]),
+        )
+
+    def to_deltas(self) -> list[Delta]:
+        """Materialize the batch as a list of Delta objects."""
+        return [
+            Delta(
+                frame_index=frame_index,
+                voxel_index=(0, 0),
+                delta_word=delta_word,
+                motif=_MOTIF_BY_VALUE[motif],
+                magnitude=bit_count / 64.0,
+                timestamp_ms=timestamp_ms,
+            )
+            for frame_index, delta_word, bit_count, motif, timestamp_ms in zip(
+                self.frame_index.tolist(),
+                self.delta_word.tolist(),
+                self.bit_count.tolist(),
+                self.motif.tolist(),
+                self.timestamp_ms.tolist(),
+            )
+        ]
+
+
 class DeltaStream:
     """
     Iterator over video frames producing Delta objects.
@@ -118,8 +257,10 @@ class DeltaStream:
         self.fps = fps
         self.frame_count = frames.shape[0]
 
-        self._current_index = 0
-        self._prev_voxels: np.ndarray | None = None
+        # Every delta of the stream, computed on first iteration
+        self._batch: DeltaBatch | None = None
+        # Position of next(stream); for loops get their own from __iter__
+        self._cursor: Iterator[Delta] | None = None
 
     @classmethod
     def from_video(
@@ -158,17 +299,12 @@ class DeltaStream:
         cap = cv2.VideoCapture(str(path))
         fps = cap.get(cv2.CAP_PROP_FPS)
 
-        frames = []
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            frames.append(gray)
-
-        cap.release()
+        try:
+            frames = _read_gray_frames(cv2, cap)
+        finally:
+            cap.release()
 
-        return cls(np.array(frames), voxel_size=voxel, tile_method=tile_method, fps=fps)
+        return cls(frames, voxel_size=voxel, tile_method=tile_method, fps=fps)
 
     @classmethod
     def from_numpy(
@@ -191,14 +327,22 @@ class DeltaStream:
         return cls(frames, voxel_size=voxel, fps=fps)
 
     def __iter__(self) -> Iterator[Delta]:
-        """Reset iterator and return self."""
-        self._current_index = 0
-        self._prev_voxels = None
-        return self
+        """
+        Yield each Delta of the stream in frame order.
+
+        Every call starts a fresh pass over the cached DeltaBatch, so
+        streams can be iterated repeatedly or concurrently.
+        """
+        batch = self._stream_batch()
+        for i in range(len(batch)):
+            yield batch.delta(i)
 
     def __next__(self) -> Delta:
         """
-        Compute and return the next Delta.
+        Return the next Delta of the stream.
+
+        ``next(stream)`` walks one shared pass over the stream, separate
+        from any ``for`` loop over it.
 
         Returns:
             The next Delta object in the stream.
@@ -206,55 +350,46 @@ class DeltaStream:
         Raises:
             StopIteration: When all frames have been processed.
         """
-        t, h, w = self.voxel_size
+        if self._cursor is None:
+            self._cursor = iter(self)
+        return next(self._cursor)
 
-        if self._current_index + t > self.frame_count:
-            raise StopIteration
+    def _stream_batch(self) -> DeltaBatch:
+        """Return the stream's DeltaBatch, computing it on first use."""
+        if self._batch is None:
+            self._batch = self.to_batch()
+        return self._batch
 
-        # Extract current voxel window
-        window = self._frames[self._current_index : self._current_index + t]
-
-        # Binarize and encode
-        curr_voxels = self._encode_voxels(window)
+    def to_batch(self) -> DeltaBatch:
+        """
+        Compute every delta of the stream as a DeltaBatch.
 
-        if self._prev_voxels is None:
-            self._prev_voxels = curr_voxels
-            self._current_index += t
-            # Return initial frame with zero delta
-            return Delta(
-                frame_index=self._current_index - t,
-                voxel_index=(0, 0),
-                delta_word=0,
-                motif=MotifType.STATIC,
-                magnitude=0.0,
-                timestamp_ms=(self._current_index - t) / self.fps * 1000,
-            )
+        Same deltas as iterating the stream, without creating a Delta
+        object per window. The first entry is the initial window with a
+        zero delta.
 
-        # Compute XOR delta
-        delta_word = int(curr_voxels[0, 0] ^ self._prev_voxels[0, 0])
+        Returns:
+            DeltaBatch with one entry per whole temporal window.
+        """
+        t = self.voxel_size[0]
+        words = _encode_windows(self._frames, t)
 
-        # Classify motif
-        motif = self._classify_motif(delta_word)
-        magnitude = bin(delta_word).count("1") / 64.0
+        delta_word = np.zeros_like(words)
+        np.bitwise_xor(words[1:], words[:-1], out=delta_word[1:])
+        bit_count = _popcount64(delta_word)
+        frame_index = np.arange(len(words), dtype=np.int64) * t
 
-        # Create Delta object
-        delta = Delta(
-            frame_index=self._current_index,
-            voxel_index=(0, 0),
+        return DeltaBatch(
+            frame_index=frame_index,
             delta_word=delta_word,
-            motif=motif,
-            magnitude=magnitude,
-            timestamp_ms=self._current_index / self.fps * 1000,
+            bit_count=bit_count,
+            motif=self._classify_batch(delta_word, bit_count),
+            timestamp_ms=frame_index / self.fps * 1000,
         )
 
-        self._prev_voxels = curr_voxels
-        self._current_index += t
-
-        return delta
-
     def __len__(self) -> int:
-        """Return the number of delta computations available."""
-        return max(0, (self.frame_count - self.voxel_size[0]) // self.voxel_size[0])
+        """Return the number of deltas the stream yields."""
+        return self.frame_count // self.voxel_size[0]
 
     def _encode_voxels(self, window: np.ndarray) -> np.ndarray:
         """
@@ -267,14 +402,7 @@ class DeltaStream:
             Array of 64-bit encoded voxel words.
         """
         # Simplified encoding: binarize and pack into 64-bit words
-        threshold = np.mean(window)
-        binary = (window > threshold).astype(np.uint8)
-
-        # Pack into 64-bit word (simplified)
-        packed = np.packbits(binary.flatten()[:64])
-        word = int.from_bytes(packed, byteorder="little")
-
-        return np.array([[word]], dtype=np.uint64)
+        return _encode_windows(window, len(window)).reshape(1, 1)
 
     def _classify_motif(self, delta_word: int) -> MotifType:
         """
@@ -289,7 +417,7 @@ class DeltaStream:
         if delta_word == 0:
             return MotifType.STATIC
 
-        bit_count = bin(delta_word).count("1")
+        bit_count = _popcount(delta_word)
 
         # Simple heuristic classification
         if bit_count < 4:
@@ -308,6 +436,37 @@ class DeltaStream:
         else:
             return MotifType.EXPANSION
 
+    def _classify_batch(
+        self, delta_words: np.ndarray, bit_counts: np.ndarray
+    ) -> np.ndarray:
+        """
+        Classify many delta words at once; same rules as _classify_motif.
+
+        Args:
+            delta_words: uint64 array of XOR deltas.
+            bit_counts: Set-bit count of each word.
+
+        Returns:
+            int64 array of MotifType values.
+        """
+        upper_half = delta_words >> np.uint64(32)
+        lower_half = delta_words & np.uint64(0xFFFFFFFF)
+        directional = np.where(
+            upper_half > lower_half,
+            MotifType.VERTICAL_MOTION.value,
+            MotifType.HORIZONTAL_MOTION.value,
+        )
+        return np.select(
+            [delta_words == 0, bit_counts < 4, bit_counts < 16, bit_counts < 32],
+            [
+                MotifType.STATIC.value,
+                MotifType.NOISE.value,
+                directional,
+                MotifType.DIAGONAL_MOTION.value,
+            ],
+            default=MotifType.EXPANSION.value,
+        ).astype(np.int64)
+
     def filter_motif(self, motif: MotifType) -> Iterator[Delta]:
         """
         Iterate over deltas matching a specific motif.
@@ -322,9 +481,10 @@ class DeltaStream:
             >>> for d in stream.filter_motif(MotifType.HORIZONTAL_MOTION):
             ...     print(f"Motion at frame {d.frame_index}")
         """
-        for delta in self:
-            if delta.motif == motif:
-                yield delta
+        if not isinstance(motif, MotifType):
+            return
+        batch = self._stream_batch()
+        yield from batch.select(batch.motif == motif.value).to_deltas()
 
     def events_only(self) -> Iterator[Delta]:
         """
@@ -333,6 +493,5 @@ class DeltaStream:
         Yields:
             Delta objects where is_event is True.
         """
-        for delta in self:
-            if delta.is_event:
-                yield delta
+        batch = self._stream_batch()
+        yield from batch.select(batch.is_event).to_deltas()
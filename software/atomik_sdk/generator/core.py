@@ -7,6 +7,7 @@ and multi-language code generation.
 
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,20 @@ from .code_emitter import CodeEmitter, GenerationResult, MultiLanguageEmitter
 from .namespace_mapper import NamespaceMapper, NamespaceMapping
 from .schema_validator import SchemaValidator, ValidationResult
 
+# The generator stays importable without the pipeline package, so it keeps
+# its own orjson fallback rather than importing pipeline.context.jsonio
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Validation results keyed on the validator's type and specification path
+# plus the SHA-256 of the schema file's bytes, shared across engine
+# instances so reloading an unchanged schema skips re-validation. Least
+# recently used entries are evicted past the limit.
+_VALIDATION_CACHE_SIZE = 128
+_validation_cache: dict[tuple[type, str, str], ValidationResult] = {}
+
 
 class GeneratorConfig:
     """Configuration for the generator."""
@@ -87,12 +102,13 @@ class GeneratorEngine:
             FileNotFoundError: If schema file doesn't exist
             ValueError: If schema JSON is invalid
         """
+        self.unload_schema()
         self.schema_path = Path(schema_path)
 
-        # Load JSON
+        # Load JSON (orjson.JSONDecodeError subclasses json.JSONDecodeError)
         try:
-            with open(self.schema_path, encoding='utf-8') as f:
-                self.schema = json.load(f)
+            data = self.schema_path.read_bytes()
+            self.schema = json_loads(data)
         except FileNotFoundError:
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
         except json.JSONDecodeError as e:
@@ -103,22 +119,80 @@ class GeneratorEngine:
 
         # Validate if enabled
         if self.config.validate_schemas:
-            result = self.validator.validate(self.schema)
+            spec_path = getattr(self.validator, "schema_spec_path", None)
+            if spec_path is None:
+                # No specification to key on, so the verdict is not shared
+                return self._report_validation(self.validator.validate(self.schema))
+            key = (
+                type(self.validator),
+                str(Path(spec_path).resolve()),
+                hashlib.sha256(data).hexdigest(),
+            )
+            cached = _validation_cache.pop(key, None)
+            if cached is None:
+                cached = self.validator.validate(self.schema)
+                if len(_validation_cache) >= _VALIDATION_CACHE_SIZE:
+                    del _validation_cache[next(iter(_validation_cache))]
+            # Reinserting keeps the dict in least-recently-used order
+            _validation_cache[key] = cached
+            return self._report_validation(ValidationResult(
+                cached.valid, list(cached.errors), list(cached.warnings)
+            ))
 
-            if result.errors and self.config.verbose:
-                print("Validation errors:")
-                for error in result.errors:
-                    print(f"  - {error}")
+        return ValidationResult(valid=True)
 
-            if result.warnings and self.config.verbose:
-                print("Validation warnings:")
-                for warning in result.warnings:
-                    print(f"  - {warning}")
+    def load_schema_dict(
+        self,
+        schema: dict[str, Any],
+        schema_path: str | Path | None = None,
+    ) -> ValidationResult:
+        """
+        Load an already-parsed schema and optionally validate it.
 
-            return result
+        Skips the file read and JSON parse of load_schema(), so a schema
+        parsed once can be shared across engine instances.
+
+        Args:
+            schema: Parsed schema dictionary
+            schema_path: Source path of the schema, if known
+
+        Returns:
+            ValidationResult with validity status
+        """
+        self.unload_schema()
+        self.schema = schema
+        self.schema_path = Path(schema_path) if schema_path is not None else None
+
+        if self.config.validate_schemas:
+            return self._report_validation(self.validator.validate(schema))
 
         return ValidationResult(valid=True)
 
+    def unload_schema(self) -> None:
+        """
+        Drop the loaded schema and its derived namespace.
+
+        Registered generators are kept, so one engine can be reused
+        across several schemas.
+        """
+        self.schema = None
+        self.schema_path = None
+        self.namespace = None
+
+    def _report_validation(self, result: ValidationResult) -> ValidationResult:
+        """Print validation errors and warnings in verbose mode."""
+        if result.errors and self.config.verbose:
+            print("Validation errors:")
+            for error in result.errors:
+                print(f"  - {error}")
+
+        if result.warnings and self.config.verbose:
+            print("Validation warnings:")
+            for warning in result.warnings:
+                print(f"  - {warning}")
+
+        return result
+
     def extract_metadata(self) -> NamespaceMapping:
         """
         Extract catalogue metadata and generate namespace mapping.
@@ -12,6 +12,7 @@ Every function is a pure helper (no class state).
 from __future__ import annotations
 
 import os
+import re
 import shutil
 import subprocess
 import sys
@@ -109,11 +110,34 @@ def find_tool(name: str, config_path: str | None = None) -> str | None:
 # Board detection
 # ---------------------------------------------------------------------------
 
+# Only the head of a scan tool's stdout is inspected; verbose tools can
+# print far more than is needed to spot the board signature.
+_SCAN_MAX_BYTES = 8192
+
+_CABLE_FOUND_RE = re.compile(rb"cable found", re.IGNORECASE)
+_GW1NR_RE = re.compile(rb"gw1nr|tangnano9k", re.IGNORECASE)
+
+
+def _scan_stdout(cmd: list[str]) -> bytes:
+    """Run a board-scan *cmd* and return the head of its raw stdout.
+
+    stderr is discarded and stdout is left undecoded; callers match it
+    with pre-compiled byte patterns.
+    """
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        timeout=10, check=False,
+    )
+    return result.stdout[:_SCAN_MAX_BYTES]
+
+
 def detect_board() -> str | None:
     """Detect a connected Tang Nano 9K (or similar Gowin) FPGA board.
 
     Tries ``programmer_cli --scan-cables`` first, then
-    ``openFPGALoader --detect`` as fallback.
+    ``openFPGALoader --detect`` as fallback.  The probes share one JTAG
+    cable, so they run one after the other, never concurrently.
 
     Returns a board identifier string (e.g. ``"tangnano9k"``) or
     ``None`` if no board is found.
@@ -121,11 +145,7 @@ def detect_board() -> str | None:
     prog = find_tool("programmer_cli")
     if prog:
         try:
-            result = subprocess.run(
-                [prog, "--scan-cables"],
-                capture_output=True, text=True, timeout=10,
-            )
-            if "cable found" in result.stdout.lower():
+            if _CABLE_FOUND_RE.search(_scan_stdout([prog, "--scan-cables"])):
                 return "tangnano9k"
         except (subprocess.TimeoutExpired, OSError):
             pass
@@ -133,12 +153,7 @@ def detect_board() -> str | None:
     openfpga = find_tool("openFPGALoader")
     if openfpga:
         try:
-            result = subprocess.run(
-                [openfpga, "--detect"],
-                capture_output=True, text=True, timeout=10,
-            )
-            stdout_lower = result.stdout.lower()
-            if "gw1nr" in stdout_lower or "tangnano9k" in stdout_lower:
+            if _GW1NR_RE.search(_scan_stdout([openfpga, "--detect"])):
                 return "tangnano9k"
         except (subprocess.TimeoutExpired, OSError):
             pass
@@ -150,10 +165,12 @@ def detect_board() -> str | None:
 # Serial-port detection
 # ---------------------------------------------------------------------------
 
-_FTDI_VID = 0x0403
-_FTDI_PID = 0x6010
+# Known (VID, PID) pairs of the board's USB-serial bridge.
+_BOARD_VID_PIDS: frozenset[tuple[int, int]] = frozenset({
+    (0x0403, 0x6010),  # FTDI FT2232
+})
 
-_KEYWORD_HINTS = ("tang", "gowin", "ft2232")
+_KEYWORD_RE = re.compile(r"tang|gowin|ft2232", re.IGNORECASE)
 
 
 def detect_com_port() -> str | None:
@@ -167,14 +184,15 @@ def detect_com_port() -> str | None:
     except ImportError:
         return None
 
-    for port in serial.tools.list_ports.comports():
-        if port.vid == _FTDI_VID and port.pid == _FTDI_PID:
+    ports = serial.tools.list_ports.comports()
+
+    for port in ports:
+        if (port.vid, port.pid) in _BOARD_VID_PIDS:
             return port.device
 
     # Keyword fallback
-    for port in serial.tools.list_ports.comports():
-        desc = (port.description or "").lower()
-        if any(kw in desc for kw in _KEYWORD_HINTS):
+    for port in ports:
+        if _KEYWORD_RE.search(port.description or ""):
             return port.device
 
     return None
@@ -10,9 +10,21 @@ by mapping common delta patterns to compact 4-bit identifiers.
 
 from __future__ import annotations
 
-import math
-from collections import Counter
+from collections.abc import Sequence
 from enum import IntEnum
+from functools import lru_cache
+
+import numpy as np
+
+# Both accept any integer-like value, including numpy.uint64 words
+if hasattr(int, "bit_count"):  # Python 3.10+
+    def _popcount(x: int) -> int:
+        """Number of set bits in *x*."""
+        return int(x).bit_count()
+else:
+    def _popcount(x: int) -> int:
+        """Number of set bits in *x*."""
+        return bin(x).count("1")
 
 
 class Motif(IntEnum):
@@ -86,13 +98,25 @@ MOTIF_SIGNATURES: dict[Motif, list[int]] = {
     ],
 }
 
+# (motif, signature, set bits) in MOTIF_SIGNATURES order, computed at import
+_SIGNATURE_BITS = [
+    (motif, sig, _popcount(sig))
+    for motif, signatures in MOTIF_SIGNATURES.items()
+    for sig in signatures
+]
+
+# classify_delta's result for each exact signature word, filled in below
+_SIGNATURE_MOTIFS: dict[int, Motif] = {}
 
+
+@lru_cache(maxsize=1 << 16)
 def classify_delta(delta_word: int) -> Motif:
     """
     Classify a 64-bit delta word into a motif category.
 
     The classification uses a combination of bit population count,
     bit position analysis, and pattern matching against known signatures.
+    Results are memoized, since video deltas repeat heavily.
 
     Args:
         delta_word: The 64-bit XOR result to classify.
@@ -107,8 +131,13 @@ def classify_delta(delta_word: int) -> Motif:
     if delta_word == 0:
         return Motif.STATIC
 
+    # Exact signature words skip the scan
+    motif = _SIGNATURE_MOTIFS.get(delta_word)
+    if motif is not None:
+        return motif
+
     # Count bits first for density-based classification
-    bit_count = bin(delta_word).count("1")
+    bit_count = _popcount(delta_word)
 
     # Very sparse patterns are noise
     if bit_count <= 2:
@@ -120,13 +149,11 @@ def classify_delta(delta_word: int) -> Motif:
         return Motif.EXPANSION
 
     # Check against known signatures for medium-density patterns
-    for motif, signatures in MOTIF_SIGNATURES.items():
-        for sig in signatures:
-            # Allow for partial matches (>70% overlap)
-            overlap = bin(delta_word & sig).count("1")
-            sig_bits = bin(sig).count("1")
-            if sig_bits > 0 and overlap / sig_bits > 0.7:
-                return motif
+    for motif, sig, sig_bits in _SIGNATURE_BITS:
+        # Allow for partial matches (>70% overlap)
+        overlap = _popcount(delta_word & sig)
+        if sig_bits > 0 and overlap / sig_bits > 0.7:
+            return motif
 
     # Fallback to heuristic classification for remaining patterns
 
@@ -134,8 +161,8 @@ def classify_delta(delta_word: int) -> Motif:
     upper_32 = (delta_word >> 32) & 0xFFFFFFFF
     lower_32 = delta_word & 0xFFFFFFFF
 
-    upper_bits = bin(upper_32).count("1")
-    lower_bits = bin(lower_32).count("1")
+    upper_bits = _popcount(upper_32)
+    lower_bits = _popcount(lower_32)
 
     if abs(upper_bits - lower_bits) > 10:
         return Motif.VERTICAL_MOTION
@@ -144,7 +171,7 @@ def classify_delta(delta_word: int) -> Motif:
     byte_counts = []
     for i in range(8):
         byte_val = (delta_word >> (i * 8)) & 0xFF
-        byte_counts.append(bin(byte_val).count("1"))
+        byte_counts.append(_popcount(byte_val))
 
     # High variance in byte population suggests horizontal motion
     mean_count = sum(byte_counts) / 8
@@ -159,6 +186,16 @@ def classify_delta(delta_word: int) -> Motif:
         return Motif.NOISE
 
 
+# Cached through the full rules rather than taken from MOTIF_SIGNATURES:
+# density checks and earlier signatures can win (CONTRACTION's own
+# signature classifies as HORIZONTAL_MOTION)
+_SIGNATURE_MOTIFS.update({sig: classify_delta(sig) for _, sig, _ in _SIGNATURE_BITS})
+
+
+# Motif members indexed by their 4-bit code
+_MOTIF_TABLE: tuple[Motif, ...] = tuple(Motif(i) for i in range(16))
+
+
 def motif_to_bytes(motif: Motif) -> bytes:
     """
     Encode a motif as a single byte.
@@ -188,8 +225,66 @@ def bytes_to_motif(data: bytes) -> Motif:
     if len(data) < 1:
         raise ValueError("Empty byte sequence")
 
-    value = data[0] & 0x0F  # Only use lower 4 bits
-    return Motif(value)
+    return _MOTIF_TABLE[data[0] & 0x0F]  # Only use lower 4 bits
+
+
+def bytes_to_motifs(data: bytes) -> np.ndarray:
+    """
+    Decode one motif code per byte.
+
+    Args:
+        data: Byte data to decode, as written by :func:`motif_to_bytes`.
+
+    Returns:
+        ``uint8`` array of motif codes, upper bits masked off.
+    """
+    return np.frombuffer(data, dtype=np.uint8) & 0x0F
+
+
+def pack_motifs(motifs: Sequence[Motif] | np.ndarray) -> bytes:
+    """
+    Pack motifs two per byte, low nibble first.
+
+    Args:
+        motifs: Motifs to encode, as a list or an integer array of codes.
+
+    Returns:
+        ``ceil(len(motifs) / 2)`` bytes; an odd count leaves the final
+        high nibble zero.
+    """
+    if isinstance(motifs, np.ndarray):
+        codes = motifs.astype(np.uint8)
+    else:
+        codes = np.fromiter(motifs, dtype=np.uint8, count=len(motifs))
+    if len(codes) % 2:
+        codes = np.append(codes, np.uint8(0))
+    return ((codes[0::2] & 0x0F) | ((codes[1::2] & 0x0F) << 4)).tobytes()
+
+
+def unpack_motifs(data: bytes, n: int) -> list[Motif]:
+    """
+    Decode *n* motifs packed by :func:`pack_motifs`.
+
+    Args:
+        data: Packed motif bytes.
+        n: Number of motifs to decode.
+
+    Returns:
+        The decoded motifs.
+
+    Raises:
+        ValueError: If *n* is negative or *data* holds fewer than *n* motifs.
+    """
+    if n < 0:
+        raise ValueError(f"motif count must be non-negative, not {n}")
+    if n > 2 * len(data):
+        raise ValueError(f"{len(data)} bytes hold at most {2 * len(data)} motifs, not {n}")
+
+    packed = np.frombuffer(data, dtype=np.uint8)
+    codes = np.empty(2 * len(packed), dtype=np.uint8)
+    codes[0::2] = packed & 0x0F
+    codes[1::2] = packed >> 4
+    return [_MOTIF_TABLE[c] for c in codes[:n].tolist()]
 
 
 def get_motif_name(motif: Motif) -> str:
@@ -223,17 +318,20 @@ def get_motif_name(motif: Motif) -> str:
     return names.get(motif, "Unknown")
 
 
-def get_compression_stats(motifs: list[Motif]) -> dict[str, float]:
+def get_compression_stats(
+    motifs: Sequence[Motif] | np.ndarray,
+) -> dict[str, float]:
     """
     Calculate compression statistics for a sequence of motifs.
 
     Args:
-        motifs: List of classified motifs.
+        motifs: Classified motifs, as a list or an integer array of
+            motif codes (e.g. ``DeltaBatch.motif``).
 
     Returns:
         Dictionary with compression statistics.
     """
-    if not motifs:
+    if len(motifs) == 0:
         return {"compression_ratio": 0.0, "entropy": 0.0}
 
     # Original: 64 bits per delta
@@ -243,19 +341,24 @@ def get_compression_stats(motifs: list[Motif]) -> dict[str, float]:
 
     compression_ratio = original_bits / compressed_bits if compressed_bits > 0 else 0
 
+    # Histogram of motif codes in one pass
+    if isinstance(motifs, np.ndarray):
+        codes = motifs.astype(np.int64, copy=False)
+    else:
+        codes = np.fromiter(motifs, dtype=np.int64, count=len(motifs))
+    counts = np.bincount(codes, minlength=len(Motif))
+
     # Calculate entropy
-    counts = Counter(motifs)
-    total = len(motifs)
-    entropy = 0.0
+    p = counts[counts > 0] / len(codes)
+    entropy = float((p * np.log2(1 / p)).sum())
 
-    for count in counts.values():
-        if count > 0:
-            p = count / total
-            entropy -= p * math.log2(p)
+    # Ties go to the motif seen first
+    top = np.flatnonzero(counts == counts.max())
+    dominant = codes[np.isin(codes, top).argmax()] if top.size > 1 else top[0]
 
     return {
         "compression_ratio": compression_ratio,
         "entropy": entropy,
-        "unique_motifs": len(counts),
-        "dominant_motif": counts.most_common(1)[0][0].name if counts else None,
+        "unique_motifs": int(np.count_nonzero(counts)),
+        "dominant_motif": Motif(int(dominant)).name,
     }
@@ -12,6 +12,8 @@ import json
 from dataclasses import dataclass
 from pathlib import Path
 
+from .motifs import _popcount
+
 
 @dataclass
 class MatchResult:
@@ -39,8 +41,8 @@ class Pattern:
         masked_delta = delta & self.mask
         masked_sig = self.signature & self.mask
 
-        matching_bits = bin(~(masked_delta ^ masked_sig) & self.mask).count("1")
-        total_bits = bin(self.mask).count("1")
+        matching_bits = _popcount(~(masked_delta ^ masked_sig) & self.mask)
+        total_bits = _popcount(self.mask)
 
         confidence = matching_bits / total_bits if total_bits > 0 else 0.0
 
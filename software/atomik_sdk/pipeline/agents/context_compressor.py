@@ -12,6 +12,27 @@ import re
 from dataclasses import dataclass
 from typing import Any
 
+# Line prefixes kept by the minimal skeleton (class/function signatures, imports)
+_SKELETON_PREFIXES = (
+    "class ", "def ", "fn ", "struct ", "enum ",
+    "module ", "interface ", "function ", "pub ",
+    "import ", "from ", "use ", "#include",
+)
+
+# String literals of 80+ characters, shortened by _truncate_examples
+_LONG_STRING_RE = re.compile(r'"[^"]{80,}"')
+
+# Runs of two or more blank lines
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+
+
+def _truncate_literal(m: re.Match) -> str:
+    """Shorten a matched string literal to its first 40 characters."""
+    s = m.group(0)
+    if len(s) > 80:
+        return s[:40] + '..."'
+    return s
+
 
 @dataclass
 class CompressionResult:
@@ -159,7 +180,7 @@ class ContextCompressor:
                 continue
 
             # Skip comment-only lines
-            if stripped.startswith("#") or stripped.startswith("//"):
+            if stripped.startswith(("#", "//")):
                 continue
 
             # Keep non-empty lines
@@ -171,30 +192,18 @@ class ContextCompressor:
     def _truncate_examples(self, content: str) -> str:
         """Truncate long string literals and examples."""
         # Truncate long strings (>80 chars) to first 40 + "..."
-        def truncate_match(m: re.Match) -> str:
-            s = m.group(0)
-            if len(s) > 80:
-                return s[:40] + '..."'
-            return s
-
-        return re.sub(r'"[^"]{80,}"', truncate_match, content)
+        return _LONG_STRING_RE.sub(_truncate_literal, content)
 
     def _compress_whitespace(self, content: str) -> str:
         """Collapse multiple blank lines to single."""
-        return re.sub(r"\n{3,}", "\n\n", content)
+        return _BLANK_RUN_RE.sub("\n\n", content)
 
     def _minimal_skeleton(self, content: str) -> str:
         """Extract only structural elements (class/function signatures)."""
-        lines = content.split("\n")
-        result = []
-        for line in lines:
-            stripped = line.strip()
-            if any(stripped.startswith(kw) for kw in (
-                "class ", "def ", "fn ", "struct ", "enum ",
-                "module ", "interface ", "function ", "pub ",
-                "import ", "from ", "use ", "#include",
-            )):
-                result.append(line)
+        result = [
+            line for line in content.split("\n")
+            if line.strip().startswith(_SKELETON_PREFIXES)
+        ]
         return "\n".join(result) if result else content[:200]
 
     def _technique_for_pressure(self, pressure: float) -> str:
@@ -7,6 +7,7 @@ Falls back to LLM diagnosis for unknown errors.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Any
 
@@ -50,6 +51,28 @@ KNOWN_FIXES = {
 }
 
 
+def _compile_fix_patterns(
+    fixes: dict[str, dict[str, Any]],
+) -> dict[str, tuple[re.Pattern[str], list[tuple[str, dict[str, Any]]]]]:
+    """Group fixes by language with one alternation regex per language.
+
+    The regex answers "does any known fix apply?" in a single scan; the
+    ordered candidate list then picks the first matching fix, preserving
+    the precedence of ``fixes``.
+    """
+    by_language: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+    for fix_name, fix_info in fixes.items():
+        for language in fix_info["languages"]:
+            by_language.setdefault(language, []).append((fix_name, fix_info))
+    return {
+        language: (
+            re.compile("|".join(re.escape(info["pattern"]) for _, info in candidates)),
+            candidates,
+        )
+        for language, candidates in by_language.items()
+    }
+
+
 class SelfCorrector:
     """
     Attempts to fix known error classes without LLM assistance.
@@ -61,6 +84,7 @@ class SelfCorrector:
     def __init__(self, max_retries: int = 2):
         self.max_retries = max_retries
         self._attempts: list[dict[str, Any]] = []
+        self._patterns = _compile_fix_patterns(KNOWN_FIXES)
 
     def try_fix(
         self, language: str, check_type: str, errors: list[str]
@@ -76,26 +100,28 @@ class SelfCorrector:
         Returns:
             CorrectionResult indicating whether a fix was applied.
         """
-        for error_msg in errors:
-            error_lower = error_msg.lower()
-
-            for fix_name, fix_info in KNOWN_FIXES.items():
-                if (
-                    fix_info["pattern"] in error_lower
-                    and language in fix_info["languages"]
-                ):
-                    self._attempts.append({
-                        "language": language,
-                        "error": error_msg,
-                        "fix": fix_name,
-                        "applied": True,
-                    })
-                    return CorrectionResult(
-                        applied=True,
-                        fix_type=fix_info["fix_type"],
-                        description=f"Applied {fix_name} fix for {language}",
-                        tokens_consumed=0,
-                    )
+        compiled = self._patterns.get(language)
+        if compiled is not None:
+            pattern, candidates = compiled
+            for error_msg in errors:
+                error_lower = error_msg.lower()
+                if not pattern.search(error_lower):
+                    continue
+
+                for fix_name, fix_info in candidates:
+                    if fix_info["pattern"] in error_lower:
+                        self._attempts.append({
+                            "language": language,
+                            "error": error_msg,
+                            "fix": fix_name,
+                            "applied": True,
+                        })
+                        return CorrectionResult(
+                            applied=True,
+                            fix_type=fix_info["fix_type"],
+                            description=f"Applied {fix_name} fix for {language}",
+                            tokens_consumed=0,
+                        )
 
         # Unknown error -- would need LLM escalation
         self._attempts.append({
@@ -154,11 +154,21 @@ class MetricsAnalyzer:
         """Compute standard deviation of the last N values."""
         w = window or self.window
         recent = values[-w:]
-        if len(recent) < 2:
+        n = len(recent)
+        if n < 2:
             return 0.0
-        mean = sum(recent) / len(recent)
-        variance = sum((x - mean) ** 2 for x in recent) / (len(recent) - 1)
-        return math.sqrt(variance)
+        # Single pass over the window: var = (S2 - S1^2 / n) / (n - 1).
+        # Sums are taken relative to the first sample so the subtraction
+        # does not cancel catastrophically for large, tightly clustered values.
+        shift = recent[0]
+        s1 = 0.0
+        s2 = 0.0
+        for x in recent:
+            d = x - shift
+            s1 += d
+            s2 += d * d
+        variance = (s2 - s1 * s1 / n) / (n - 1)
+        return math.sqrt(max(variance, 0.0))
 
     def _compute_trend(self, name: str, values: list[float]) -> MetricTrend:
         """Compute trend for a single metric."""
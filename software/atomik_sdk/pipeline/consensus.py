@@ -89,13 +89,23 @@ class ConsensusResolver:
                 result.merged_output = next(iter(agent_outputs.values()))
             return result
 
-        # Collect all unique field paths across agents
-        all_fields = self._collect_all_fields(agent_outputs)
+        # Flatten each output once; the union of keys is every field path
+        flat_outputs = {
+            agent_name: self._flatten_values(output)
+            for agent_name, output in agent_outputs.items()
+        }
+        all_fields: set[str] = set()
+        for flat in flat_outputs.values():
+            all_fields.update(flat)
 
         for field_path in sorted(all_fields):
             values: dict[str, Any] = {}
-            for agent_name, output in agent_outputs.items():
-                val = self._get_nested(output, field_path)
+            for agent_name, flat in flat_outputs.items():
+                if field_path in flat:
+                    val = flat[field_path]
+                else:
+                    # Path may name a subtree of this agent's output
+                    val = self._get_nested(agent_outputs[agent_name], field_path)
                 if val is not None:
                     values[agent_name] = val
 
@@ -217,6 +227,23 @@ class ConsensusResolver:
         elif prefix:
             paths.add(prefix)
 
+    def _flatten_values(self, obj: Any) -> dict[str, Any]:
+        """Map each dotted leaf path of *obj* to its value."""
+        flat: dict[str, Any] = {}
+        stack: list[tuple[str, Any]] = [("", obj)]
+        while stack:
+            prefix, node = stack.pop()
+            if isinstance(node, dict):
+                for key, val in node.items():
+                    path = f"{prefix}.{key}" if prefix else key
+                    if isinstance(val, dict):
+                        stack.append((path, val))
+                    else:
+                        flat[path] = val
+            elif prefix:
+                flat[prefix] = node
+        return flat
+
     def _get_nested(self, obj: dict[str, Any], path: str) -> Any:
         """Get a value from a nested dict using dotted path."""
         parts = path.split(".")
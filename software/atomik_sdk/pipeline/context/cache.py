@@ -9,9 +9,37 @@ from __future__ import annotations
 
 import hashlib
 import json
+import pickle
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# hashlib.file_digest (Python 3.11+) reads into a reusable buffer and
+# hashes without a Python-level loop; older interpreters use a chunked read.
+_HAS_FILE_DIGEST = hasattr(hashlib, "file_digest")
+
+# Artifact file suffix per serializer.
+_SERIALIZERS = {"pickle": ".pkl", "json": ".json"}
+
+
+def _content_digest(content: str | bytes) -> str:
+    """SHA-256 hex digest of *content*."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+@lru_cache(maxsize=512)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    """SHA-256 hex digest of a file, memoized on its path, mtime and size."""
+    with open(path, "rb") as f:
+        if _HAS_FILE_DIGEST:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(65536), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
 
 class ArtifactCache:
     """
@@ -19,10 +47,25 @@ class ArtifactCache:
 
     Uses content hashes for cache keys. When a schema's content hash
     changes, all cached artifacts for that schema are invalidated.
+
+    Artifacts are stored as JSON by default. Pass ``serializer="pickle"``
+    to store them with pickle (protocol 5), which preserves Python types
+    and skips the dict-to-text round trip; only point a pickle cache at
+    directories you trust. A JSON cache never unpickles anything, and a
+    pickle entry it finds is treated as a miss.
     """
 
-    def __init__(self, cache_dir: str | Path = ".atomik/cache"):
+    def __init__(
+        self,
+        cache_dir: str | Path = ".atomik/cache",
+        serializer: str = "json",
+    ):
+        if serializer not in _SERIALIZERS:
+            raise ValueError(
+                f"Unknown serializer {serializer!r}; expected one of {sorted(_SERIALIZERS)}"
+            )
         self.cache_dir = Path(cache_dir)
+        self.serializer = serializer
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._index: dict[str, dict[str, Any]] = {}
         self._load_index()
@@ -45,18 +88,18 @@ class ArtifactCache:
     @staticmethod
     def content_hash(content: str | bytes) -> str:
         """Compute SHA-256 hash of content."""
-        if isinstance(content, str):
-            content = content.encode("utf-8")
-        return hashlib.sha256(content).hexdigest()
+        return _content_digest(content)
 
     @staticmethod
     def file_hash(path: str | Path) -> str:
-        """Compute SHA-256 hash of a file."""
-        h = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
+        """Compute SHA-256 hash of a file.
+
+        Memoized on the file's resolved path, mtime and size, so an
+        unchanged file is only read and hashed once.
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        return _file_digest(str(path), stat.st_mtime_ns, stat.st_size)
 
     def get(self, schema_name: str, key: str) -> dict[str, Any] | None:
         """
@@ -76,10 +119,16 @@ class ArtifactCache:
 
         # Load artifact data from file
         artifact_path = self.cache_dir / entry.get("file", "")
-        if artifact_path.exists():
-            with open(artifact_path, encoding="utf-8") as f:
-                return json.load(f)
-        return None
+        if not artifact_path.exists():
+            return None
+        # The index is editable on disk, so its contents never choose
+        # to unpickle; only a cache created with pickle does
+        if artifact_path.suffix == _SERIALIZERS["pickle"]:
+            if self.serializer != "pickle":
+                return None
+            return pickle.loads(artifact_path.read_bytes())
+        with open(artifact_path, encoding="utf-8") as f:
+            return json.load(f)
 
     def put(
         self,
@@ -100,11 +149,21 @@ class ArtifactCache:
         if schema_name not in self._index:
             self._index[schema_name] = {}
 
-        filename = f"{schema_name}_{key}.json"
+        previous = self._index[schema_name].get(key)
+        filename = f"{schema_name}_{key}{_SERIALIZERS[self.serializer]}"
         artifact_path = self.cache_dir / filename
 
-        with open(artifact_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        if self.serializer == "pickle":
+            artifact_path.write_bytes(pickle.dumps(data, protocol=5))
+        else:
+            with open(artifact_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+
+        # Drop a stale artifact left by a cache using the other serializer
+        if previous and previous.get("file") != filename:
+            stale = self.cache_dir / previous["file"]
+            if stale.exists():
+                stale.unlink()
 
         self._index[schema_name][key] = {
             "file": filename,
@@ -8,12 +8,13 @@ cold-start resumption and differential regeneration.
 
 from __future__ import annotations
 
-import json
 import shutil
 import time
 from pathlib import Path
 from typing import Any
 
+from .jsonio import read_json, write_json
+
 
 class Checkpoint:
     """
@@ -39,8 +40,7 @@ class Checkpoint:
         """Load checkpoint from disk."""
         path = self._checkpoint_path()
         if path.exists():
-            with open(path, encoding="utf-8") as f:
-                return json.load(f)
+            return read_json(path)
         return {
             "version": "2.0",
             "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
@@ -63,8 +63,7 @@ class Checkpoint:
 
         # Atomic write via temp file
         tmp = path.with_suffix(".tmp")
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(self._state, f, indent=2)
+        write_json(tmp, self._state)
         tmp.replace(path)
 
     def get_schema_hash(self, schema_name: str) -> str | None:
@@ -0,0 +1,48 @@
+"""
+Context JSON I/O
+
+Shared JSON encoding for manifests and checkpoints. Uses orjson when
+it is installed and falls back to the standard library otherwise.
+Both paths emit the same layout (2-space indent, sorted keys, UTF-8)
+so files written by either are interchangeable and re-saving an
+unchanged state produces identical bytes.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize *obj* to indented, key-sorted UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON bytes or text."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path: str | Path, obj: Any) -> None:
+    """Write *obj* to *path* as JSON."""
+    Path(path).write_bytes(dumps(obj))
+
+
+def read_json(path: str | Path) -> Any:
+    """Read a JSON document from *path*."""
+    return loads(Path(path).read_bytes())
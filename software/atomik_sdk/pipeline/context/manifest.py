@@ -7,12 +7,13 @@ sessions. Designed for <2K token cold-start loading.
 
 from __future__ import annotations
 
-import json
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .jsonio import read_json, write_json
+
 
 @dataclass
 class ArtifactEntry:
@@ -155,15 +156,13 @@ class PipelineManifest:
         """Persist manifest to disk."""
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        write_json(path, self.to_dict())
 
     @classmethod
     def load(cls, path: str | Path) -> PipelineManifest:
         """Load manifest from disk."""
         path = Path(path)
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(path)
 
         manifest = cls()
         ps = data.get("project_state", {})
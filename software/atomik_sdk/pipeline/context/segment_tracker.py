@@ -9,10 +9,13 @@ affinity, and access frequency.
 
 from __future__ import annotations
 
+import math
 import time
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 
 @dataclass
 class ContextSegment:
@@ -141,17 +144,38 @@ class SegmentTracker:
 
         Returns segments sorted by relevance (highest first).
         """
-        for seg in self._segments.values():
-            seg.relevance_score = self._compute_relevance(
-                seg, current_task_type
-            )
+        segments = list(self._segments.values())
+        n = len(segments)
+        if n == 0:
+            return []
+
+        # Same formula as _compute_relevance, evaluated over all segments at once
+        affinity = np.fromiter(
+            (bool(current_task_type) and current_task_type in s.task_affinity
+             for s in segments),
+            dtype=bool, count=n,
+        )
+        tasks_since = self._task_counter - np.fromiter(
+            (self._segment_task_last_used.get(s.segment_id, 0) for s in segments),
+            dtype=np.int64, count=n,
+        )
+        access = np.fromiter(
+            (s.access_count for s in segments), dtype=np.int64, count=n
+        )
 
-        return sorted(
-            self._segments.values(),
-            key=lambda s: s.relevance_score,
-            reverse=True,
+        scores = np.where(affinity, 2.0, 1.0)
+        scores = np.where(tasks_since > 0, scores * (1.0 / (1.0 + 0.3 * tasks_since)), scores)
+        scores = np.where(
+            access > 1, scores * (1.0 + 0.2 * np.log(np.maximum(access, 1))), scores
         )
 
+        for seg, score in zip(segments, scores.tolist()):
+            seg.relevance_score = score
+
+        # Stable descending order, matching sorted(..., reverse=True) on ties
+        order = np.argsort(-scores, kind="stable")
+        return [segments[i] for i in order.tolist()]
+
     def get_stale_segments(self) -> list[ContextSegment]:
         """Get segments not accessed in the last N tasks."""
         stale = []
@@ -208,7 +232,6 @@ class SegmentTracker:
 
         # Frequency bonus (diminishing returns)
         if segment.access_count > 1:
-            import math
             score *= 1.0 + 0.2 * math.log(segment.access_count)
 
         return score
@@ -9,6 +9,7 @@ enforces execution ordering.
 
 from __future__ import annotations
 
+import threading
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
@@ -35,6 +36,7 @@ class DAGTask:
     metadata: dict[str, Any] = field(default_factory=dict)
     estimated_tokens: int = 0
     result: dict[str, Any] | None = None
+    bottom_level: int = 1  # Tasks on the longest path from here to a sink
 
     @property
     def is_terminal(self) -> bool:
@@ -51,6 +53,10 @@ class DAGTask:
         }
 
 
+# States that satisfy a dependency edge
+_SATISFIED_STATES = (TaskState.COMPLETED, TaskState.SKIPPED)
+
+
 class CycleError(Exception):
     """Raised when a cycle is detected in the task DAG."""
 
@@ -77,6 +83,17 @@ class TaskDAG:
 
     def __init__(self) -> None:
         self._tasks: dict[str, DAGTask] = {}
+        # Incremental scheduling index: reverse edges, count of unsatisfied
+        # dependencies per task, and the PENDING tasks whose count is zero
+        # (a dict used as an insertion-ordered set). State changes only touch
+        # the dependents of the task that changed.
+        self._dependents: dict[str, list[str]] = {}
+        self._unmet: dict[str, int] = {}
+        self._ready: dict[str, None] = {}
+        self._levels_stale = False
+        # Tasks are marked from worker threads while the dispatcher polls
+        # for ready tasks.
+        self._lock = threading.Lock()
 
     def add_task(
         self,
@@ -115,12 +132,22 @@ class TaskDAG:
             estimated_tokens=estimated_tokens,
             metadata=metadata or {},
         )
-        self._tasks[task_id] = task
 
-        # Check for cycles after adding
-        if self._has_cycle():
-            del self._tasks[task_id]
-            raise CycleError(f"Adding task '{task_id}' would create a cycle")
+        with self._lock:
+            previous = self._tasks.get(task_id)
+            self._tasks[task_id] = task
+            self._levels_stale = True
+
+            if previous is None:
+                # A new task has no dependents yet, so it cannot close a cycle
+                self._index_task(task)
+                return task
+
+            # Replacing a task can rewire existing edges
+            if self._has_cycle():
+                self._tasks[task_id] = previous
+                raise CycleError(f"Adding task '{task_id}' would create a cycle")
+            self._rebuild_index()
 
         return task
 
@@ -137,53 +164,59 @@ class TaskDAG:
         Get all tasks whose dependencies are satisfied and that
         are not yet running or complete.
 
+        Served from the incrementally maintained ready set rather than
+        rescanning every task's dependencies. Tasks are ordered critical
+        path first (highest ``bottom_level``), ties in insertion order.
+
         Returns:
             List of tasks ready for execution.
         """
-        ready = []
-        for task in self._tasks.values():
-            if task.state != TaskState.PENDING:
-                continue
-            deps_met = all(
-                self._tasks[dep].state in (TaskState.COMPLETED, TaskState.SKIPPED)
-                for dep in task.dependencies
-                if dep in self._tasks
-            )
-            if deps_met:
-                ready.append(task)
+        with self._lock:
+            if self._levels_stale:
+                self._compute_bottom_levels()
+            ready = [
+                task for task in map(self._tasks.__getitem__, self._ready)
+                if task.state == TaskState.PENDING
+            ]
+        ready.sort(key=lambda task: -task.bottom_level)
         return ready
 
     def mark_ready(self, task_id: str) -> None:
         """Mark a task as ready for execution."""
-        task = self._tasks.get(task_id)
-        if task and task.state == TaskState.PENDING:
-            task.state = TaskState.READY
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task and task.state == TaskState.PENDING:
+                self._set_state(task, TaskState.READY)
 
     def mark_running(self, task_id: str) -> None:
         """Mark a task as currently executing."""
-        task = self._tasks.get(task_id)
-        if task:
-            task.state = TaskState.RUNNING
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task:
+                self._set_state(task, TaskState.RUNNING)
 
     def mark_completed(self, task_id: str, result: dict[str, Any] | None = None) -> None:
         """Mark a task as successfully completed."""
-        task = self._tasks.get(task_id)
-        if task:
-            task.state = TaskState.COMPLETED
-            task.result = result
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task:
+                self._set_state(task, TaskState.COMPLETED)
+                task.result = result
 
     def mark_failed(self, task_id: str, result: dict[str, Any] | None = None) -> None:
         """Mark a task as failed."""
-        task = self._tasks.get(task_id)
-        if task:
-            task.state = TaskState.FAILED
-            task.result = result
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task:
+                self._set_state(task, TaskState.FAILED)
+                task.result = result
 
     def mark_skipped(self, task_id: str) -> None:
         """Mark a task as skipped."""
-        task = self._tasks.get(task_id)
-        if task:
-            task.state = TaskState.SKIPPED
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task:
+                self._set_state(task, TaskState.SKIPPED)
 
     def is_complete(self) -> bool:
         """Check if all tasks have reached a terminal state."""
@@ -288,10 +321,63 @@ class TaskDAG:
 
     def get_dependents(self, task_id: str) -> list[str]:
         """Get tasks that depend on the given task."""
-        return [
-            t.task_id for t in self._tasks.values()
-            if task_id in t.dependencies
-        ]
+        return list(dict.fromkeys(self._dependents.get(task_id, ())))
+
+    def _index_task(self, task: DAGTask) -> None:
+        """Add *task*'s edges and readiness to the scheduling index."""
+        self._dependents.setdefault(task.task_id, [])
+        unmet = 0
+        for dep in task.dependencies:
+            if dep not in self._tasks:
+                continue
+            self._dependents[dep].append(task.task_id)
+            if self._tasks[dep].state not in _SATISFIED_STATES:
+                unmet += 1
+        self._unmet[task.task_id] = unmet
+        if unmet == 0 and task.state == TaskState.PENDING:
+            self._ready[task.task_id] = None
+
+    def _rebuild_index(self) -> None:
+        """Recompute the scheduling index from scratch."""
+        self._dependents = {tid: [] for tid in self._tasks}
+        self._unmet = {}
+        self._ready = {}
+        for task in self._tasks.values():
+            self._index_task(task)
+
+    def _compute_bottom_levels(self) -> None:
+        """Set each task's ``bottom_level`` with one reverse-topological pass."""
+        for tid in reversed(self.topological_order()):
+            task = self._tasks[tid]
+            task.bottom_level = 1 + max(
+                (self._tasks[child].bottom_level for child in self._dependents[tid]),
+                default=0,
+            )
+        self._levels_stale = False
+
+    def _set_state(self, task: DAGTask, state: TaskState) -> None:
+        """Change a task's state and update its dependents' readiness.
+
+        Only the direct dependents of *task* are visited.
+        """
+        was_satisfied = task.state in _SATISFIED_STATES
+        task.state = state
+        if state != TaskState.PENDING:
+            self._ready.pop(task.task_id, None)
+
+        now_satisfied = state in _SATISFIED_STATES
+        if now_satisfied == was_satisfied:
+            return
+
+        for child_id in self._dependents.get(task.task_id, ()):
+            if now_satisfied:
+                self._unmet[child_id] -= 1
+                if (self._unmet[child_id] == 0
+                        and self._tasks[child_id].state == TaskState.PENDING):
+                    self._ready[child_id] = None
+            else:
+                self._unmet[child_id] += 1
+                self._ready.pop(child_id, None)
 
     def _has_cycle(self) -> bool:
         """Detect cycles using Kahn's algorithm."""
@@ -73,6 +73,8 @@ class EventBus:
     def __init__(self) -> None:
         self._handlers: dict[EventType, list[EventHandler]] = defaultdict(list)
         self._history: list[Event] = []
+        # Per-type buckets so filtered history is O(matches), not O(history)
+        self._history_by_type: dict[EventType, list[Event]] = defaultdict(list)
         self._lock = threading.Lock()
 
     def subscribe(self, event_type: EventType, handler: EventHandler) -> None:
@@ -95,6 +97,7 @@ class EventBus:
         """
         with self._lock:
             self._history.append(event)
+            self._history_by_type[event.event_type].append(event)
             handlers = list(self._handlers.get(event.event_type, []))
 
         # Invoke handlers outside lock to prevent deadlocks
@@ -106,15 +109,17 @@ class EventBus:
         with self._lock:
             if event_type is None:
                 return list(self._history)
-            return [e for e in self._history if e.event_type == event_type]
+            return list(self._history_by_type.get(event_type, ()))
 
     def clear_history(self) -> None:
         """Clear the event history."""
         with self._lock:
             self._history.clear()
+            self._history_by_type.clear()
 
     def clear_all(self) -> None:
         """Clear all handlers and history."""
         with self._lock:
             self._handlers.clear()
             self._history.clear()
+            self._history_by_type.clear()
@@ -6,6 +6,8 @@ All inference is rule-based — zero LLM tokens consumed.
 
 from __future__ import annotations
 
+import re
+
 # Vertical keyword mapping: vertical → keywords found in class/field names
 VERTICAL_KEYWORDS: dict[str, list[str]] = {
     "Video": [
@@ -85,6 +87,20 @@ ROLLBACK_KEYWORDS: list[str] = [
 ]
 
 
+# Precompiled forms of the tables above, built once at import time
+_VERTICAL_KEYWORD_SETS: dict[str, frozenset[str]] = {
+    vertical: frozenset(keywords) for vertical, keywords in VERTICAL_KEYWORDS.items()
+}
+
+
+def _substring_pattern(keywords: list[str]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
+_BITMASK_RE = _substring_pattern(BITMASK_KEYWORDS)
+_STREAM_RE = _substring_pattern(STREAM_KEYWORDS)
+
+
 def classify_vertical(class_name: str, field_names: list[str]) -> str:
     """
     Classify the vertical category from class and field names.
@@ -102,8 +118,9 @@ def classify_vertical(class_name: str, field_names: list[str]) -> str:
     best_vertical = "Compute"
     best_score = 0
 
-    for vertical, keywords in VERTICAL_KEYWORDS.items():
-        score = sum(1 for kw in keywords if kw in tokens)
+    token_set = frozenset(tokens)
+    for vertical, keywords in _VERTICAL_KEYWORD_SETS.items():
+        score = len(keywords & token_set)
         if score > best_score:
             best_score = score
             best_vertical = vertical
@@ -123,13 +140,11 @@ def classify_delta_type(field_name: str, type_name: str) -> str:
     name_lower = field_name.lower()
     type_lower = type_name.lower()
 
-    for kw in BITMASK_KEYWORDS:
-        if kw in name_lower or kw in type_lower:
-            return "bitmask_delta"
+    if _BITMASK_RE.search(name_lower) or _BITMASK_RE.search(type_lower):
+        return "bitmask_delta"
 
-    for kw in STREAM_KEYWORDS:
-        if kw in name_lower or kw in type_lower:
-            return "delta_stream"
+    if _STREAM_RE.search(name_lower) or _STREAM_RE.search(type_lower):
+        return "delta_stream"
 
     return "parameter_delta"
 
@@ -8,6 +8,8 @@ metrics from all pipeline stages and hardware benchmarks.
 from __future__ import annotations
 
 import time
+from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -33,6 +35,29 @@ class MetricEntry:
         }
 
 
+def _now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _make_entry(
+    name: str,
+    value: Any,
+    unit: str = "",
+    source: str = "",
+    category: str = "pipeline",
+    *,
+    timestamp: str,
+) -> MetricEntry:
+    return MetricEntry(
+        name=name,
+        value=value,
+        unit=unit,
+        source=source,
+        timestamp=timestamp,
+        category=category,
+    )
+
+
 class MetricsCollector:
     """
     Collects metrics from pipeline stages and hardware benchmarks.
@@ -50,6 +75,13 @@ class MetricsCollector:
 
     def __init__(self) -> None:
         self._entries: list[MetricEntry] = []
+        # Per-category buckets so get_by_category is O(matches), not O(entries)
+        self._by_category: dict[str, list[MetricEntry]] = defaultdict(list)
+
+    def _add(self, entries: Iterable[MetricEntry]) -> None:
+        for entry in entries:
+            self._entries.append(entry)
+            self._by_category[entry.category].append(entry)
 
     def record(
         self,
@@ -60,38 +92,51 @@ class MetricsCollector:
         category: str = "pipeline",
     ) -> None:
         """Record a single metric."""
-        self._entries.append(MetricEntry(
-            name=name,
-            value=value,
-            unit=unit,
-            source=source,
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            category=category,
+        self._add((
+            _make_entry(name, value, unit, source, category, timestamp=_now()),
         ))
 
+    def record_many(
+        self, entries: Iterable[tuple[Any, ...] | dict[str, Any]]
+    ) -> None:
+        """
+        Record several metrics in one call, sharing a single timestamp.
+
+        Each entry is either a tuple in record()'s positional order
+        (name, value, unit, source, category) or a dict of record()'s
+        keyword arguments.
+        """
+        timestamp = _now()
+        self._add(
+            _make_entry(**e, timestamp=timestamp) if isinstance(e, dict)
+            else _make_entry(*e, timestamp=timestamp)
+            for e in entries
+        )
+
+    def _record_kwargs(self, category: str, source: str, metrics: dict[str, Any]) -> None:
+        self.record_many(
+            (name, value, "", source, category) for name, value in metrics.items()
+        )
+
     def record_pipeline(self, **kwargs: Any) -> None:
         """Record pipeline efficiency metrics."""
-        for name, value in kwargs.items():
-            self.record(name, value, category="pipeline", source="pipeline")
+        self._record_kwargs("pipeline", "pipeline", kwargs)
 
     def record_hardware(self, **kwargs: Any) -> None:
         """Record hardware synthesis metrics."""
-        for name, value in kwargs.items():
-            self.record(name, value, category="hardware", source="synthesis")
+        self._record_kwargs("hardware", "synthesis", kwargs)
 
     def record_runtime(self, **kwargs: Any) -> None:
         """Record runtime performance metrics."""
-        for name, value in kwargs.items():
-            self.record(name, value, category="runtime", source="benchmark")
+        self._record_kwargs("runtime", "benchmark", kwargs)
 
     def record_quality(self, **kwargs: Any) -> None:
         """Record quality metrics."""
-        for name, value in kwargs.items():
-            self.record(name, value, category="quality", source="verification")
+        self._record_kwargs("quality", "verification", kwargs)
 
     def get_by_category(self, category: str) -> list[MetricEntry]:
         """Get all metrics in a category."""
-        return [e for e in self._entries if e.category == category]
+        return list(self._by_category.get(category, ()))
 
     def get_summary(self) -> dict[str, dict[str, Any]]:
         """Get a categorized summary of all metrics."""
@@ -112,8 +157,10 @@ class MetricsCollector:
 
     def merge(self, other: MetricsCollector) -> None:
         """Merge metrics from another collector."""
-        self._entries.extend(other._entries)
+        # Snapshot first so merging a collector into itself terminates
+        self._add(list(other._entries))
 
     def clear(self) -> None:
         """Clear all collected metrics."""
         self._entries.clear()
+        self._by_category.clear()
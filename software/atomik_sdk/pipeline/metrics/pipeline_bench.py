@@ -7,11 +7,24 @@ generation time, differential savings, and self-correction rates.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, NamedTuple
 
 from .collector import MetricsCollector
 
 
+class PipelineRun(NamedTuple):
+    """Inputs for a single pipeline run passed to ``record``."""
+    schema_name: str
+    total_time_ms: float
+    tokens_consumed: int
+    tokens_saved: int
+    files_generated: int
+    lines_generated: int
+    self_corrections: int
+    self_correction_successes: int
+    diff_type: str = "full"
+
+
 class PipelineBenchmark:
     """Tracks and computes pipeline efficiency metrics."""
 
@@ -31,6 +44,20 @@ class PipelineBenchmark:
         diff_type: str = "full",
     ) -> dict[str, Any]:
         """Record metrics for a complete pipeline run."""
+        return self.record(PipelineRun(
+            schema_name, total_time_ms, tokens_consumed, tokens_saved,
+            files_generated, lines_generated, self_corrections,
+            self_correction_successes, diff_type,
+        ))
+
+    def record(self, run: PipelineRun) -> dict[str, Any]:
+        """Record metrics for a pipeline run given as a ``PipelineRun``."""
+        (
+            schema_name, total_time_ms, tokens_consumed, tokens_saved,
+            files_generated, lines_generated, self_corrections,
+            self_correction_successes, diff_type,
+        ) = run
+
         efficiency = (
             round(100 * tokens_saved / (tokens_saved + tokens_consumed), 1)
             if (tokens_saved + tokens_consumed) > 0
@@ -8,10 +8,13 @@ text formats.
 from __future__ import annotations
 
 import csv
-import json
+from collections.abc import Iterator
+from itertools import zip_longest
 from pathlib import Path
 from typing import Any
 
+from ..context.jsonio import write_json
+
 
 class MetricsReporter:
     """Generates pipeline metrics reports."""
@@ -91,21 +94,47 @@ class MetricsReporter:
     def write_json_report(
         self, path: str | Path, metrics: dict[str, Any]
     ) -> None:
-        """Write metrics report as JSON."""
+        """Write metrics report as JSON (orjson-accelerated when installed)."""
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(metrics, f, indent=2)
+        write_json(path, metrics)
+
+    def iter_csv_history(self, csv_path: str | Path) -> Iterator[dict[str, Any]]:
+        """Stream metrics history rows from CSV without loading the whole file."""
+        path = Path(csv_path)
+        if not path.exists():
+            return
+
+        with open(path, encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f)
 
     def read_csv_history(self, csv_path: str | Path) -> list[dict[str, Any]]:
         """Read metrics history from CSV."""
+        return list(self.iter_csv_history(csv_path))
+
+    def read_csv_history_columnar(
+        self, csv_path: str | Path
+    ) -> dict[str, tuple[Any, ...]]:
+        """
+        Read metrics history from CSV as one tuple per column.
+
+        Avoids building a dict per row. Short rows are padded with None,
+        matching ``csv.DictReader``.
+        """
         path = Path(csv_path)
         if not path.exists():
-            return []
+            return {}
+
+        with open(path, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return {}
+            columns = list(zip_longest(*reader))
 
-        with open(path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+        if not columns:
+            return {name: () for name in header}
+        return dict(zip(header, columns))
 
     def format_comparison_table(
         self, schemas: dict[str, dict[str, Any]]
@@ -134,11 +163,10 @@ class MetricsReporter:
         lines.append("-+-".join("-" * w for w in col_widths))
 
         # Rows
+        columns = list(schemas.values())
         for key in metric_keys:
             row = [metric_labels.get(key, key)]
-            for schema_name in schemas:
-                val = schemas[schema_name].get(key, "N/A")
-                row.append(str(val))
+            row.extend(str(col.get(key, "N/A")) for col in columns)
             row_line = " | ".join(v.ljust(w) for v, w in zip(row, col_widths))
             lines.append(row_line)
 
@@ -1,6 +1,12 @@
 """Regression detection system with baseline management."""
 
-from .baseline import BaselineManager, BaselineSnapshot
+from .baseline import (
+    BaselineManager,
+    BaselineSnapshot,
+    BaselineStorage,
+    InMemoryBaselineStorage,
+    JsonFileBaselineStorage,
+)
 from .detector import GateResult, PipelineRegressionDetector, RegressionGate
 
 __all__ = [
@@ -9,4 +15,7 @@ __all__ = [
     "GateResult",
     "BaselineManager",
     "BaselineSnapshot",
+    "BaselineStorage",
+    "JsonFileBaselineStorage",
+    "InMemoryBaselineStorage",
 ]
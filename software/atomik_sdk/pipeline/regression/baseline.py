@@ -8,11 +8,12 @@ successful run per schema and updated on explicit request.
 
 from __future__ import annotations
 
+import copy
 import json
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol
 
 
 @dataclass
@@ -51,14 +52,90 @@ class BaselineSnapshot:
         )
 
 
+class BaselineStorage(Protocol):
+    """Protocol for baseline snapshot persistence, keyed by schema name."""
+
+    def load(self, schema_name: str) -> dict[str, Any] | None:
+        """Return the stored snapshot dict, or None if absent."""
+        ...
+
+    def save(self, schema_name: str, data: dict[str, Any]) -> None:
+        """Store a snapshot dict, replacing any existing one."""
+        ...
+
+    def delete(self, schema_name: str) -> bool:
+        """Remove a stored snapshot. Returns True if found."""
+        ...
+
+    def names(self) -> list[str]:
+        """List schema names with a stored snapshot."""
+        ...
+
+
+class JsonFileBaselineStorage:
+    """Stores each snapshot as ``<schema>_baseline.json`` in a directory."""
+
+    def __init__(self, baseline_dir: str | Path) -> None:
+        self.baseline_dir = Path(baseline_dir)
+        self.baseline_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, schema_name: str) -> Path:
+        return self.baseline_dir / f"{schema_name}_baseline.json"
+
+    def load(self, schema_name: str) -> dict[str, Any] | None:
+        path = self._path(schema_name)
+        if not path.exists():
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, schema_name: str, data: dict[str, Any]) -> None:
+        with open(self._path(schema_name), "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def delete(self, schema_name: str) -> bool:
+        path = self._path(schema_name)
+        if path.exists():
+            path.unlink()
+            return True
+        return False
+
+    def names(self) -> list[str]:
+        return [
+            p.stem.replace("_baseline", "")
+            for p in self.baseline_dir.glob("*_baseline.json")
+        ]
+
+
+class InMemoryBaselineStorage:
+    """Keeps snapshots in a dict; nothing touches the filesystem."""
+
+    def __init__(self) -> None:
+        self._snapshots: dict[str, dict[str, Any]] = {}
+
+    def load(self, schema_name: str) -> dict[str, Any] | None:
+        data = self._snapshots.get(schema_name)
+        # Copy so callers cannot mutate the stored snapshot, as with files
+        return copy.deepcopy(data) if data is not None else None
+
+    def save(self, schema_name: str, data: dict[str, Any]) -> None:
+        self._snapshots[schema_name] = copy.deepcopy(data)
+
+    def delete(self, schema_name: str) -> bool:
+        return self._snapshots.pop(schema_name, None) is not None
+
+    def names(self) -> list[str]:
+        return list(self._snapshots)
+
+
 class BaselineManager:
     """
     Manages baseline snapshots for regression detection.
 
-    Baselines are stored as JSON files in a configurable directory.
-    Each schema has its own baseline file. Baselines are created
-    automatically after the first successful run and can be updated
-    explicitly.
+    Baselines are stored as JSON files in a configurable directory
+    unless another ``BaselineStorage`` is supplied. Each schema has its
+    own baseline file. Baselines are created automatically after the
+    first successful run and can be updated explicitly.
 
     Example:
         >>> manager = BaselineManager(".atomik/baselines")
@@ -68,20 +145,21 @@ class BaselineManager:
         ...     print(f"Baseline from {baseline.created_at}")
     """
 
-    def __init__(self, baseline_dir: str | Path = ".atomik/baselines") -> None:
+    def __init__(
+        self,
+        baseline_dir: str | Path = ".atomik/baselines",
+        storage: BaselineStorage | None = None,
+    ) -> None:
         self.baseline_dir = Path(baseline_dir)
-        self.baseline_dir.mkdir(parents=True, exist_ok=True)
-
-    def _baseline_path(self, schema_name: str) -> Path:
-        return self.baseline_dir / f"{schema_name}_baseline.json"
+        self.storage = storage if storage is not None else JsonFileBaselineStorage(
+            self.baseline_dir
+        )
 
     def get_baseline(self, schema_name: str) -> BaselineSnapshot | None:
         """Load a baseline snapshot for a schema."""
-        path = self._baseline_path(schema_name)
-        if not path.exists():
+        data = self.storage.load(schema_name)
+        if data is None:
             return None
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
         return BaselineSnapshot.from_dict(data)
 
     def create_baseline(
@@ -195,21 +273,12 @@ class BaselineManager:
 
     def delete_baseline(self, schema_name: str) -> bool:
         """Delete a baseline snapshot. Returns True if found."""
-        path = self._baseline_path(schema_name)
-        if path.exists():
-            path.unlink()
-            return True
-        return False
+        return self.storage.delete(schema_name)
 
     def list_baselines(self) -> list[str]:
         """List all schema names that have baselines."""
-        return [
-            p.stem.replace("_baseline", "")
-            for p in self.baseline_dir.glob("*_baseline.json")
-        ]
+        return self.storage.names()
 
     def _save(self, snapshot: BaselineSnapshot) -> None:
-        """Persist a baseline snapshot to disk."""
-        path = self._baseline_path(snapshot.schema_name)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(snapshot.to_dict(), f, indent=2)
+        """Persist a baseline snapshot through the storage backend."""
+        self.storage.save(snapshot.schema_name, snapshot.to_dict())
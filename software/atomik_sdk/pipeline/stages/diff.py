@@ -11,6 +11,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+from ..context.cache import ArtifactCache
 from ..context.checkpoint import Checkpoint
 from . import BaseStage, StageManifest, StageStatus
 
@@ -41,11 +42,16 @@ class DiffStage(BaseStage):
         content_hash = ""
         if previous_manifest:
             content_hash = previous_manifest.metrics.get("content_hash", "")
+        if not content_hash and Path(schema_path).is_file():
+            # Hash the file directly so the unchanged case never needs
+            # the parsed schema (file_hash is memoized on path/mtime/size).
+            content_hash = ArtifactCache.file_hash(schema_path)
 
         checkpoint_dir = getattr(config, "checkpoint_dir", ".atomik")
         checkpoint = Checkpoint(checkpoint_dir)
 
-        # Check if schema has changed
+        # Check if schema has changed -- decided on the hash alone, before
+        # the schema dict is touched
         if content_hash and checkpoint.is_current(
             Path(schema_path).stem, content_hash
         ):
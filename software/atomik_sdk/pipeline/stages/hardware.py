@@ -15,6 +15,7 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from . import BaseStage, StageManifest, StageStatus
@@ -26,13 +27,13 @@ class HardwareStage(BaseStage):
     name = "hardware"
 
     # Phase 3 baseline for comparison
-    PHASE3_BASELINE = {
+    PHASE3_BASELINE = MappingProxyType({
         "fmax_mhz": 94.9,
         "lut_pct": 7,
         "ff_pct": 9,
         "tests_passed": 10,
         "tests_total": 10,
-    }
+    })
 
     def run(
         self,
@@ -68,7 +69,8 @@ class HardwareStage(BaseStage):
             return
 
         # Include Phase 3 baseline in all cases where RTL exists
-        manifest.metrics["phase3_baseline"] = self.PHASE3_BASELINE
+        # Plain dict so the manifest stays JSON-serializable
+        manifest.metrics["phase3_baseline"] = dict(self.PHASE3_BASELINE)
 
         if sim_only:
             manifest.next_stage = "metrics"
@@ -8,12 +8,36 @@ deterministic fixes or escalation to diagnosis agent.
 
 from __future__ import annotations
 
+import os
+import re
 from pathlib import Path
 from typing import Any
 
 from ..agents.self_correct import SelfCorrector
 from . import BaseStage, StageManifest, StageStatus
 
+# Matches both `module` and `endmodule` keywords in one scan of the file
+_MODULE_KEYWORD_RE = re.compile(rb"\b(?:end)?module\b")
+
+
+def _index_files_by_suffix(root: Path) -> dict[str, list[Path]]:
+    """Walk *root* once with ``os.scandir``, grouping regular files by suffix."""
+    index: dict[str, list[Path]] = {}
+    pending = [root]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    suffix = os.path.splitext(entry.name)[1]
+                    index.setdefault(suffix, []).append(Path(entry.path))
+    return index
+
 
 class VerifyStage(BaseStage):
     """Pipeline stage for verifying generated code."""
@@ -48,8 +72,11 @@ class VerifyStage(BaseStage):
         corrections = 0
         correction_successes = 0
 
+        # One directory walk serves every language's checks
+        files_by_suffix = _index_files_by_suffix(Path(output_dir))
+
         for lang in languages:
-            checks = self._verify_language(lang, output_dir, config)
+            checks = self._verify_language(lang, files_by_suffix)
 
             for check in checks:
                 total_checks += 1
@@ -97,28 +124,29 @@ class VerifyStage(BaseStage):
         manifest.tokens_consumed = 0  # All local unless self-correction escalates
 
     def _verify_language(
-        self, lang: str, output_dir: str, config: Any
+        self, lang: str, files_by_suffix: dict[str, list[Path]]
     ) -> list[dict[str, Any]]:
         """Run verification checks for a language."""
         checks = []
-        output_path = Path(output_dir)
+
+        def files(*suffixes: str) -> list[Path]:
+            return [f for s in suffixes for f in files_by_suffix.get(s, [])]
 
         if lang == "python":
-            checks.append(self._check_python_syntax(output_path))
+            checks.append(self._check_python_syntax(files(".py")))
         elif lang == "rust":
-            checks.append(self._check_rust_syntax(output_path))
+            checks.append(self._check_rust_syntax(files(".rs")))
         elif lang == "c":
-            checks.append(self._check_c_syntax(output_path))
+            checks.append(self._check_c_syntax(files(".c", ".h")))
         elif lang == "javascript":
-            checks.append(self._check_js_syntax(output_path))
+            checks.append(self._check_js_syntax(files(".js")))
         elif lang == "verilog":
-            checks.append(self._check_verilog_syntax(output_path))
+            checks.append(self._check_verilog_syntax(files(".v")))
 
         return checks
 
-    def _check_python_syntax(self, output_path: Path) -> dict[str, Any]:
+    def _check_python_syntax(self, py_files: list[Path]) -> dict[str, Any]:
         """Check Python files for syntax errors."""
-        py_files = list(output_path.rglob("*.py"))
         if not py_files:
             return {"type": "syntax", "status": "skip", "message": "no Python files"}
 
@@ -138,9 +166,8 @@ class VerifyStage(BaseStage):
             "message": f"{len(errors)} syntax error(s)" if errors else "ok",
         }
 
-    def _check_rust_syntax(self, output_path: Path) -> dict[str, Any]:
+    def _check_rust_syntax(self, rs_files: list[Path]) -> dict[str, Any]:
         """Check Rust files for basic syntax validity."""
-        rs_files = list(output_path.rglob("*.rs"))
         if not rs_files:
             return {"type": "syntax", "status": "skip", "message": "no Rust files"}
 
@@ -153,9 +180,8 @@ class VerifyStage(BaseStage):
             "error_count": len(errors),
         }
 
-    def _check_c_syntax(self, output_path: Path) -> dict[str, Any]:
+    def _check_c_syntax(self, c_files: list[Path]) -> dict[str, Any]:
         """Check C files for basic syntax validity."""
-        c_files = list(output_path.rglob("*.c")) + list(output_path.rglob("*.h"))
         if not c_files:
             return {"type": "syntax", "status": "skip", "message": "no C files"}
 
@@ -167,9 +193,8 @@ class VerifyStage(BaseStage):
             "error_count": len(errors),
         }
 
-    def _check_js_syntax(self, output_path: Path) -> dict[str, Any]:
+    def _check_js_syntax(self, js_files: list[Path]) -> dict[str, Any]:
         """Check JavaScript files for basic syntax validity."""
-        js_files = list(output_path.rglob("*.js"))
         if not js_files:
             return {"type": "syntax", "status": "skip", "message": "no JS files"}
 
@@ -181,18 +206,17 @@ class VerifyStage(BaseStage):
             "error_count": len(errors),
         }
 
-    def _check_verilog_syntax(self, output_path: Path) -> dict[str, Any]:
+    def _check_verilog_syntax(self, v_files: list[Path]) -> dict[str, Any]:
         """Check Verilog files for basic syntax validity."""
-        v_files = list(output_path.rglob("*.v"))
         if not v_files:
             return {"type": "syntax", "status": "skip", "message": "no Verilog files"}
 
         errors = []
         for f in v_files:
-            content = f.read_text(encoding="utf-8")
             # Check for module/endmodule balance
-            modules = content.count("module ")
-            endmodules = content.count("endmodule")
+            keywords = _MODULE_KEYWORD_RE.findall(f.read_bytes())
+            endmodules = keywords.count(b"endmodule")
+            modules = len(keywords) - endmodules
             if modules != endmodules:
                 errors.append(
                     f"{f.name}: mismatched module/endmodule ({modules}/{endmodules})"
@@ -0,0 +1,90 @@
+"""
+Shared test schemas.
+
+Locates the example and domain schemas shipped with the SDK, and embeds
+the canonical domain schema as bytes so unit tests can use it without
+touching the filesystem.
+``test_pipeline_diff.py::test_embedded_schema_matches_file`` fails if the
+copy drifts from ``sdk/schemas/domains/video-h264-delta.json``; regenerate
+the embedded bytes from the schema when that happens.
+"""
+
+import functools
+import hashlib
+import json
+from pathlib import Path
+
+SCHEMAS_DIR = Path(__file__).resolve().parents[3] / "sdk" / "schemas"
+EXAMPLES_DIR = SCHEMAS_DIR / "examples"
+DOMAINS_DIR = SCHEMAS_DIR / "domains"
+
+
+@functools.cache
+def schema_paths(directory: Path) -> tuple[Path, ...]:
+    """Sorted ``*.json`` schema paths in *directory*, listed once per session."""
+    return tuple(sorted(directory.glob("*.json")))
+
+
+VIDEO_H264_DELTA_BYTES = (
+    b'{\n'
+    b'  "catalogue": {\n'
+    b'    "vertical": "Video",\n'
+    b'    "field": "Streaming",\n'
+    b'    "object": "H264Delta",\n'
+    b'    "version": "1.0.0",\n'
+    b'    "author": "ATOMiK Project",\n'
+    b'    "license": "Apache-2.0",\n'
+    b'    "description": "Delta-based video frame processing for H.264 streams. Tracks frame deltas and motion vectors using XOR accumulation for bandwidth-efficient video transport."\n'
+    b'  },\n'
+    b'  "schema": {\n'
+    b'    "delta_fields": {\n'
+    b'      "frame_delta": {\n'
+    b'        "type": "delta_stream",\n'
+    b'        "width": 256,\n'
+    b'        "encoding": "spatiotemporal_4x4x4",\n'
+    b'        "compression": "xor",\n'
+    b'        "default_value": 0\n'
+    b'      },\n'
+    b'      "motion_vector": {\n'
+    b'        "type": "parameter_delta",\n'
+    b'        "width": 256,\n'
+    b'        "encoding": "raw",\n'
+    b'        "compression": "none",\n'
+    b'        "default_value": 0\n'
+    b'      }\n'
+    b'    },\n'
+    b'    "operations": {\n'
+    b'      "accumulate": {\n'
+    b'        "enabled": true,\n'
+    b'        "latency_cycles": 1\n'
+    b'      },\n'
+    b'      "reconstruct": {\n'
+    b'        "enabled": true,\n'
+    b'        "latency_cycles": 1\n'
+    b'      },\n'
+    b'      "rollback": {\n'
+    b'        "enabled": true,\n'
+    b'        "history_depth": 512\n'
+    b'      }\n'
+    b'    },\n'
+    b'    "constraints": {\n'
+    b'      "max_memory_mb": 256,\n'
+    b'      "update_latency_ms": 33,\n'
+    b'      "target_frequency_mhz": 150.0\n'
+    b'    }\n'
+    b'  },\n'
+    b'  "hardware": {\n'
+    b'    "target_device": "GW1NR-9",\n'
+    b'    "rtl_params": {\n'
+    b'      "DATA_WIDTH": 256,\n'
+    b'      "ENABLE_PARALLEL": true,\n'
+    b'      "CLOCK_DOMAIN": "video_clk"\n'
+    b'    },\n'
+    b'    "synthesis_options": {\n'
+    b'      "optimization_goal": "speed"\n'
+    b'    }\n'
+    b'  }\n'
+    b'}\n'
+)
+VIDEO_H264_DELTA = json.loads(VIDEO_H264_DELTA_BYTES)
+VIDEO_H264_DELTA_SHA256 = hashlib.sha256(VIDEO_H264_DELTA_BYTES).hexdigest()
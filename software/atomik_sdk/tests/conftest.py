@@ -1,6 +1,62 @@
-"""Shared test configuration -- ensure pipeline package is importable."""
+"""Shared test configuration.
 
+The SDK modules (``pipeline``, ``generator``, ...) are importable via the
+``pythonpath`` setting in ``pyproject.toml``.
+"""
+
+import json
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
+from _schemas import EXAMPLES_DIR, schema_paths
+
+# Opt-in RAM-backed directory for tmp_path when --basetemp is not given.
+# Set ATOMIK_TEST_TMPFS=1 to use it; by default pytest's on-disk location
+# is kept, since /dev/shm is small on some hosts and containers.
+_TMPFS_ROOT = Path("/dev/shm")
+
+
+def _tmpfs_available() -> bool:
+    return (
+        sys.platform.startswith("linux")
+        and os.environ.get("ATOMIK_TEST_TMPFS", "0") == "1"
+        and _TMPFS_ROOT.is_dir()
+        and os.access(_TMPFS_ROOT, os.W_OK)
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # xdist workers inherit their basetemp from the controller
+    if config.option.basetemp is not None or hasattr(config, "workerinput"):
+        return
+    if not _tmpfs_available():
+        return
+    basetemp = tempfile.mkdtemp(prefix="atomik-pytest-", dir=_TMPFS_ROOT)
+    config.option.basetemp = basetemp
+    config._atomik_tmpfs_basetemp = basetemp
+
+
+def pytest_unconfigure(config):
+    # Free the RAM held by an auto-selected tmpfs basetemp
+    basetemp = getattr(config, "_atomik_tmpfs_basetemp", None)
+    if basetemp:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def example_schemas():
+    """Example schemas parsed once per module, keyed by file name."""
+    if not EXAMPLES_DIR.is_dir():
+        pytest.skip(f"Examples directory not found: {EXAMPLES_DIR}")
+    schemas = {
+        path.name: json.loads(path.read_text(encoding="utf-8"))
+        for path in schema_paths(EXAMPLES_DIR)
+    }
+    if not schemas:
+        pytest.skip("No example schemas found")
+    return schemas
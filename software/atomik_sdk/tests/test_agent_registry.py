@@ -1,9 +1,5 @@
 """Tests for specialist agent registry."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pipeline.agents.registry import AgentRegistry
 from pipeline.agents.specialist import AgentCapability, SpecialistAgent
@@ -5,12 +5,16 @@ Test C SDK generation
 import subprocess
 import sys
 import tempfile
+import traceback
 from pathlib import Path
 
 import pytest
 
+# Standalone runs (python tests/test_*.py) bypass pytest's pythonpath
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from _schemas import EXAMPLES_DIR, schema_paths
+
 from generator.c_generator import CGenerator
 from generator.core import GeneratorConfig, GeneratorEngine
 
@@ -22,18 +26,15 @@ def test_c_generation():
     print("=" * 70)
     print()
 
-    project_root = Path(__file__).parent.parent.parent.parent
-    examples_dir = project_root / "sdk" / "schemas" / "examples"
-
-    if not examples_dir.exists():
-        pytest.skip(f"Examples directory not found: {examples_dir}")
+    if not EXAMPLES_DIR.exists():
+        pytest.skip(f"Examples directory not found: {EXAMPLES_DIR}")
 
     # Create temporary output directory
     with tempfile.TemporaryDirectory() as temp_dir:
         output_dir = Path(temp_dir)
 
         # Test each example schema
-        examples = list(examples_dir.glob("*.json"))
+        examples = schema_paths(EXAMPLES_DIR)
         if not examples:
             pytest.skip("No example schemas found")
 
@@ -159,7 +160,6 @@ def test_c_generation():
 
             except Exception as e:
                 print(f"  [FAIL] Exception: {e}")
-                import traceback
                 traceback.print_exc()
                 continue
 
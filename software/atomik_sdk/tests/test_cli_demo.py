@@ -7,13 +7,10 @@ synthesis tools are needed.
 
 import argparse
 import json
-import sys
 from pathlib import Path
 from unittest import mock
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from cli import (  # noqa: E402
+from cli import (
     EXIT_FILE_ERROR,
     EXIT_HARDWARE_FAILURE,
     EXIT_SUCCESS,
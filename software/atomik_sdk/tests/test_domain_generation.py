@@ -12,8 +12,11 @@ from pathlib import Path
 
 import pytest
 
+# Standalone runs (python tests/test_*.py) bypass pytest's pythonpath
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from _schemas import DOMAINS_DIR, schema_paths
+
 from generator.c_generator import CGenerator
 from generator.core import GeneratorConfig, GeneratorEngine
 from generator.javascript_generator import JavaScriptGenerator
@@ -32,13 +35,10 @@ GENERATORS = {
 
 def test_domain_schema_validation():
     """All domain schemas pass validation."""
-    project_root = Path(__file__).parent.parent.parent.parent
-    domains_dir = project_root / "sdk" / "schemas" / "domains"
-
-    if not domains_dir.exists():
-        pytest.skip(f"Domains directory not found: {domains_dir}")
+    if not DOMAINS_DIR.exists():
+        pytest.skip(f"Domains directory not found: {DOMAINS_DIR}")
 
-    schemas = list(domains_dir.glob("*.json"))
+    schemas = schema_paths(DOMAINS_DIR)
     if not schemas:
         pytest.skip("No domain schemas found")
 
@@ -54,13 +54,10 @@ def test_domain_schema_validation():
 
 def test_domain_generation_all_languages():
     """All domain schemas generate code for all 5 languages."""
-    project_root = Path(__file__).parent.parent.parent.parent
-    domains_dir = project_root / "sdk" / "schemas" / "domains"
+    if not DOMAINS_DIR.exists():
+        pytest.skip(f"Domains directory not found: {DOMAINS_DIR}")
 
-    if not domains_dir.exists():
-        pytest.skip(f"Domains directory not found: {domains_dir}")
-
-    schemas = list(domains_dir.glob("*.json"))
+    schemas = schema_paths(DOMAINS_DIR)
     if not schemas:
         pytest.skip("No domain schemas found")
 
@@ -99,13 +96,10 @@ def test_domain_generation_all_languages():
 
 def test_domain_namespace_mapping():
     """Domain schemas produce correct namespace mappings."""
-    project_root = Path(__file__).parent.parent.parent.parent
-    domains_dir = project_root / "sdk" / "schemas" / "domains"
-
-    if not domains_dir.exists():
-        pytest.skip(f"Domains directory not found: {domains_dir}")
+    if not DOMAINS_DIR.exists():
+        pytest.skip(f"Domains directory not found: {DOMAINS_DIR}")
 
-    schemas = list(domains_dir.glob("*.json"))
+    schemas = schema_paths(DOMAINS_DIR)
     if not schemas:
         pytest.skip("No domain schemas found")
 
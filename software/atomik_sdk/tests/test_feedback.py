@@ -1,9 +1,5 @@
 """Tests for feedback loop engine."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pipeline.event_bus import EventBus
 from pipeline.feedback import FeedbackLoop, FeedbackOutcome
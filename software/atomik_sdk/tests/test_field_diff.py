@@ -1,9 +1,5 @@
 """Tests for field-level differential analysis."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pipeline.analysis.field_diff import FieldDiff, FieldDiffResult
 
@@ -1,12 +1,9 @@
 """Integration tests for the from-source pipeline."""
 
 import json
-import sys
 import tempfile
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pipeline.controller import Pipeline, PipelineConfig
 from pipeline.stages.extract import ExtractStage
 from pipeline.stages.infer import InferStage
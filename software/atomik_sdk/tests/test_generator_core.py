@@ -9,14 +9,16 @@ Tests cover:
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
-# Add parent directory to path for imports
+# Standalone runs (python tests/test_*.py) bypass pytest's pythonpath
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from generator import core
 from generator.code_emitter import (
     CodeEmitter,
     GeneratedFile,
@@ -25,7 +27,7 @@ from generator.code_emitter import (
 )
 from generator.core import GeneratorConfig, GeneratorEngine
 from generator.namespace_mapper import NamespaceMapper
-from generator.schema_validator import SchemaValidator
+from generator.schema_validator import SchemaValidator, ValidationResult
 
 # Test fixtures
 
@@ -457,6 +459,120 @@ class TestGeneratorEngine:
         assert result.valid is True
         assert engine.schema is not None
 
+    def test_load_schema_reuses_validation(self, terminal_io_path, monkeypatch):
+        """Test reloading an unchanged schema skips re-validation."""
+        GeneratorEngine().load_schema(terminal_io_path)
+
+        def fail_validate(schema):
+            raise AssertionError("schema re-validated")
+
+        engine = GeneratorEngine()
+        monkeypatch.setattr(engine.validator, "validate", fail_validate)
+        result = engine.load_schema(terminal_io_path)
+        assert result.valid is True
+
+    def test_load_schema_revalidates_modified_file(self, tmp_path, valid_schema):
+        """Test a rewritten schema file is validated again."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps(valid_schema))
+        assert GeneratorEngine().load_schema(schema_file).valid is True
+
+        del valid_schema['catalogue']
+        schema_file.write_text(json.dumps(valid_schema))
+        assert GeneratorEngine().load_schema(schema_file).valid is False
+
+    def test_load_schema_revalidates_same_size_same_mtime(self, tmp_path, valid_schema):
+        """Test the cache key is the file content, not its stat."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps(valid_schema))
+        stat = schema_file.stat()
+        assert GeneratorEngine().load_schema(schema_file).valid is True
+
+        # Same length and mtime, but the catalogue key no longer matches
+        schema_file.write_text(json.dumps(valid_schema).replace('"catalogue"', '"catalogux"'))
+        os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert schema_file.stat().st_size == stat.st_size
+        assert GeneratorEngine().load_schema(schema_file).valid is False
+
+    def test_validation_cache_is_bounded(self, tmp_path, valid_schema, monkeypatch):
+        """Test old validation results are evicted past the size limit."""
+        monkeypatch.setattr(core, "_VALIDATION_CACHE_SIZE", 2)
+        monkeypatch.setattr(core, "_validation_cache", {})
+        for i in range(3):
+            valid_schema['catalogue']['version'] = f"1.0.{i}"
+            schema_file = tmp_path / f"schema{i}.json"
+            schema_file.write_text(json.dumps(valid_schema))
+            GeneratorEngine().load_schema(schema_file)
+        assert len(core._validation_cache) == 2
+
+    def test_validation_cache_is_per_validator(self, terminal_io_path):
+        """Test a replaced validator never gets another validator's verdict."""
+        assert GeneratorEngine().load_schema(terminal_io_path).valid is True
+
+        class RejectingValidator(SchemaValidator):
+            def validate(self, schema):
+                return ValidationResult(False, ["rejected"])
+
+        engine = GeneratorEngine()
+        engine.validator = RejectingValidator()
+        assert engine.load_schema(terminal_io_path).errors == ["rejected"]
+
+        class SpeclessValidator:
+            def validate(self, schema):
+                return ValidationResult(False, ["no spec"])
+
+        engine.validator = SpeclessValidator()
+        assert engine.load_schema(terminal_io_path).errors == ["no spec"]
+
+    def test_validation_cache_is_per_spec(self, tmp_path, terminal_io_path):
+        """Test validators built from different specifications are cached apart."""
+        assert GeneratorEngine().load_schema(terminal_io_path).valid is True
+
+        spec = json.loads(SchemaValidator().schema_spec_path.read_text())
+        spec.setdefault("required", []).append("not_in_any_schema")
+        spec_file = tmp_path / "strict_spec.json"
+        spec_file.write_text(json.dumps(spec))
+
+        engine = GeneratorEngine()
+        engine.validator = SchemaValidator(spec_file)
+        assert engine.load_schema(terminal_io_path).valid is False
+
+    def test_load_schema_errors(self, tmp_path):
+        """Test missing files and malformed JSON raise the documented errors."""
+        with pytest.raises(FileNotFoundError):
+            GeneratorEngine().load_schema(tmp_path / "missing.json")
+
+        bad_file = tmp_path / "bad.json"
+        bad_file.write_text('{"catalogue": ')
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            GeneratorEngine().load_schema(bad_file)
+
+    def test_load_schema_dict(self, valid_schema):
+        """Test loading an already-parsed schema."""
+        engine = GeneratorEngine()
+        result = engine.load_schema_dict(valid_schema)
+        assert result.valid is True
+        assert engine.schema is valid_schema
+        assert engine.schema_path is None
+
+        del valid_schema['catalogue']
+        assert GeneratorEngine().load_schema_dict(valid_schema).valid is False
+
+    def test_engine_reuse_across_schemas(self, terminal_io_path, p2p_delta_path):
+        """Test loading a second schema replaces the derived namespace."""
+        engine = GeneratorEngine()
+        engine.load_schema(terminal_io_path)
+        assert engine.extract_metadata().field == "Terminal"
+
+        engine.load_schema(p2p_delta_path)
+        assert engine.namespace is None
+        assert engine.extract_metadata().field == "P2P"
+
+        engine.unload_schema()
+        assert engine.schema is None
+        with pytest.raises(ValueError, match="No schema loaded"):
+            engine.generate()
+
     def test_extract_metadata(self, terminal_io_path):
         """Test metadata extraction."""
         engine = GeneratorEngine()
@@ -3,11 +3,14 @@ Simple tests for ATOMiK SDK Generator Framework (no pytest required)
 """
 
 import sys
+import traceback
 from pathlib import Path
 
-# Add parent directory to path for imports
+# Standalone runs (python tests/test_*.py) bypass pytest's pythonpath
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from _schemas import EXAMPLES_DIR, schema_paths
+
 from generator.core import GeneratorConfig, GeneratorEngine
 from generator.namespace_mapper import NamespaceMapper
 from generator.schema_validator import SchemaValidator
@@ -100,8 +103,7 @@ def test_generator_engine():
     print("Testing GeneratorEngine...")
 
     # Get project root and test schema path
-    project_root = Path(__file__).parent.parent.parent.parent
-    schema_path = project_root / "sdk" / "schemas" / "examples" / "terminal-io.json"
+    schema_path = EXAMPLES_DIR / "terminal-io.json"
 
     if not schema_path.exists():
         print(f"  [WARN] Schema file not found: {schema_path}")
@@ -137,18 +139,15 @@ def test_example_schemas():
     """Test all example schemas validate."""
     print("Testing example schemas...")
 
-    project_root = Path(__file__).parent.parent.parent.parent
-    examples_dir = project_root / "sdk" / "schemas" / "examples"
-
-    if not examples_dir.exists():
-        print(f"  [WARN] Examples directory not found: {examples_dir}")
+    if not EXAMPLES_DIR.exists():
+        print(f"  [WARN] Examples directory not found: {EXAMPLES_DIR}")
         return
 
     validator = SchemaValidator()
 
-    examples = list(examples_dir.glob("*.json"))
+    examples = schema_paths(EXAMPLES_DIR)
     if not examples:
-        print(f"  [WARN] No example schemas found in {examples_dir}")
+        print(f"  [WARN] No example schemas found in {EXAMPLES_DIR}")
         return
 
     for example_path in examples:
@@ -192,7 +191,6 @@ def main():
         print()
         print("=" * 70)
         print(f"ERROR: {e}")
-        import traceback
         traceback.print_exc()
         print("=" * 70)
         return 1
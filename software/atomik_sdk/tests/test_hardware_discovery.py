@@ -7,11 +7,12 @@ hardware, Gowin EDA, or serial ports are needed.
 
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest import mock
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from hardware_discovery import (  # noqa: E402
+from hardware_discovery import (
     detect_board,
     detect_com_port,
     find_gowin_root,
@@ -126,7 +127,7 @@ class TestDetectBoard:
     def test_programmer_cli(self):
         """programmer_cli --scan-cables reports a cable."""
         fake_result = mock.MagicMock(
-            stdout="Cable found: USB Cable\nDevice: GW1NR-9C",
+            stdout=b"Cable found: USB Cable\nDevice: GW1NR-9C",
             returncode=0,
         )
         with (
@@ -142,7 +143,7 @@ class TestDetectBoard:
     def test_openfpga_fallback(self):
         """programmer_cli absent, openFPGALoader works."""
         fake_result = mock.MagicMock(
-            stdout="idcode 0x0100481b\nGW1NR-9C detected",
+            stdout=b"idcode 0x0100481b\nGW1NR-9C detected",
             returncode=0,
         )
         with (
@@ -155,53 +156,104 @@ class TestDetectBoard:
             result = detect_board()
             assert result == "tangnano9k"
 
+    def test_fallback_runs_after_first_probe(self):
+        """openFPGALoader only runs once programmer_cli has finished."""
+        results = [
+            mock.MagicMock(stdout=b"Scanning cables... none", returncode=0),
+            mock.MagicMock(stdout=b"GW1NR-9C detected", returncode=0),
+        ]
+        with (
+            mock.patch("hardware_discovery.find_tool", side_effect=lambda n, **kw: f"/bin/{n}"),
+            mock.patch("subprocess.run", side_effect=results) as mock_run,
+        ):
+            assert detect_board() == "tangnano9k"
+            assert [c.args[0][0] for c in mock_run.call_args_list] == [
+                "/bin/programmer_cli", "/bin/openFPGALoader",
+            ]
+
+    def test_fallback_skipped_when_cable_found(self):
+        """openFPGALoader is never started if programmer_cli matches."""
+        found = mock.MagicMock(stdout=b"Cable found: USB Cable", returncode=0)
+        with (
+            mock.patch("hardware_discovery.find_tool", side_effect=lambda n, **kw: f"/bin/{n}"),
+            mock.patch("subprocess.run", return_value=found) as mock_run,
+        ):
+            assert detect_board() == "tangnano9k"
+            mock_run.assert_called_once()
+
     def test_none_when_no_tools(self):
         """Both tools absent → returns None."""
-        with mock.patch("hardware_discovery.find_tool", return_value=None):
+        with (
+            mock.patch("hardware_discovery.find_tool", return_value=None),
+            mock.patch("subprocess.run") as mock_run,
+        ):
             assert detect_board() is None
+            mock_run.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
 # detect_com_port
 # ---------------------------------------------------------------------------
 
+_SERIAL_MODULE_NAMES = ("serial", "serial.tools", "serial.tools.list_ports")
+
+
+class _FakeListPorts:
+    """Plain-Python stand-in for ``serial.tools.list_ports``."""
+
+    def __init__(self):
+        self.ports = []
+
+    def comports(self):
+        return self.ports
+
+
+@pytest.fixture(scope="class")
+def fake_serial():
+    """Install a fake serial.tools.list_ports tree once per test class.
+
+    Tests only assign ``fake_serial.ports``; the previous ``sys.modules``
+    entries are restored when the class finishes.
+    """
+    fake_list_ports = _FakeListPorts()
+    fake_tools = SimpleNamespace(list_ports=fake_list_ports)
+    fakes = {
+        "serial": SimpleNamespace(tools=fake_tools),
+        "serial.tools": fake_tools,
+        "serial.tools.list_ports": fake_list_ports,
+    }
+    saved = {name: sys.modules.get(name) for name in _SERIAL_MODULE_NAMES}
+    sys.modules.update(fakes)
+    yield fake_list_ports
+    for name, module in saved.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+
+
 class TestDetectComPort:
-    @staticmethod
-    def _fake_serial_modules(ports):
-        """Build connected mock hierarchy for serial.tools.list_ports."""
-        fake_list_ports = mock.MagicMock()
-        fake_list_ports.comports.return_value = ports
-        fake_tools = mock.MagicMock()
-        fake_tools.list_ports = fake_list_ports
-        fake_serial = mock.MagicMock()
-        fake_serial.tools = fake_tools
-        return {
-            "serial": fake_serial,
-            "serial.tools": fake_tools,
-            "serial.tools.list_ports": fake_list_ports,
-        }
-
-    def test_ftdi_vid_pid(self):
+    def test_ftdi_vid_pid(self, fake_serial):
         """Port with FTDI VID:PID 0403:6010 is detected."""
-        port = mock.MagicMock()
-        port.vid = 0x0403
-        port.pid = 0x6010
-        port.device = "COM6"
-        port.description = "USB Serial Port"
-
-        with mock.patch.dict("sys.modules", self._fake_serial_modules([port])):
-            assert detect_com_port() == "COM6"
+        fake_serial.ports = [SimpleNamespace(
+            vid=0x0403, pid=0x6010, device="COM6", description="USB Serial Port",
+        )]
+        assert detect_com_port() == "COM6"
 
-    def test_keyword_fallback(self):
+    def test_keyword_fallback(self, fake_serial):
         """Port with 'FT2232' in description matched by keyword."""
-        port = mock.MagicMock()
-        port.vid = 0x1234
-        port.pid = 0x5678
-        port.device = "/dev/ttyUSB0"
-        port.description = "FT2232 Channel B"
-
-        with mock.patch.dict("sys.modules", self._fake_serial_modules([port])):
-            assert detect_com_port() == "/dev/ttyUSB0"
+        fake_serial.ports = [SimpleNamespace(
+            vid=0x1234, pid=0x5678, device="/dev/ttyUSB0", description="FT2232 Channel B",
+        )]
+        assert detect_com_port() == "/dev/ttyUSB0"
+
+    def test_vid_pid_preferred_over_keyword(self, fake_serial):
+        """VID:PID match wins even if a keyword match is listed first."""
+        fake_serial.ports = [
+            SimpleNamespace(vid=None, pid=None, device="COM3", description="Gowin debugger"),
+            SimpleNamespace(vid=0x0403, pid=0x6010, device="COM6", description="USB Serial Port"),
+        ]
+        assert detect_com_port() == "COM6"
 
     def test_no_pyserial(self):
         """If pyserial is not installed, returns None."""
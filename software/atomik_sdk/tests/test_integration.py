@@ -5,374 +5,180 @@ Tests cross-language consistency and semantic equivalence.
 Validates that all generators produce code with matching behavior.
 """
 
-import json
-import sys
-import tempfile
+import ast
+import re
 from pathlib import Path
 
 import pytest
+from _schemas import EXAMPLES_DIR, schema_paths
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from generator.c_generator import CGenerator
 from generator.core import GeneratorConfig, GeneratorEngine
-from generator.javascript_generator import JavaScriptGenerator
-from generator.python_generator import PythonGenerator
-from generator.rust_generator import RustGenerator
-from generator.verilog_generator import VerilogGenerator
+from pipeline.context.jsonio import loads as json_loads
+
+ALL_LANGUAGES = ['python', 'rust', 'c', 'verilog', 'javascript']
+
+
+def _make_engine(output_dir: Path) -> GeneratorEngine:
+    """Create an engine with every language generator registered.
+
+    The language generators are imported here rather than at module level
+    so tests that only need the engine do not pay for them.
+    """
+    from generator.c_generator import CGenerator
+    from generator.javascript_generator import JavaScriptGenerator
+    from generator.python_generator import PythonGenerator
+    from generator.rust_generator import RustGenerator
+    from generator.verilog_generator import VerilogGenerator
+
+    engine = GeneratorEngine(GeneratorConfig(
+        output_dir=output_dir,
+        validate_schemas=True,
+        verbose=False
+    ))
+    engine.register_generator('python', PythonGenerator())
+    engine.register_generator('rust', RustGenerator())
+    engine.register_generator('c', CGenerator())
+    engine.register_generator('verilog', VerilogGenerator())
+    engine.register_generator('javascript', JavaScriptGenerator())
+    return engine
+
+
+@pytest.fixture(scope="module")
+def output_root(tmp_path_factory):
+    """One temporary tree shared by every schema in this module."""
+    return tmp_path_factory.mktemp("integration")
 
 
-def test_cross_language_integration():
+@pytest.mark.parametrize("example_path", schema_paths(EXAMPLES_DIR), ids=lambda p: p.stem)
+def test_cross_language_integration(example_path, output_root):
     """Test that all languages generate consistent code from same schema."""
-    print("=" * 70)
-    print("ATOMiK SDK Integration Tests")
-    print("=" * 70)
-    print()
-
-    project_root = Path(__file__).parent.parent.parent.parent
-    examples_dir = project_root / "sdk" / "schemas" / "examples"
-
-    if not examples_dir.exists():
-        pytest.skip(f"Examples directory not found: {examples_dir}")
-
-    # Test each example schema
-    examples = list(examples_dir.glob("*.json"))
-    if not examples:
-        pytest.skip("No example schemas found")
-
-    all_passed = True
-
-    for example_path in examples:
-        print(f"Testing {example_path.name}...")
-        print("-" * 70)
-
-        # Load schema once
-        with open(example_path) as f:
-            schema = json.load(f)
-
-        catalogue = schema.get('catalogue', {})
-        vertical = catalogue.get('vertical', 'Unknown')
-        field = catalogue.get('field', 'Unknown')
-        obj = catalogue.get('object', 'Unknown')
-
-        print(f"  Schema: {vertical}/{field}/{obj}")
-        print(f"  Version: {catalogue.get('version', 'N/A')}")
-
-        # Create temporary output directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_dir = Path(temp_dir)
-
-            # Create engine with all generators
-            engine = GeneratorEngine(GeneratorConfig(
-                output_dir=output_dir,
-                validate_schemas=True,
-                verbose=False
-            ))
-
-            # Register all generators
-            engine.register_generator('python', PythonGenerator())
-            engine.register_generator('rust', RustGenerator())
-            engine.register_generator('c', CGenerator())
-            engine.register_generator('verilog', VerilogGenerator())
-            engine.register_generator('javascript', JavaScriptGenerator())
-
-            # Load schema
-            try:
-                validation = engine.load_schema(example_path)
-                if not validation.valid:
-                    print("  [FAIL] Schema validation failed:")
-                    for error in validation.errors:
-                        print(f"    - {error}")
-                    all_passed = False
-                    continue
-
-                print("  [PASS] Schema validated")
-
-                # Generate all languages
-                results = engine.generate(target_languages=[
-                    'python', 'rust', 'c', 'verilog', 'javascript'
-                ])
-
-                # Check all languages generated successfully
-                expected_languages = ['python', 'rust', 'c', 'verilog', 'javascript']
-                for lang in expected_languages:
-                    if lang not in results:
-                        print(f"  [FAIL] {lang} generation missing")
-                        all_passed = False
-                        continue
-
-                    result = results[lang]
-                    if not result.success:
-                        print(f"  [FAIL] {lang} generation errors:")
-                        for error in result.errors:
-                            print(f"    - {error}")
-                        all_passed = False
-                        continue
-
-                    print(f"  [PASS] {lang}: {len(result.files)} files")
-
-                # Write all files
-                files = engine.write_output(results)
-                print(f"  [PASS] Total files written: {len(files)}")
-
-                # Verify namespace consistency
-                namespace = engine.extract_metadata()
-                if namespace:
-                    print(f"  [INFO] Python: {namespace.python_import_statement}")
-                    print(f"  [INFO] Rust: {namespace.rust_use_statement}")
-                    print(f"  [INFO] C: {namespace.c_include_statement}")
-                    print(f"  [INFO] JavaScript: {namespace.javascript_require_statement}")
-                    print(f"  [INFO] Verilog: module {namespace.verilog_module_name}")
-                    print("  [PASS] Namespace mapping consistent")
-
-                # Check that all languages have consistent file counts
-                file_counts = {lang: len(results[lang].files) for lang in expected_languages}
-                print(f"  [INFO] File counts: {file_counts}")
-
-                # Verify key operations are present in generated files
-                operations_present = check_operations_present(output_dir, results)
-                if operations_present:
-                    print("  [PASS] All operations present in generated code")
-                else:
-                    print("  [WARN] Some operations may be missing")
-
-                print("  [PASS] Integration test successful")
-
-            except Exception as e:
-                print(f"  [FAIL] Exception: {e}")
-                import traceback
-                traceback.print_exc()
-                all_passed = False
-                continue
+    catalogue = json_loads(example_path.read_bytes()).get('catalogue', {})
+    assert catalogue.get('vertical') and catalogue.get('field') and catalogue.get('object')
 
-        print()
+    output_dir = output_root / example_path.stem
+    output_dir.mkdir()
+    engine = _make_engine(output_dir)
 
-    print("=" * 70)
-    if all_passed:
-        print("All integration tests PASSED")
-    else:
-        print("Some integration tests FAILED")
-    print("=" * 70)
+    validation = engine.load_schema(example_path)
+    if not validation.valid:
+        pytest.fail(f"Schema validation failed: {validation.errors}")
 
-    assert all_passed, "Some cross-language integration tests failed"
+    results = engine.generate(target_languages=ALL_LANGUAGES)
+    for lang in ALL_LANGUAGES:
+        if lang not in results:
+            pytest.fail(f"{lang} generation missing")
+        if not results[lang].success:
+            pytest.fail(f"{lang} generation errors: {results[lang].errors}")
 
+    files = engine.write_output(results)
+    assert files
 
-def check_operations_present(output_dir: Path, results: dict) -> bool:
-    """Verify that key operations are present in generated code."""
-    operations_to_check = ['load', 'accumulate', 'reconstruct']
-    all_present = True
-
-    # Check Python files
-    python_files = list(output_dir.glob("atomik/**/*.py"))
-    if python_files:
-        for pyfile in python_files:
-            if pyfile.name == '__init__.py':
-                continue
-            with open(pyfile) as f:
-                content = f.read().lower()
-                for op in operations_to_check:
-                    if op not in content:
-                        all_present = False
-
-    # Check Rust files
-    rust_files = list(output_dir.glob("src/**/*.rs"))
-    if rust_files:
-        for rsfile in rust_files:
-            if rsfile.name == 'lib.rs' or rsfile.name == 'mod.rs':
-                continue
-            with open(rsfile) as f:
-                content = f.read().lower()
-                for op in operations_to_check:
-                    if op not in content:
-                        all_present = False
-
-    # Check C files
-    c_files = list(output_dir.glob("atomik/**/*.c"))
-    if c_files:
-        for cfile in c_files:
-            with open(cfile) as f:
-                content = f.read().lower()
-                for op in operations_to_check:
-                    if op not in content:
-                        all_present = False
-
-    # Check Verilog files
-    verilog_files = list(output_dir.glob("rtl/**/*.v"))
-    if verilog_files:
-        for vfile in verilog_files:
-            if vfile.name.startswith('tb_'):
-                continue
-            with open(vfile) as f:
-                content = f.read().lower()
-                # Verilog uses different names
-                verilog_ops = ['load', 'accumulate', 'read']
-                for op in verilog_ops:
-                    if op not in content:
-                        all_present = False
-
-    # Check JavaScript files
-    js_files = list(output_dir.glob("src/**/*.js"))
-    if js_files:
-        for jsfile in js_files:
-            with open(jsfile) as f:
-                content = f.read().lower()
-                for op in operations_to_check:
-                    if op not in content:
-                        all_present = False
-
-    return all_present
-
-
-def test_schema_summary():
-    """Test schema summary generation."""
-    print("=" * 70)
-    print("Testing Schema Summary Generation")
-    print("=" * 70)
-    print()
+    namespace = engine.extract_metadata()
+    assert namespace is not None
+    assert namespace.python_import_statement
+    assert namespace.rust_use_statement
+    assert namespace.c_include_statement
+    assert namespace.javascript_require_statement
+    assert namespace.verilog_module_name
 
-    project_root = Path(__file__).parent.parent.parent.parent
-    examples_dir = project_root / "sdk" / "schemas" / "examples"
+    assert check_operations_present(output_dir, results), "operations missing from generated code"
 
-    if not examples_dir.exists():
-        pytest.skip("Examples directory not found")
 
-    examples = list(examples_dir.glob("*.json"))
-    if not examples:
-        pytest.skip("No example schemas found")
+def _operation_token_re(operations: frozenset) -> re.Pattern:
+    """Match *operations* as whole identifier tokens, case-insensitively.
 
-    for example_path in examples:
-        print(f"Schema: {example_path.name}")
-        print("-" * 70)
+    Underscores count as separators so ``atomik_terminal_io_load`` and
+    ``load_en`` contain ``load`` while ``overload`` and ``payload`` do not.
+    """
+    alternation = b"|".join(sorted(op.encode() for op in operations))
+    return re.compile(
+        rb"(?<![A-Za-z0-9])(" + alternation + rb")(?![A-Za-z0-9])", re.IGNORECASE
+    )
 
-        engine = GeneratorEngine(GeneratorConfig(verbose=False))
-        engine.load_schema(example_path)
 
-        summary = engine.get_schema_summary()
+_OPERATIONS = frozenset({'load', 'accumulate', 'reconstruct'})
+# Verilog uses different names
+_VERILOG_OPERATIONS = frozenset({'load', 'accumulate', 'read'})
 
-        print("  Catalogue:")
-        print(f"    Vertical: {summary['catalogue']['vertical']}")
-        print(f"    Field: {summary['catalogue']['field']}")
-        print(f"    Object: {summary['catalogue']['object']}")
-        print(f"    Version: {summary['catalogue']['version']}")
+_OPERATION_RE = _operation_token_re(_OPERATIONS)
+_VERILOG_OPERATION_RE = _operation_token_re(_VERILOG_OPERATIONS)
 
-        print(f"  Delta Fields: {len(summary['delta_fields'])}")
-        for field_name, field_spec in summary['delta_fields'].items():
-            print(f"    - {field_name}: {field_spec.get('type')} ({field_spec.get('width')} bits)")
 
-        print(f"  Operations: {', '.join(summary['operations'])}")
+def _python_operations(path: Path) -> set:
+    """Operation tokens appearing in the function names defined in *path*."""
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    return {
+        token
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        for token in node.name.lower().split('_')
+    }
 
-        if summary.get('has_hardware'):
-            print("  Hardware: Yes")
 
-        print()
+def _token_operations(path: Path, pattern: re.Pattern) -> set:
+    """Operation tokens matched by *pattern* in the raw bytes of *path*."""
+    return {match.lower().decode() for match in pattern.findall(path.read_bytes())}
 
-    print("=" * 70)
-    print("Schema summary tests complete")
-    print("=" * 70)
 
+def check_operations_present(output_dir: Path, results: dict) -> bool:
+    """Verify that key operations are present in generated code."""
+    checks = [
+        # (glob, files to skip, operations, token extractor)
+        ("atomik/**/*.py", {'__init__.py'}, _OPERATIONS, _python_operations),
+        ("src/**/*.rs", {'lib.rs', 'mod.rs'}, _OPERATIONS,
+         lambda path: _token_operations(path, _OPERATION_RE)),
+        ("atomik/**/*.c", set(), _OPERATIONS,
+         lambda path: _token_operations(path, _OPERATION_RE)),
+        ("rtl/**/*.v", set(), _VERILOG_OPERATIONS,
+         lambda path: _token_operations(path, _VERILOG_OPERATION_RE)),
+        ("src/**/*.js", set(), _OPERATIONS,
+         lambda path: _token_operations(path, _OPERATION_RE)),
+    ]
+
+    for pattern, skip, operations, extract in checks:
+        for path in output_dir.glob(pattern):
+            if path.name in skip or path.name.startswith('tb_'):
+                continue
+            if not operations <= extract(path):
+                return False
 
-def test_multi_language_generation():
-    """Test generating multiple languages simultaneously."""
-    print("=" * 70)
-    print("Testing Multi-Language Generation")
-    print("=" * 70)
-    print()
+    return True
+
+
+@pytest.mark.parametrize("example_path", schema_paths(EXAMPLES_DIR), ids=lambda p: p.stem)
+def test_schema_summary(example_path):
+    """Test schema summary generation."""
+    engine = GeneratorEngine(GeneratorConfig(verbose=False))
+    engine.load_schema(example_path)
 
-    project_root = Path(__file__).parent.parent.parent.parent
-    schema_path = project_root / "sdk" / "schemas" / "examples" / "terminal-io.json"
+    summary = engine.get_schema_summary()
+
+    for key in ('vertical', 'field', 'object', 'version'):
+        assert summary['catalogue'][key], f"catalogue.{key} missing"
+    assert summary['delta_fields']
+    for field_name, field_spec in summary['delta_fields'].items():
+        assert field_spec.get('type'), f"{field_name} has no type"
+    assert summary['operations']
+
+
+def test_multi_language_generation(tmp_path):
+    """Test generating multiple languages simultaneously."""
+    schema_path = EXAMPLES_DIR / "terminal-io.json"
 
     if not schema_path.exists():
         pytest.skip("terminal-io.json not found")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        output_dir = Path(temp_dir)
-
-        engine = GeneratorEngine(GeneratorConfig(
-            output_dir=output_dir,
-            validate_schemas=True,
-            verbose=False
-        ))
-
-        # Register all generators
-        engine.register_generator('python', PythonGenerator())
-        engine.register_generator('rust', RustGenerator())
-        engine.register_generator('c', CGenerator())
-        engine.register_generator('verilog', VerilogGenerator())
-        engine.register_generator('javascript', JavaScriptGenerator())
-
-        # Generate all languages at once
-        results, files = engine.generate_and_write(
-            schema_path,
-            target_languages=['python', 'rust', 'c', 'verilog', 'javascript']
-        )
-
-        print(f"Generated {len(files)} total files across 5 languages")
-
-        # Count files by language
-        file_extensions = {}
-        for file_path in files:
-            ext = Path(file_path).suffix
-            file_extensions[ext] = file_extensions.get(ext, 0) + 1
-
-        print("File breakdown:")
-        for ext, count in sorted(file_extensions.items()):
-            print(f"  {ext or 'no extension'}: {count} files")
-
-        print("[PASS] Multi-language generation successful")
-
-    print()
-    print("=" * 70)
-    print("Multi-language generation tests complete")
-    print("=" * 70)
-
-
-def main():
-    """Run all integration tests."""
-    print()
-    print("*" * 70)
-    print("ATOMiK SDK - COMPREHENSIVE INTEGRATION TEST SUITE")
-    print("*" * 70)
-    print()
-
-    exit_code = 0
-
-    # Test 1: Cross-language integration
-    try:
-        test_cross_language_integration()
-    except (SystemExit, KeyboardInterrupt):
-        raise
-    except Exception as e:
-        print(f"FAILED: {e}")
-        exit_code = 1
-
-    # Test 2: Schema summary
-    try:
-        test_schema_summary()
-    except (SystemExit, KeyboardInterrupt):
-        raise
-    except Exception as e:
-        print(f"FAILED: {e}")
-        exit_code = 1
-
-    # Test 3: Multi-language generation
-    try:
-        test_multi_language_generation()
-    except (SystemExit, KeyboardInterrupt):
-        raise
-    except Exception as e:
-        print(f"FAILED: {e}")
-        exit_code = 1
-
-    print()
-    print("*" * 70)
-    if exit_code == 0:
-        print("ALL INTEGRATION TESTS PASSED")
-    else:
-        print("SOME INTEGRATION TESTS FAILED")
-    print("*" * 70)
-
-    return exit_code
-
-
-if __name__ == "__main__":
-    sys.exit(main())
+    engine = _make_engine(tmp_path)
+
+    # Generate all languages at once
+    results, files = engine.generate_and_write(
+        schema_path,
+        target_languages=ALL_LANGUAGES
+    )
+
+    assert set(results) == set(ALL_LANGUAGES)
+    assert all(result.success for result in results.values())
+
+    extensions = {Path(file_path).suffix for file_path in files}
+    for ext in ('.py', '.rs', '.c', '.h', '.v', '.js'):
+        assert ext in extensions, f"no {ext} files generated"
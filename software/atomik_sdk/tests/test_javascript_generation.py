@@ -2,19 +2,91 @@
 Test JavaScript SDK generation
 """
 
+import functools
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import traceback
 from pathlib import Path
 
 import pytest
 
+# Standalone runs (python tests/test_*.py) bypass pytest's pythonpath
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from _schemas import EXAMPLES_DIR, schema_paths
+
 from generator.core import GeneratorConfig, GeneratorEngine
 from generator.javascript_generator import JavaScriptGenerator
 
 
+@functools.cache
+def _probe_node_version():
+    """Return the ``node --version`` string, or None if Node.js is unavailable.
+
+    Cached so the interpreter is spawned at most once per test session.
+    """
+    if shutil.which('node') is None:
+        return None
+    try:
+        node_version = subprocess.run(
+            ['node', '--version'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if node_version.returncode != 0:
+        return None
+    return node_version.stdout.strip()
+
+
+def _run_node_bounded(test_file, cwd, timeout=10, max_lines=10):
+    """Run a generated JS test file, keeping only its first output lines.
+
+    stdout and stderr are merged and drained line by line so the child never
+    blocks on a full pipe, but at most ``max_lines`` non-blank lines are
+    retained instead of buffering the whole output.
+
+    Returns:
+        Tuple of (returncode, retained lines).
+
+    Raises:
+        subprocess.TimeoutExpired: If the process runs longer than ``timeout``.
+    """
+    proc = subprocess.Popen(
+        ['node', str(test_file)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        cwd=cwd
+    )
+    timed_out = threading.Event()
+
+    def _kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    lines = []
+    try:
+        for line in proc.stdout:
+            if len(lines) < max_lines and line.strip():
+                lines.append(line.rstrip())
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(proc.args, timeout)
+    return returncode, lines
+
+
 def test_javascript_generation():
     """Test JavaScript code generation from example schemas."""
     print("=" * 70)
@@ -22,21 +94,21 @@ def test_javascript_generation():
     print("=" * 70)
     print()
 
-    project_root = Path(__file__).parent.parent.parent.parent
-    examples_dir = project_root / "sdk" / "schemas" / "examples"
-
-    if not examples_dir.exists():
-        pytest.skip(f"Examples directory not found: {examples_dir}")
+    if not EXAMPLES_DIR.exists():
+        pytest.skip(f"Examples directory not found: {EXAMPLES_DIR}")
 
     # Create temporary output directory
     with tempfile.TemporaryDirectory() as temp_dir:
         output_dir = Path(temp_dir)
 
         # Test each example schema
-        examples = list(examples_dir.glob("*.json"))
+        examples = schema_paths(EXAMPLES_DIR)
         if not examples:
             pytest.skip("No example schemas found")
 
+        # Probe Node.js once rather than per schema
+        node_version = _probe_node_version()
+
         for example_path in examples:
             print(f"Testing {example_path.name}...")
             print("-" * 70)
@@ -95,40 +167,24 @@ def test_javascript_generation():
 
                 # Check if node is available
                 try:
-                    node_version = subprocess.run(
-                        ['node', '--version'],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-
-                    if node_version.returncode == 0:
-                        print(f"  [INFO] Found: Node.js {node_version.stdout.strip()}")
+                    if node_version is not None:
+                        print(f"  [INFO] Found: Node.js {node_version}")
 
                         # Try to run the test file
                         test_files = list(output_dir.glob("test/*.test.js"))
                         if test_files:
                             test_file = test_files[0]
                             print("  [INFO] Running tests...")
-                            test_result = subprocess.run(
-                                ['node', str(test_file)],
-                                capture_output=True,
-                                text=True,
-                                timeout=10,
-                                cwd=output_dir
+                            returncode, output = _run_node_bounded(
+                                test_file, output_dir
                             )
 
-                            if test_result.returncode == 0:
+                            if returncode == 0:
                                 print("  [PASS] Tests executed successfully")
-                                for line in test_result.stdout.strip().split('\n'):
-                                    if line.strip():
-                                        print(f"    {line}")
                             else:
                                 print("  [WARN] Tests failed:")
-                                if test_result.stderr:
-                                    for line in test_result.stderr.split('\n')[:10]:
-                                        if line.strip():
-                                            print(f"    {line}")
+                            for line in output:
+                                print(f"    {line}")
                     else:
                         print("  [INFO] Node.js not available, skipping execution")
 
@@ -143,7 +199,6 @@ def test_javascript_generation():
 
             except Exception as e:
                 print(f"  [FAIL] Exception: {e}")
-                import traceback
                 traceback.print_exc()
                 continue
 
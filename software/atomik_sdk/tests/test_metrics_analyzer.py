@@ -1,18 +1,25 @@
 """Tests for cross-run metrics analyzer and regression detection."""
 
-import sys
-from pathlib import Path
 
+import numpy as np
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pipeline.analysis.metrics_analyzer import MetricsAnalyzer, TrendReport
 from pipeline.analysis.regression_detector import (
     RegressionDetector,
     RegressionSeverity,
 )
 
+try:
+    import pytest_benchmark  # noqa: F401
+    HAS_PYTEST_BENCHMARK = True
+except ImportError:
+    HAS_PYTEST_BENCHMARK = False
+
+requires_benchmark = pytest.mark.skipif(
+    not HAS_PYTEST_BENCHMARK, reason="pytest-benchmark not installed"
+)
+
 
 class TestMetricsAnalyzer:
     def test_moving_average(self):
@@ -27,6 +34,40 @@ class TestMetricsAnalyzer:
         std = analyzer.compute_std_dev(values)
         assert std == pytest.approx(0.0)
 
+    @pytest.mark.parametrize("n", [5, 1000, 100_000])
+    def test_window_stats_match_numpy(self, n):
+        rng = np.random.default_rng(n)
+        values = (rng.normal(250.0, 3.0, n)).tolist()
+        window = max(2, n // 2)
+        analyzer = MetricsAnalyzer(window=window)
+        recent = np.asarray(values[-window:])
+        assert analyzer.compute_moving_average(values) == pytest.approx(recent.mean())
+        assert analyzer.compute_std_dev(values) == pytest.approx(recent.std(ddof=1))
+
+    @requires_benchmark
+    def test_benchmark_moving_average(self, benchmark):
+        analyzer = MetricsAnalyzer(window=100)
+        values = [float(i) for i in range(10_000)]
+        avg = benchmark(analyzer.compute_moving_average, values)
+        assert avg == pytest.approx(9949.5)
+
+    @requires_benchmark
+    def test_benchmark_std_dev(self, benchmark):
+        analyzer = MetricsAnalyzer(window=100)
+        values = [float(i) for i in range(10_000)]
+        std = benchmark(analyzer.compute_std_dev, values)
+        assert std == pytest.approx(np.std(values[-100:], ddof=1))
+
+    @requires_benchmark
+    def test_benchmark_analyze(self, benchmark):
+        analyzer = MetricsAnalyzer(window=100)
+        history = [
+            {"fmax_mhz": 100.0 + i % 7, "tokens_consumed": 5000 - i % 11}
+            for i in range(10_000)
+        ]
+        report = benchmark(analyzer.analyze, history)
+        assert report.run_count == 10_000
+
     def test_analyze_trends(self):
         analyzer = MetricsAnalyzer(window=5)
         history = [
@@ -64,47 +105,28 @@ class TestMetricsAnalyzer:
 
 
 class TestRegressionDetector:
-    def test_no_regression(self):
+    @pytest.mark.parametrize(
+        "metric,baseline,current,severity",
+        [
+            ("fmax_mhz", 100, 100, None),
+            ("sim_tests_passed", 10, 8, RegressionSeverity.CRITICAL),
+            ("fmax_mhz", 100, 90, RegressionSeverity.WARNING),  # 10% drop
+            ("tokens_consumed", 1000, 1500, RegressionSeverity.INFO),  # 50% increase
+        ],
+        ids=["no_regression", "critical_test", "warning_hardware", "info_cost"],
+    )
+    def test_regression_severity(self, metric, baseline, current, severity):
         detector = RegressionDetector()
-        history = [{"fmax_mhz": 100}, {"fmax_mhz": 100}]
-        current = {"fmax_mhz": 100}
-        report = detector.detect(history, current)
-        assert report.count == 0
-        assert not report.has_critical
-
-    def test_critical_test_regression(self):
-        detector = RegressionDetector()
-        history = [{"sim_tests_passed": 10}, {"sim_tests_passed": 10}]
-        current = {"sim_tests_passed": 8}
-        report = detector.detect(history, current)
-        assert report.has_critical
-        critical = [
-            r for r in report.regressions
-            if r.severity == RegressionSeverity.CRITICAL
-        ]
-        assert len(critical) >= 1
-
-    def test_warning_hardware_regression(self):
-        detector = RegressionDetector()
-        history = [{"fmax_mhz": 100}, {"fmax_mhz": 100}]
-        current = {"fmax_mhz": 90}  # 10% drop
-        report = detector.detect(history, current)
-        warnings = [
-            r for r in report.regressions
-            if r.severity == RegressionSeverity.WARNING
-        ]
-        assert len(warnings) >= 1
-
-    def test_info_cost_regression(self):
-        detector = RegressionDetector()
-        history = [{"tokens_consumed": 1000}, {"tokens_consumed": 1000}]
-        current = {"tokens_consumed": 1500}  # 50% increase
-        report = detector.detect(history, current)
-        info = [
-            r for r in report.regressions
-            if r.severity == RegressionSeverity.INFO
-        ]
-        assert len(info) >= 1
+        history = [{metric: baseline}, {metric: baseline}]
+        report = detector.detect(history, {metric: current})
+        if severity is None:
+            assert report.count == 0
+            assert not report.has_critical
+            return
+        if severity == RegressionSeverity.CRITICAL:
+            assert report.has_critical
+        matching = [r for r in report.regressions if r.severity == severity]
+        assert len(matching) >= 1
 
     def test_empty_history(self):
         detector = RegressionDetector()
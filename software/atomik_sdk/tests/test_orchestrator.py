@@ -1,16 +1,53 @@
 """Tests for event-driven orchestrator and DAG scheduler."""
 
-import sys
-from pathlib import Path
+from collections import Counter
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pipeline.dag import CycleError, TaskDAG, TaskState
 from pipeline.event_bus import Event, EventBus, EventType
 
 
+class _CountingDict(dict):
+    """dict that counts key lookups and whole-dict scans."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.ops = Counter()
+
+    def __getitem__(self, key):
+        self.ops["lookup"] += 1
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.ops["lookup"] += 1
+        return super().get(key, default)
+
+    def __iter__(self):
+        self.ops["scan"] += 1
+        return super().__iter__()
+
+    def values(self):
+        self.ops["scan"] += 1
+        return super().values()
+
+    def items(self):
+        self.ops["scan"] += 1
+        return super().items()
+
+
+class _CountingList(list):
+    """list that counts how often it is iterated."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.scans = 0
+
+    def __iter__(self):
+        self.scans += 1
+        return super().__iter__()
+
+
 class TestTaskDAG:
     def test_add_task(self):
         dag = TaskDAG()
@@ -43,6 +80,65 @@ class TestTaskDAG:
         ready = dag.get_ready_tasks()
         assert len(ready) == 2
 
+    def test_ready_set_tracks_state_changes(self):
+        dag = TaskDAG()
+        dag.add_task("root", "stage")
+        dag.add_task("a", "stage", dependencies=["root"])
+        dag.add_task("b", "stage", dependencies=["root"])
+        dag.add_task("join", "stage", dependencies=["a", "b"])
+
+        dag.mark_completed("root")
+        assert [t.task_id for t in dag.get_ready_tasks()] == ["a", "b"]
+
+        dag.mark_running("a")
+        assert [t.task_id for t in dag.get_ready_tasks()] == ["b"]
+
+        dag.mark_completed("a")
+        dag.mark_skipped("b")
+        assert [t.task_id for t in dag.get_ready_tasks()] == ["join"]
+
+        # Reverting a dependency takes its dependents out of the ready set
+        dag.mark_failed("a")
+        assert dag.get_ready_tasks() == []
+
+    def test_ready_set_scales_linearly(self):
+        """Draining a 10k-task chain only revisits dependents of each completion."""
+        n = 10_000
+        dag = TaskDAG()
+        dag.add_task("t0", "stage")
+        for i in range(1, n):
+            dag.add_task(f"t{i}", "stage", dependencies=[f"t{i - 1}"])
+        dag._tasks = _CountingDict(dag._tasks)
+
+        completed = 0
+        ready = dag.get_ready_tasks()
+        while ready:
+            assert len(ready) == 1
+            dag.mark_completed(ready[0].task_id)
+            completed += 1
+            ready = dag.get_ready_tasks()
+
+        assert completed == n
+        assert dag.is_complete()
+        # A rescan per round trip would take ~n whole-graph passes; the
+        # incremental index makes a few passes in total (bottom levels and
+        # is_complete) plus a constant number of lookups per task
+        assert dag._tasks.ops["scan"] <= 10
+        assert dag._tasks.ops["lookup"] <= 10 * n
+
+    def test_ready_tasks_critical_path_first(self):
+        dag = TaskDAG()
+        dag.add_task("root", "stage")
+        dag.add_task("short", "stage", dependencies=["root"])
+        dag.add_task("long", "stage", dependencies=["root"])
+        dag.add_task("long_tail", "stage", dependencies=["long"])
+        dag.add_task("join", "stage", dependencies=["short", "long_tail"])
+
+        dag.mark_completed("root")
+        ready = dag.get_ready_tasks()
+        assert [t.task_id for t in ready] == ["long", "short"]
+        assert [t.bottom_level for t in ready] == [3, 2]
+
     def test_unknown_dependency_rejected(self):
         dag = TaskDAG()
         with pytest.raises(ValueError, match="Unknown dependency"):
@@ -91,6 +187,24 @@ class TestEventBus:
         assert len(bus.get_history()) == 2
         assert len(bus.get_history(EventType.TASK_STARTED)) == 1
 
+    def test_history_filter_is_o1(self):
+        bus = EventBus()
+        for i in range(100_000):
+            event_type = EventType.TASK_STARTED if i % 10_000 == 0 else EventType.TASK_READY
+            bus.emit(Event(event_type, {"i": i}, timestamp="t"))
+        bus._history = _CountingList(bus._history)
+
+        for _ in range(100):
+            started = bus.get_history(EventType.TASK_STARTED)
+
+        assert [e.payload["i"] for e in started] == list(range(0, 100_000, 10_000))
+        # Filtered reads come from the per-type index, never the full history
+        assert bus._history.scans == 0
+        assert len(bus.get_history()) == 100_000
+
+        bus.clear_history()
+        assert bus.get_history(EventType.TASK_STARTED) == []
+
     def test_unsubscribe(self):
         bus = EventBus()
         received = []
@@ -1,26 +1,53 @@
 """Tests for parallel task execution."""
 
-import sys
-from pathlib import Path
+import functools
+import itertools
+import multiprocessing
+import os
+import threading
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from pipeline.parallel.decomposer import ParallelTask, TaskDecomposer
+from pipeline.parallel.decomposer import ALL_LANGUAGES, ParallelTask, TaskDecomposer
 from pipeline.parallel.executor import ParallelExecutor
 from pipeline.parallel.worker import Worker, WorkerState
 
+_BACKENDS = ["thread", "process"]
 
-class TestTaskDecomposer:
-    def test_decompose_generation(self):
-        decomposer = TaskDecomposer()
-        plan = decomposer.decompose_generation()
-        assert plan.task_count == 5
-        assert plan.max_parallelism == 5
 
-    def test_decompose_generation_subset(self):
-        decomposer = TaskDecomposer()
-        plan = decomposer.decompose_generation(["python", "rust"])
-        assert plan.task_count == 2
+def _barrier_worker(barrier, task):
+    """Block until every task is running; module-level so it pickles."""
+    barrier.wait(timeout=60)
+    return os.getpid(), threading.get_ident()
+
+
+def _id_worker(task):
+    return f"done_{task.task_id}"
+
+
+def _failing_worker(task):
+    if task.task_id == "bad":
+        raise RuntimeError("generation failed")
+    return "ok"
+
+
+class TestTaskDecomposer:
+    @pytest.mark.parametrize(
+        "subset",
+        [None] + [
+            list(c)
+            for r in range(1, len(ALL_LANGUAGES) + 1)
+            for c in itertools.combinations(ALL_LANGUAGES, r)
+        ],
+        ids=lambda subset: "all" if subset is None else "-".join(subset),
+    )
+    def test_decompose_generation(self, subset):
+        plan = TaskDecomposer().decompose_generation(subset)
+        expected = subset or ALL_LANGUAGES
+        assert plan.task_count == len(expected)
+        assert plan.max_parallelism == len(expected)
+        assert [t.language for t in plan.tasks] == expected
+        assert plan.parallel_groups == [[f"gen_{lang}" for lang in expected]]
 
     def test_decompose_verification(self):
         decomposer = TaskDecomposer()
@@ -35,11 +62,6 @@ class TestTaskDecomposer:
         assert plan.task_count >= 12
         assert len(plan.parallel_groups) == 5
 
-    def test_parallel_groups(self):
-        decomposer = TaskDecomposer()
-        plan = decomposer.decompose_generation(["python", "rust", "c"])
-        assert plan.max_parallelism == 3
-
 
 class TestParallelExecutor:
     def test_execute_tasks(self):
@@ -72,6 +94,52 @@ class TestParallelExecutor:
         results = executor.execute([], lambda t: None)
         assert len(results.results) == 0
 
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="backend"):
+            ParallelExecutor(backend="gpu")
+
+    @pytest.mark.parametrize("backend", _BACKENDS)
+    def test_backend_results(self, backend):
+        executor = ParallelExecutor(max_workers=2, backend=backend)
+        tasks = [ParallelTask(task_id=t, task_type="generate") for t in "abc"]
+        results = executor.execute(tasks, _id_worker)
+        assert results.all_success
+        assert sorted(r.result for r in results.results) == [
+            "done_a", "done_b", "done_c",
+        ]
+
+    @pytest.mark.parametrize("backend", _BACKENDS)
+    def test_backend_partial_failure(self, backend):
+        executor = ParallelExecutor(max_workers=2, backend=backend)
+        tasks = [
+            ParallelTask(task_id="good", task_type="generate"),
+            ParallelTask(task_id="bad", task_type="generate"),
+        ]
+        results = executor.execute(tasks, _failing_worker)
+        assert [f.task_id for f in results.failures] == ["bad"]
+        assert "generation failed" in results.failures[0].error
+
+    @pytest.mark.parametrize("backend", _BACKENDS)
+    def test_tasks_run_concurrently(self, backend):
+        """All tasks are in flight at once, each on its own worker.
+
+        The shared barrier only opens once every task has reached it, so
+        an executor that ran tasks one at a time would break it.
+        """
+        n_tasks = 4
+        executor = ParallelExecutor(max_workers=n_tasks, backend=backend)
+        tasks = [
+            ParallelTask(task_id=f"t{i}", task_type="generate")
+            for i in range(n_tasks)
+        ]
+
+        with multiprocessing.Manager() as manager:
+            barrier = manager.Barrier(n_tasks)
+            results = executor.execute(tasks, functools.partial(_barrier_worker, barrier))
+
+        assert results.all_success
+        assert len({r.result for r in results.results}) == n_tasks
+
 
 class TestWorker:
     def test_worker_creation(self):
@@ -9,15 +9,37 @@ Tests cover:
 - Cross-session state persistence
 """
 
-import sys
+import hashlib
+import json
+import pickle
 from pathlib import Path
+from unittest import mock
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
+from pipeline.context import jsonio
 from pipeline.context.cache import ArtifactCache
 from pipeline.context.checkpoint import Checkpoint
 from pipeline.context.manifest import PipelineManifest
 
+try:
+    import pyfakefs  # noqa: F401
+    HAS_PYFAKEFS = True
+except ImportError:
+    HAS_PYFAKEFS = False
+
+
+@pytest.fixture
+def context_dir(request, tmp_path):
+    """Directory for cache/checkpoint files, in memory when pyfakefs is installed.
+
+    Tests that must exercise real disk I/O use ``tmp_path`` directly.
+    """
+    if not HAS_PYFAKEFS:
+        return tmp_path
+    fs = request.getfixturevalue("fs")
+    return Path(fs.create_dir("/atomik").path)
+
 
 class TestPipelineManifest:
     def test_create_manifest(self):
@@ -67,6 +89,29 @@ class TestPipelineManifest:
         assert "video" in loaded.schemas
         assert loaded.token_ledger["session_total"] == 500
 
+    def test_save_is_byte_stable(self, context_dir):
+        manifest = PipelineManifest()
+        manifest.register_schema("video", "abc123", "/video.json", "V.S.H264")
+        manifest.register_schema("sensor", "def456", "/sensor.json", "S.I.IMU")
+
+        first = context_dir / "first.json"
+        second = context_dir / "second.json"
+        manifest.save(first)
+        PipelineManifest.load(first).save(second)
+        assert first.read_bytes() == second.read_bytes()
+
+    @pytest.mark.skipif(not jsonio.HAS_ORJSON, reason="orjson not installed")
+    def test_orjson_matches_stdlib_layout(self):
+        state = {
+            "schemas": {"video": {"content_hash": "h1", "files": 19}},
+            "metrics_history": [{"ratio": 0.5, "name": "Δ-stream"}],
+            "version": "2.0",
+        }
+        fast = jsonio.dumps(state)
+        with mock.patch.object(jsonio, "HAS_ORJSON", False):
+            assert jsonio.dumps(state) == fast
+            assert jsonio.loads(fast) == state
+
 
 class TestArtifactCache:
     def test_create_cache(self, tmp_path):
@@ -80,64 +125,130 @@ class TestArtifactCache:
         assert h1 == h2
         assert h1 != h3
 
-    def test_put_and_get(self, tmp_path):
-        cache = ArtifactCache(tmp_path / "cache")
-        data = {"key": "value", "count": 42}
-        cache.put("schema1", "result", data, schema_hash="abc")
-
-        retrieved = cache.get("schema1", "result")
-        assert retrieved is not None
-        assert retrieved["key"] == "value"
-        assert retrieved["count"] == 42
-
-    def test_get_nonexistent(self, tmp_path):
-        cache = ArtifactCache(tmp_path / "cache")
-        assert cache.get("nonexistent", "key") is None
-
-    def test_invalidate(self, tmp_path):
-        cache = ArtifactCache(tmp_path / "cache")
-        cache.put("schema1", "result", {"data": 1})
-        cache.invalidate("schema1")
-        assert cache.get("schema1", "result") is None
-
-    def test_is_valid(self, tmp_path):
-        cache = ArtifactCache(tmp_path / "cache")
+    def test_content_hash_matches_sha256(self):
+        expected = hashlib.sha256(b"hello").hexdigest()
+        assert ArtifactCache.content_hash("hello") == expected
+        assert ArtifactCache.content_hash(b"hello") == expected
+
+    @pytest.mark.parametrize("file_digest", [True, False], ids=["file_digest", "chunked"])
+    def test_file_hash_matches_sha256(self, tmp_path, file_digest):
+        if file_digest and not hasattr(hashlib, "file_digest"):
+            pytest.skip("hashlib.file_digest requires Python 3.11+")
+        data = bytes(range(256)) * 1024
+        path = tmp_path / f"payload_{file_digest}.bin"
+        path.write_bytes(data)
+        with mock.patch("pipeline.context.cache._HAS_FILE_DIGEST", file_digest):
+            assert ArtifactCache.file_hash(path) == hashlib.sha256(data).hexdigest()
+
+    def test_file_hash_tracks_modification(self, tmp_path):
+        path = tmp_path / "schema.json"
+        path.write_text("{}")
+        first = ArtifactCache.file_hash(path)
+        with mock.patch("hashlib.sha256", wraps=hashlib.sha256) as sha256:
+            assert ArtifactCache.file_hash(path) == first
+        assert sha256.call_count == 0
+
+        path.write_text('{"changed": true}')
+        assert ArtifactCache.file_hash(path) != first
+
+    @pytest.mark.parametrize(
+        "ops,queries",
+        [
+            (
+                [("put", "schema1", "result", {"key": "value", "count": 42})],
+                [("schema1", "result", {"key": "value", "count": 42})],
+            ),
+            ([], [("nonexistent", "key", None)]),
+            (
+                [("put", "schema1", "result", {"data": 1}), ("invalidate", "schema1")],
+                [("schema1", "result", None)],
+            ),
+            (
+                [("put", "s1", "r1", {"a": 1}), ("put", "s2", "r2", {"b": 2}), ("clear",)],
+                [("s1", "r1", None), ("s2", "r2", None)],
+            ),
+        ],
+        ids=["put_and_get", "get_nonexistent", "invalidate", "clear"],
+    )
+    @pytest.mark.parametrize("serializer", ["json", "pickle"])
+    def test_operations(self, context_dir, ops, queries, serializer):
+        cache = ArtifactCache(context_dir / "cache", serializer=serializer)
+        for method, *args in ops:
+            getattr(cache, method)(*args)
+        for schema_name, key, expected in queries:
+            assert cache.get(schema_name, key) == expected
+
+    def test_pickle_preserves_types(self, context_dir):
+        cache = ArtifactCache(context_dir / "cache", serializer="pickle")
+        data = {"files": ("a.py", "b.rs"), "ids": {1, 2}, "blob": b"\x00\x01"}
+        cache.put("schema1", "result", data)
+        assert cache.get("schema1", "result") == data
+
+    def test_reads_entries_from_other_serializer(self, context_dir):
+        cache_dir = context_dir / "cache"
+        ArtifactCache(cache_dir, serializer="json").put("s", "k", {"v": 1})
+
+        cache = ArtifactCache(cache_dir, serializer="pickle")
+        assert cache.get("s", "k") == {"v": 1}
+        cache.put("s", "k", {"v": 2})
+        assert cache.get("s", "k") == {"v": 2}
+        assert not (cache_dir / "s_k.json").exists()
+
+    def test_json_cache_never_unpickles(self, context_dir):
+        cache_dir = context_dir / "cache"
+        ArtifactCache(cache_dir, serializer="pickle").put("s", "k", {"v": 1})
+
+        cache = ArtifactCache(cache_dir)
+        assert cache.serializer == "json"
+        assert cache.get("s", "k") is None
+
+    def test_index_serializer_field_is_ignored(self, context_dir):
+        cache_dir = context_dir / "cache"
+        cache = ArtifactCache(cache_dir)
+        cache.put("s", "k", {"v": 1})
+        # A tampered index cannot make a JSON cache unpickle its file
+        (cache_dir / "s_k.json").write_bytes(pickle.dumps({"v": 2}))
+        index = json.loads((cache_dir / "cache_index.json").read_text())
+        index["s"]["k"]["serializer"] = "pickle"
+        (cache_dir / "cache_index.json").write_text(json.dumps(index))
+
+        with pytest.raises(ValueError):
+            ArtifactCache(cache_dir).get("s", "k")
+
+    def test_unknown_serializer(self, context_dir):
+        with pytest.raises(ValueError, match="serializer"):
+            ArtifactCache(context_dir / "cache", serializer="yaml")
+
+    def test_is_valid(self, context_dir):
+        cache = ArtifactCache(context_dir / "cache")
         cache.put("schema1", "result", {"data": 1}, schema_hash="hash1")
         assert cache.is_valid("schema1", "hash1")
         assert not cache.is_valid("schema1", "hash2")
 
-    def test_clear(self, tmp_path):
-        cache = ArtifactCache(tmp_path / "cache")
-        cache.put("s1", "r1", {"a": 1})
-        cache.put("s2", "r2", {"b": 2})
-        cache.clear()
-        assert cache.get("s1", "r1") is None
-        assert cache.get("s2", "r2") is None
-
 
 class TestCheckpoint:
     def test_create_checkpoint(self, tmp_path):
         cp = Checkpoint(tmp_path)
         assert cp.to_dict()["version"] == "2.0"
 
-    def test_update_and_query_schema(self, tmp_path):
-        cp = Checkpoint(tmp_path)
+    def test_update_and_query_schema(self, context_dir):
+        cp = Checkpoint(context_dir)
         cp.update_schema("test", "hash123", {"python": "abc"})
 
         assert cp.get_schema_hash("test") == "hash123"
         assert cp.is_current("test", "hash123")
         assert not cp.is_current("test", "different")
 
-    def test_save_and_reload(self, tmp_path):
-        cp1 = Checkpoint(tmp_path)
+    def test_save_and_reload(self, context_dir):
+        cp1 = Checkpoint(context_dir)
         cp1.update_schema("video", "h1", metrics={"files": 19})
 
         # Reload from same directory
-        cp2 = Checkpoint(tmp_path)
+        cp2 = Checkpoint(context_dir)
         assert cp2.get_schema_hash("video") == "h1"
 
-    def test_metrics_history(self, tmp_path):
-        cp = Checkpoint(tmp_path)
+    def test_metrics_history(self, context_dir):
+        cp = Checkpoint(context_dir)
         cp.append_metrics("video", {"tokens": 0, "files": 19})
         cp.append_metrics("sensor", {"tokens": 0, "files": 19})
         cp.save()
@@ -149,8 +260,8 @@ class TestCheckpoint:
         assert len(video_history) == 1
         assert video_history[0]["tokens"] == 0
 
-    def test_nonexistent_schema(self, tmp_path):
-        cp = Checkpoint(tmp_path)
+    def test_nonexistent_schema(self, context_dir):
+        cp = Checkpoint(context_dir)
         assert cp.get_schema_hash("nonexistent") is None
         assert not cp.is_current("nonexistent", "any")
 
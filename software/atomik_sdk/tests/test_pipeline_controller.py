@@ -11,13 +11,10 @@ Tests cover:
 - Pipeline status reporting
 """
 
-import sys
 from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pipeline.controller import Pipeline, PipelineConfig, PipelineResult
 from pipeline.stages.diff import DiffStage
 from pipeline.stages.generate import GenerateStage
@@ -47,8 +44,25 @@ def domain_schemas_dir(project_root):
     return project_root / "sdk" / "schemas" / "domains"
 
 
+@pytest.fixture(scope="session")
+def pipeline_stages():
+    """Stage instances built once and shared by every pipeline fixture.
+
+    Stages keep all per-run state on the manifest, so reusing them across
+    tests is safe.
+    """
+    return (
+        ValidateStage(),
+        DiffStage(),
+        GenerateStage(),
+        VerifyStage(),
+        HardwareStage(),
+        MetricsStage(),
+    )
+
+
 @pytest.fixture
-def pipeline_with_stages(tmp_path):
+def pipeline_with_stages(tmp_path, pipeline_stages):
     """Pipeline with all stages registered and temp output."""
     config = PipelineConfig(
         output_dir=str(tmp_path / "generated"),
@@ -57,12 +71,8 @@ def pipeline_with_stages(tmp_path):
         verbose=False,
     )
     pipeline = Pipeline(config)
-    pipeline.register_stage(ValidateStage())
-    pipeline.register_stage(DiffStage())
-    pipeline.register_stage(GenerateStage())
-    pipeline.register_stage(VerifyStage())
-    pipeline.register_stage(HardwareStage())
-    pipeline.register_stage(MetricsStage())
+    for stage in pipeline_stages:
+        pipeline.register_stage(stage)
     return pipeline
 
 
@@ -9,21 +9,39 @@ Tests cover:
 - Validation level progression
 """
 
-import sys
+import json
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pipeline.stages.hardware import HardwareStage
 
 
+@dataclass(frozen=True)
+class _Cfg:
+    """Pipeline config stand-in with the attributes HardwareStage reads."""
+    sim_only: bool = False
+    skip_synthesis: bool = False
+    output_dir: str = ""
+    com_port: Optional[str] = None
+
+
 @pytest.fixture
 def hw_stage():
     return HardwareStage()
 
 
+@pytest.fixture(scope="session")
+def canonical_gen_dir(tmp_path_factory):
+    """Generated-RTL directory shared by tests that only read it."""
+    out_dir = tmp_path_factory.mktemp("generated")
+    (out_dir / "test.v").write_text("module t;\nendmodule\n")
+    (out_dir / "tb_test.v").write_text("module tb;\ninitial $finish;\nendmodule\n")
+    return out_dir
+
+
 @pytest.fixture
 def project_root():
     return Path(__file__).parent.parent.parent.parent
@@ -39,57 +57,33 @@ class TestHardwareStage:
         assert baseline["lut_pct"] == 7
         assert baseline["ff_pct"] == 9
         assert baseline["tests_passed"] == 10
+        with pytest.raises(TypeError):
+            baseline["fmax_mhz"] = 0
 
     def test_no_verilog_files(self, hw_stage, tmp_path):
         """Stage should warn when no Verilog files found."""
         empty_dir = tmp_path / "generated"
         empty_dir.mkdir()
 
-        config = type("Config", (), {
-            "sim_only": False,
-            "skip_synthesis": False,
-            "output_dir": str(empty_dir),
-            "com_port": None,
-        })()
+        config = _Cfg(sim_only=False, skip_synthesis=False, output_dir=str(empty_dir))
 
         manifest = hw_stage.execute({}, "test.json", None, config)
 
         assert any("no verilog" in w.lower() for w in manifest.warnings)
         assert manifest.validation_level == "no_rtl"
 
-    def test_verilog_file_discovery(self, hw_stage, tmp_path):
+    def test_verilog_file_discovery(self, hw_stage, canonical_gen_dir):
         """Stage should find Verilog files in output directory."""
-        out_dir = tmp_path / "generated"
-        out_dir.mkdir()
-        (out_dir / "module.v").write_text("module test;\nendmodule\n")
-        (out_dir / "tb_module.v").write_text(
-            "module tb_test;\ninitial $finish;\nendmodule\n"
-        )
-
-        config = type("Config", (), {
-            "sim_only": True,
-            "skip_synthesis": True,
-            "output_dir": str(out_dir),
-            "com_port": None,
-        })()
+        config = _Cfg(sim_only=True, skip_synthesis=True, output_dir=str(canonical_gen_dir))
 
         manifest = hw_stage.execute({}, "test.json", None, config)
 
         # Should find the files (simulation may or may not be available)
         assert manifest.tokens_consumed == 0
 
-    def test_sim_only_mode(self, hw_stage, tmp_path):
+    def test_sim_only_mode(self, hw_stage, canonical_gen_dir):
         """sim_only should skip synthesis and programming."""
-        out_dir = tmp_path / "generated"
-        out_dir.mkdir()
-        (out_dir / "test.v").write_text("module t;\nendmodule\n")
-
-        config = type("Config", (), {
-            "sim_only": True,
-            "skip_synthesis": False,
-            "output_dir": str(out_dir),
-            "com_port": None,
-        })()
+        config = _Cfg(sim_only=True, skip_synthesis=False, output_dir=str(canonical_gen_dir))
 
         manifest = hw_stage.execute({}, "test.json", None, config)
 
@@ -101,32 +95,18 @@ class TestHardwareStage:
         out_dir = tmp_path / "generated"
         out_dir.mkdir()
 
-        config = type("Config", (), {
-            "sim_only": True,
-            "skip_synthesis": True,
-            "output_dir": str(out_dir),
-            "com_port": None,
-        })()
+        config = _Cfg(sim_only=True, skip_synthesis=True, output_dir=str(out_dir))
 
         manifest = hw_stage.execute({}, "test.json", None, config)
         assert manifest.tokens_consumed == 0
 
-    def test_baseline_included_in_metrics(self, hw_stage, tmp_path):
+    def test_baseline_included_in_metrics(self, hw_stage, canonical_gen_dir):
         """Phase 3 baseline should be in metrics when hardware runs."""
-        out_dir = tmp_path / "generated"
-        out_dir.mkdir()
-        (out_dir / "test.v").write_text("module t;\nendmodule\n")
-        (out_dir / "tb_test.v").write_text("module tb;\ninitial $finish;\nendmodule\n")
-
-        config = type("Config", (), {
-            "sim_only": True,
-            "skip_synthesis": False,
-            "output_dir": str(out_dir),
-            "com_port": None,
-        })()
+        config = _Cfg(sim_only=True, skip_synthesis=False, output_dir=str(canonical_gen_dir))
 
         manifest = hw_stage.execute({}, "test.json", None, config)
 
         baseline = manifest.metrics.get("phase3_baseline")
         assert baseline is not None
         assert baseline["fmax_mhz"] == 94.9
+        assert json.loads(json.dumps(manifest.to_dict()))["metrics"]["phase3_baseline"] == baseline
@@ -11,16 +11,12 @@ Tests cover:
 """
 
 import json
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pipeline.metrics.collector import MetricsCollector
 from pipeline.metrics.hardware_bench import HardwareBenchmark
-from pipeline.metrics.pipeline_bench import PipelineBenchmark
+from pipeline.metrics.pipeline_bench import PipelineBenchmark, PipelineRun
 from pipeline.metrics.reporter import MetricsReporter
 
 
@@ -37,6 +33,28 @@ class TestMetricsCollector:
         assert entries[0]["name"] == "test_metric"
         assert entries[0]["value"] == 42
 
+    def test_record_many(self):
+        metrics = [
+            ("lut_pct", 7, "%", "synthesis", "hardware"),
+            ("fmax", 94.9, "MHz", "synthesis", "hardware"),
+            ("tokens", 0),
+        ]
+        looped = MetricsCollector()
+        for entry in metrics:
+            looped.record(*entry)
+        batched = MetricsCollector()
+        batched.record_many(metrics)
+        batched.record_many([{"name": "tests_passed", "value": 10, "category": "quality"}])
+
+        entries = batched.get_all()
+        assert len(entries) == 4
+        strip = [{k: v for k, v in e.items() if k != "timestamp"} for e in entries]
+        assert strip[:3] == [
+            {k: v for k, v in e.items() if k != "timestamp"} for e in looped.get_all()
+        ]
+        assert len({e["timestamp"] for e in entries[:3]}) == 1
+        assert batched.get_summary()["quality"] == {"tests_passed": 10}
+
     def test_record_pipeline(self):
         collector = MetricsCollector()
         collector.record_pipeline(tokens=0, time_ms=100)
@@ -66,15 +84,19 @@ class TestMetricsCollector:
         c1 = MetricsCollector()
         c1.record("a", 1)
         c2 = MetricsCollector()
-        c2.record("b", 2)
+        c2.record("b", 2, category="quality")
         c1.merge(c2)
         assert len(c1.get_all()) == 2
+        assert [e.name for e in c1.get_by_category("quality")] == ["b"]
+        c1.merge(c1)
+        assert len(c1.get_by_category("pipeline")) == 2
 
     def test_clear(self):
         collector = MetricsCollector()
         collector.record("a", 1)
         collector.clear()
         assert len(collector.get_all()) == 0
+        assert collector.get_by_category("pipeline") == []
 
 
 class TestHardwareBenchmark:
@@ -89,6 +111,16 @@ class TestHardwareBenchmark:
         assert metrics["latency_ns"] > 0
         assert metrics["throughput_gbps"] > 0
 
+    def test_runtime_metrics_fresh_dict_each_call(self):
+        bench = HardwareBenchmark()
+        first = bench.compute_runtime_metrics(fmax_mhz=94.9, data_width=64)
+        second = bench.compute_runtime_metrics(fmax_mhz=94.9, data_width=64)
+        assert first == second
+        assert first is not second
+        first["latency_ns"] = 0
+        assert json.loads(json.dumps(second)) == second
+        assert len(bench.collector.get_by_category("runtime")) == 6
+
     def test_phase3_comparison(self):
         bench = HardwareBenchmark()
         current = {"fmax_mhz": 95.0, "lut_pct": 8}
@@ -136,6 +168,23 @@ class TestPipelineBenchmark:
         assert metrics["token_efficiency_pct"] == pytest.approx(83.3, abs=0.1)
         assert metrics["cost_per_line"] == pytest.approx(2.35, abs=0.01)
 
+    def test_record_matches_record_run(self):
+        fields = dict(
+            schema_name="test",
+            total_time_ms=5000,
+            tokens_consumed=2000,
+            tokens_saved=10000,
+            files_generated=19,
+            lines_generated=850,
+            self_corrections=1,
+            self_correction_successes=1,
+            diff_type="incremental",
+        )
+        from_tuple = PipelineBenchmark().record(PipelineRun(**fields))
+        assert from_tuple == PipelineBenchmark().record_run(**fields)
+        assert from_tuple == PipelineBenchmark().record_run(*fields.values())
+        assert from_tuple["diff_type"] == "incremental"
+
     def test_compare_schemas(self):
         bench = PipelineBenchmark()
         runs = [
@@ -207,3 +256,23 @@ class TestMetricsReporter:
         history = reporter.read_csv_history(csv_path)
         assert len(history) == 2
         assert history[0]["schema"] == "video"
+
+        rows = reporter.iter_csv_history(csv_path)
+        assert next(rows) == {"schema": "video", "tokens": "0"}
+        assert [row["schema"] for row in rows] == ["sensor"]
+        assert list(reporter.iter_csv_history(tmp_path / "missing.csv")) == []
+
+        columns = reporter.read_csv_history_columnar(csv_path)
+        assert columns == {"schema": ("video", "sensor"), "tokens": ("0", "0")}
+        assert reporter.read_csv_history_columnar(tmp_path / "missing.csv") == {}
+
+    def test_csv_history_columnar_edge_cases(self, tmp_path):
+        reporter = MetricsReporter()
+        header_only = tmp_path / "header.csv"
+        header_only.write_text("schema,tokens\n")
+        assert reporter.read_csv_history_columnar(header_only) == {"schema": (), "tokens": ()}
+
+        ragged = tmp_path / "ragged.csv"
+        ragged.write_text("schema,tokens\nvideo,0\nsensor\n")
+        columns = reporter.read_csv_history_columnar(ragged)
+        assert columns["tokens"] == ("0", None)
@@ -9,18 +9,21 @@ Tests cover:
 - Verification manifest generation
 """
 
-import sys
-from pathlib import Path
+from dataclasses import dataclass
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pipeline.agents.self_correct import SelfCorrector
 from pipeline.stages import StageManifest
 from pipeline.stages.verify import VerifyStage
 
 
+@dataclass(frozen=True)
+class _Cfg:
+    """Pipeline config stand-in with the attributes VerifyStage reads."""
+    output_dir: str = ""
+
+
 @pytest.fixture
 def verify_stage():
     return VerifyStage()
@@ -34,14 +37,12 @@ class TestVerifyStage:
         """Valid Python files should pass verification."""
         py_dir = tmp_path / "generated"
         py_dir.mkdir()
-        (py_dir / "module.py").write_text(
-            "class Delta:\n    def __init__(self):\n        self.value = 0\n"
-        )
+        (py_dir / "module.py").write_text("class Delta:\n    def __init__(self):\n        self.value = 0\n")
 
         prev = StageManifest(stage="generate")
         prev.metrics["languages_generated"] = ["python"]
 
-        config = type("Config", (), {"output_dir": str(py_dir)})()
+        config = _Cfg(output_dir=str(py_dir))
         manifest = verify_stage.execute({}, "test.json", prev, config)
 
         assert manifest.metrics.get("python_syntax") == "pass"
@@ -55,7 +56,7 @@ class TestVerifyStage:
         prev = StageManifest(stage="generate")
         prev.metrics["languages_generated"] = ["python"]
 
-        config = type("Config", (), {"output_dir": str(py_dir)})()
+        config = _Cfg(output_dir=str(py_dir))
         manifest = verify_stage.execute({}, "test.json", prev, config)
 
         # Should detect the syntax error
@@ -65,14 +66,26 @@ class TestVerifyStage:
         """Balanced module/endmodule should pass."""
         v_dir = tmp_path / "generated"
         v_dir.mkdir()
-        (v_dir / "test.v").write_text(
-            "module test;\n  wire a;\nendmodule\n"
-        )
+        (v_dir / "test.v").write_text("module test;\n  wire a;\nendmodule\n")
+
+        prev = StageManifest(stage="generate")
+        prev.metrics["languages_generated"] = ["verilog"]
+
+        config = _Cfg(output_dir=str(v_dir))
+        manifest = verify_stage.execute({}, "test.json", prev, config)
+
+        assert manifest.metrics.get("verilog_syntax") == "pass"
+
+    def test_verify_verilog_module_keyword_whitespace(self, verify_stage, tmp_path):
+        """`module` followed by a tab or newline still counts as a module."""
+        v_dir = tmp_path / "generated"
+        v_dir.mkdir()
+        (v_dir / "tabs.v").write_text("module\ttop;\n  wire submodule_en;\nendmodule\nmodule\nleaf;\nendmodule\n")
 
         prev = StageManifest(stage="generate")
         prev.metrics["languages_generated"] = ["verilog"]
 
-        config = type("Config", (), {"output_dir": str(v_dir)})()
+        config = _Cfg(output_dir=str(v_dir))
         manifest = verify_stage.execute({}, "test.json", prev, config)
 
         assert manifest.metrics.get("verilog_syntax") == "pass"
@@ -81,18 +94,34 @@ class TestVerifyStage:
         """Unbalanced module/endmodule should fail."""
         v_dir = tmp_path / "generated"
         v_dir.mkdir()
-        (v_dir / "bad.v").write_text(
-            "module test;\n  wire a;\n"  # Missing endmodule
-        )
+        (v_dir / "bad.v").write_text("module test;\n  wire a;\n")  # Missing endmodule
 
         prev = StageManifest(stage="generate")
         prev.metrics["languages_generated"] = ["verilog"]
 
-        config = type("Config", (), {"output_dir": str(v_dir)})()
+        config = _Cfg(output_dir=str(v_dir))
         manifest = verify_stage.execute({}, "test.json", prev, config)
 
         assert manifest.metrics.get("lint_errors_found", 0) > 0
 
+    def test_nested_files_discovered(self, verify_stage, tmp_path):
+        """Files in subdirectories are checked, and C covers both .c and .h."""
+        out_dir = tmp_path / "generated"
+        (out_dir / "python" / "pkg").mkdir(parents=True)
+        (out_dir / "c").mkdir()
+        (out_dir / "python" / "pkg" / "bad.py").write_text("def foo(\n")
+        (out_dir / "c" / "ok.c").write_text("int f(void) { return 0; }\n")
+        (out_dir / "c" / "bad.h").write_text("int g(void) {\n")
+
+        prev = StageManifest(stage="generate")
+        prev.metrics["languages_generated"] = ["python", "c"]
+
+        config = _Cfg(output_dir=str(out_dir))
+        manifest = verify_stage.execute({}, "test.json", prev, config)
+
+        assert manifest.metrics.get("python_syntax") == "fail"
+        assert manifest.metrics.get("c_syntax") == "fail"
+
     def test_no_files_skips(self, verify_stage, tmp_path):
         """Empty output directory should skip checks."""
         empty_dir = tmp_path / "empty"
@@ -101,7 +130,7 @@ class TestVerifyStage:
         prev = StageManifest(stage="generate")
         prev.metrics["languages_generated"] = ["python"]
 
-        config = type("Config", (), {"output_dir": str(empty_dir)})()
+        config = _Cfg(output_dir=str(empty_dir))
         manifest = verify_stage.execute({}, "test.json", prev, config)
 
         # Should skip since no files found
@@ -140,6 +169,15 @@ class TestSelfCorrector:
         )
         assert result.applied is False
 
+    def test_fix_precedence_follows_known_fixes_order(self):
+        corrector = SelfCorrector()
+        # "unbalanced" appears first in the message, but missing_semicolon
+        # is listed before brace_mismatch in KNOWN_FIXES
+        result = corrector.try_fix(
+            "c", "syntax", ["Unbalanced '}' after missing semicolon"]
+        )
+        assert result.fix_type == "append_semicolon"
+
     def test_attempts_tracking(self):
         corrector = SelfCorrector()
         corrector.try_fix("python", "lint", ["trailing whitespace"])
@@ -2,58 +2,58 @@
 Test Python SDK generation
 """
 
-import py_compile
 import sys
 import tempfile
+import traceback
 from pathlib import Path
 
 import pytest
 
+# Standalone runs (python tests/test_*.py) bypass pytest's pythonpath
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from generator.core import GeneratorConfig, GeneratorEngine
 from generator.python_generator import PythonGenerator
 
 
-def test_python_generation():
+def _compile(file_path):
+    """Syntax-check one file in memory, returning the error instead of raising it."""
+    try:
+        compile(Path(file_path).read_bytes(), str(file_path), 'exec')
+    except SyntaxError as e:
+        return e
+    return None
+
+
+def test_python_generation(example_schemas):
     """Test Python code generation from example schemas."""
     print("=" * 70)
     print("Testing Python SDK Generation")
     print("=" * 70)
     print()
 
-    project_root = Path(__file__).parent.parent.parent.parent
-    examples_dir = project_root / "sdk" / "schemas" / "examples"
-
-    if not examples_dir.exists():
-        pytest.skip(f"Examples directory not found: {examples_dir}")
-
     # Create temporary output directory
     with tempfile.TemporaryDirectory() as temp_dir:
         output_dir = Path(temp_dir)
 
-        # Test each example schema
-        examples = list(examples_dir.glob("*.json"))
-        if not examples:
-            pytest.skip("No example schemas found")
+        # One engine serves every example schema
+        engine = GeneratorEngine(GeneratorConfig(
+            output_dir=output_dir,
+            validate_schemas=True,
+            verbose=False
+        ))
 
-        for example_path in examples:
-            print(f"Testing {example_path.name}...")
-            print("-" * 70)
-
-            # Create engine
-            engine = GeneratorEngine(GeneratorConfig(
-                output_dir=output_dir,
-                validate_schemas=True,
-                verbose=False
-            ))
+        # Register Python generator
+        engine.register_generator('python', PythonGenerator())
 
-            # Register Python generator
-            engine.register_generator('python', PythonGenerator())
+        # Test each example schema
+        for example_name, example_schema in example_schemas.items():
+            print(f"Testing {example_name}...")
+            print("-" * 70)
 
             # Load schema
             try:
-                validation = engine.load_schema(example_path)
+                validation = engine.load_schema_dict(example_schema, example_name)
                 if not validation:
                     print("  [FAIL] Validation errors:")
                     for error in validation.errors:
@@ -86,10 +86,9 @@ def test_python_generation():
                 # Validate syntax of generated Python files
                 syntax_errors = 0
                 for file_path in files:
-                    try:
-                        py_compile.compile(file_path, doraise=True)
-                    except py_compile.PyCompileError as e:
-                        print(f"  [FAIL] Syntax error in {Path(file_path).name}: {e}")
+                    error = _compile(file_path)
+                    if error is not None:
+                        print(f"  [FAIL] Syntax error in {Path(file_path).name}: {error}")
                         syntax_errors += 1
 
                 if syntax_errors == 0:
@@ -104,7 +103,6 @@ def test_python_generation():
 
             except Exception as e:
                 print(f"  [FAIL] Exception: {e}")
-                import traceback
                 traceback.print_exc()
                 continue
 
@@ -116,4 +114,4 @@ def test_python_generation():
 
 
 if __name__ == "__main__":
-    sys.exit(test_python_generation())
+    sys.exit(pytest.main([__file__, "-v"]))
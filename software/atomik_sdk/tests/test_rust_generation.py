@@ -2,151 +2,289 @@
 Test Rust SDK generation
 """
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import os
+import shutil
 import subprocess
 import sys
-import tempfile
+import traceback
 from pathlib import Path
 
 import pytest
 
+# Standalone runs (python tests/test_*.py) bypass pytest's pythonpath
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from generator.core import GeneratorConfig, GeneratorEngine
 from generator.rust_generator import RustGenerator
 
 
-def test_rust_generation():
-    """Test Rust code generation from example schemas."""
+@functools.cache
+def _probe_rustc_version():
+    """Return the ``rustc --version`` string, or None if rustc is unavailable.
+
+    Cached so the compiler is spawned at most once per test session.
+    """
+    if shutil.which('rustc') is None:
+        return None
+    try:
+        rustc_version = subprocess.run(
+            ['rustc', '--version'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if rustc_version.returncode != 0:
+        return None
+    return rustc_version.stdout.strip()
+
+
+# pytest cache key holding digests of crates that passed cargo check
+_CARGO_OK_CACHE_KEY = "atomik/cargo_check_ok"
+
+
+def _crate_digest(crate_dir, rustc_version):
+    """SHA-256 over a generated crate's files and the compiler version.
+
+    Any change to the generator or schema that alters the emitted code
+    changes the digest, so a cached pass never outlives its inputs.
+    """
+    h = hashlib.sha256(rustc_version.encode())
+    for path in sorted(p for p in Path(crate_dir).rglob("*") if p.is_file()):
+        h.update(path.relative_to(crate_dir).as_posix().encode())
+        h.update(b"\0")
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+@pytest.fixture(scope="session")
+def cargo_target_dir(tmp_path_factory):
+    """Root for per-crate CARGO_TARGET_DIRs.
+
+    Honours an existing CARGO_TARGET_DIR so a developer's persistent
+    target directory is reused across test sessions; otherwise falls back
+    to a session temp directory.
+    """
+    configured = os.environ.get("CARGO_TARGET_DIR")
+    if configured:
+        root = Path(configured) / "atomik-tests"
+        root.mkdir(parents=True, exist_ok=True)
+        return root
+    return tmp_path_factory.mktemp("cargo-target")
+
+
+async def _spawn_cargo_check(crate_dir, target_dir):
+    """Start ``cargo check`` in *crate_dir* without waiting for it.
+
+    Each crate gets its own target directory: cargo locks the target
+    directory for the duration of a build, so sharing one would
+    serialize the checks again.
+    """
+    env = {**os.environ, "CARGO_TARGET_DIR": str(target_dir)}
+    return await asyncio.create_subprocess_exec(
+        'cargo', 'check',
+        cwd=crate_dir,
+        env=env,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+
+async def _wait_cargo_check(proc, timeout=60):
+    """Wait for a spawned check and return ``(returncode, stderr)``.
+
+    A returncode of None means the check timed out.
+    """
+    try:
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None, ""
+    return proc.returncode, stderr.decode(errors='replace')
+
+
+async def _wait_cargo_checks(spawned):
+    """Collect every spawned check, passing spawn failures through."""
+    async def wait_one(proc_or_error):
+        if isinstance(proc_or_error, Exception):
+            return proc_or_error
+        return await _wait_cargo_check(proc_or_error)
+
+    return await asyncio.gather(
+        *(wait_one(p) for p in spawned), return_exceptions=True
+    )
+
+
+def test_rust_generation(example_schemas, cargo_target_dir, tmp_path, request):
+    """Test Rust code generation from example schemas.
+
+    ``cargo check`` on the generated crates is skipped unless
+    ATOMIK_RUN_CARGO=1 is set (CI sets it). Crates identical to one that
+    already passed (per the pytest cache) are not re-checked; set
+    ATOMIK_FORCE_RUST_TESTS=1 to check every crate regardless.
+    """
     print("=" * 70)
     print("Testing Rust SDK Generation")
     print("=" * 70)
     print()
 
-    project_root = Path(__file__).parent.parent.parent.parent
-    examples_dir = project_root / "sdk" / "schemas" / "examples"
+    run_cargo = os.environ.get("ATOMIK_RUN_CARGO", "0") == "1"
 
-    if not examples_dir.exists():
-        pytest.skip(f"Examples directory not found: {examples_dir}")
+    # Probe the toolchain once rather than per schema
+    rustc_version = _probe_rustc_version() if run_cargo else None
 
-    # Create temporary output directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        output_dir = Path(temp_dir)
+    # Crate digests known to pass, and those passing in this session
+    cache = getattr(request.config, "cache", None)
+    force = os.environ.get("ATOMIK_FORCE_RUST_TESTS", "0") == "1"
+    known_ok = set()
+    if cache is not None and not force:
+        known_ok.update(cache.get(_CARGO_OK_CACHE_KEY, []))
+    passed_ok = set()
 
-        # Test each example schema
-        examples = list(examples_dir.glob("*.json"))
-        if not examples:
-            pytest.skip("No example schemas found")
+    # cargo check runs in the background while later schemas generate
+    loop = asyncio.new_event_loop()
+
+    # With ATOMIK_TEST_TMPFS=1, conftest puts tmp_path on tmpfs, so the
+    # generated crates (and cargo's reads of them) stay in RAM on Linux
+    with contextlib.closing(loop):
+        output_dir = tmp_path
 
-        for example_path in examples:
-            print(f"Testing {example_path.name}...")
-            print("-" * 70)
+        # One engine serves every example schema
+        engine = GeneratorEngine(GeneratorConfig(
+            output_dir=output_dir,
+            validate_schemas=True,
+            verbose=False
+        ))
 
-            # Create engine
-            engine = GeneratorEngine(GeneratorConfig(
-                output_dir=output_dir,
-                validate_schemas=True,
-                verbose=False
-            ))
+        # Register Rust generator
+        engine.register_generator('rust', RustGenerator())
 
-            # Register Rust generator
-            engine.register_generator('rust', RustGenerator())
+        # Spawned cargo checks (or spawn errors) and crate digests,
+        # keyed by example name
+        spawned = {}
+        digests = {}
+
+        # Test each example schema
+        for example_name, example_schema in example_schemas.items():
+            # Buffer this example's report and write it in one call
+            log = []
+            emit = log.append
+            emit(f"Testing {example_name}...")
+            emit("-" * 70)
+
+            # Each example writes its crate to its own subdirectory
+            example_dir = output_dir / Path(example_name).stem
+            engine.config.output_dir = example_dir
 
             # Load schema
             try:
-                validation = engine.load_schema(example_path)
+                validation = engine.load_schema_dict(example_schema, example_name)
                 if not validation:
-                    print("  [FAIL] Validation errors:")
+                    emit("  [FAIL] Validation errors:")
                     for error in validation.errors:
-                        print(f"    - {error}")
+                        emit(f"    - {error}")
                     continue
 
-                print("  [PASS] Schema validated")
+                emit("  [PASS] Schema validated")
 
                 # Generate code
                 results = engine.generate(target_languages=['rust'])
 
                 if 'rust' not in results:
-                    print("  [FAIL] No Rust results")
+                    emit("  [FAIL] No Rust results")
                     continue
 
                 result = results['rust']
 
                 if not result.success:
-                    print("  [FAIL] Generation errors:")
+                    emit("  [FAIL] Generation errors:")
                     for error in result.errors:
-                        print(f"    - {error}")
+                        emit(f"    - {error}")
                     continue
 
-                print(f"  [PASS] Generated {len(result.files)} file(s)")
+                emit(f"  [PASS] Generated {len(result.files)} file(s)")
 
                 # Write files
                 files = engine.write_output(results)
-                print(f"  [PASS] Wrote {len(files)} file(s)")
+                emit(f"  [PASS] Wrote {len(files)} file(s)")
 
                 # Verify expected files exist
                 expected_files = ['Cargo.toml', 'src/lib.rs']
                 for expected in expected_files:
-                    expected_path = output_dir / expected
+                    expected_path = example_dir / expected
                     if not expected_path.exists():
-                        print(f"  [FAIL] Missing expected file: {expected}")
+                        emit(f"  [FAIL] Missing expected file: {expected}")
                         continue
 
-                print("  [PASS] All expected files present")
-
-                # Check if rustc is available for syntax validation
-                try:
-                    rustc_version = subprocess.run(
-                        ['rustc', '--version'],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-
-                    if rustc_version.returncode == 0:
-                        print(f"  [INFO] Found: {rustc_version.stdout.strip()}")
-
-                        # Try to run cargo check in the output directory
-                        print("  [INFO] Running cargo check...")
-                        cargo_check = subprocess.run(
-                            ['cargo', 'check'],
-                            cwd=output_dir,
-                            capture_output=True,
-                            text=True,
-                            timeout=60
-                        )
+                emit("  [PASS] All expected files present")
+                emit("  [PASS] Rust code generation successful")
 
-                        if cargo_check.returncode == 0:
-                            print("  [PASS] Cargo check succeeded")
-                        else:
-                            print("  [WARN] Cargo check warnings/errors:")
-                            if cargo_check.stderr:
-                                for line in cargo_check.stderr.split('\n')[:10]:
-                                    if line.strip():
-                                        print(f"    {line}")
-                    else:
-                        print("  [INFO] rustc not available, skipping syntax validation")
-
-                except FileNotFoundError:
-                    print("  [INFO] Rust toolchain not installed, skipping syntax validation")
-                except subprocess.TimeoutExpired:
-                    print("  [WARN] Cargo check timed out")
-                except Exception as e:
-                    print(f"  [WARN] Could not run cargo check: {e}")
+                if rustc_version is not None:
+                    digest = _crate_digest(example_dir, rustc_version)
+                    if digest in known_ok:
+                        emit("  [SKIP] cargo check passed previously for identical crate")
+                        passed_ok.add(digest)
+                        emit("")
+                        continue
+                    digests[example_name] = digest
+                    try:
+                        spawned[example_name] = loop.run_until_complete(
+                            _spawn_cargo_check(
+                                example_dir, cargo_target_dir / example_dir.name
+                            )
+                        )
+                    except OSError as e:
+                        spawned[example_name] = e
 
-                print("  [PASS] Rust code generation successful")
+                emit("")
 
             except Exception as e:
-                print(f"  [FAIL] Exception: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
-
+                emit(f"  [FAIL] Exception: {e}")
+                emit(traceback.format_exc().rstrip())
+            finally:
+                sys.stdout.write("\n".join(log) + "\n")
+
+        # Check if rustc is available for syntax validation
+        if not run_cargo:
+            print("[SKIP] cargo check (set ATOMIK_RUN_CARGO=1 to enable)")
+        elif rustc_version is None:
+            print("[INFO] rustc not available, skipping syntax validation")
+        elif spawned:
+            print(f"[INFO] Found: {rustc_version}")
+            print(f"[INFO] Waiting for cargo check on {len(spawned)} crate(s)...")
+            checks = loop.run_until_complete(_wait_cargo_checks(spawned.values()))
+
+            for example_name, check in zip(spawned, checks):
+                print(f"  {example_name}:")
+                if isinstance(check, FileNotFoundError):
+                    print("  [INFO] Rust toolchain not installed, skipping syntax validation")
+                elif isinstance(check, Exception):
+                    print(f"  [WARN] Could not run cargo check: {check}")
+                elif check[0] is None:
+                    print("  [WARN] Cargo check timed out")
+                elif check[0] == 0:
+                    print("  [PASS] Cargo check succeeded")
+                    passed_ok.add(digests[example_name])
+                else:
+                    print("  [WARN] Cargo check warnings/errors:")
+                    for line in check[1].split('\n')[:10]:
+                        if line.strip():
+                            print(f"    {line}")
             print()
 
+        if rustc_version is not None and cache is not None:
+            cache.set(_CARGO_OK_CACHE_KEY, sorted(passed_ok))
+
     print("=" * 70)
     print("Rust generation tests complete")
     print("=" * 70)
 
 
 if __name__ == "__main__":
-    sys.exit(test_rust_generation())
+    sys.exit(pytest.main([__file__, "-v"]))
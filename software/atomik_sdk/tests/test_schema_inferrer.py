@@ -1,9 +1,7 @@
 """Tests for the deterministic schema inference engine."""
 
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from pipeline.inference.heuristics import (
     classify_delta_type,
@@ -101,6 +99,10 @@ class TestDeltaTypeClassification:
     def test_parameter_generic(self):
         assert classify_delta_type("temperature", "f64") == "parameter_delta"
 
+    def test_keyword_matches_inside_words_and_type(self):
+        assert classify_delta_type("frameCount", "int") == "delta_stream"
+        assert classify_delta_type("reg", "StatusReg") == "bitmask_delta"
+
 
 class TestFieldExclusion:
     def test_name_excluded(self):
@@ -125,76 +127,75 @@ class TestFieldExclusion:
         assert not is_delta_candidate("_name_")
 
 
-class TestSchemaInferrer:
-    def _make_iface(self, **kwargs) -> LanguageInterface:
-        """Helper to build a LanguageInterface with defaults."""
-        defaults = dict(
-            language="python",
-            file_path="/src/trading/engine.py",
-            struct_name="TradingEngine",
-            fields=[
-                InterfaceField(name="price_delta", type_name="float", bit_width=64),
-                InterfaceField(name="volume_delta", type_name="int", bit_width=64),
-                InterfaceField(name="trade_flags", type_name="int", bit_width=32),
-            ],
-            operations=[
-                InterfaceOperation(name="accumulate", return_type="None"),
-                InterfaceOperation(name="get_state", return_type="dict"),
-                InterfaceOperation(name="rollback", return_type="None"),
-            ],
-            constants={"HISTORY_DEPTH": 512},
-        )
-        defaults.update(kwargs)
-        return LanguageInterface(**defaults)
-
-    def test_infer_produces_valid_schema(self):
-        iface = self._make_iface()
-        inferrer = SchemaInferrer()
-        schema = inferrer.infer(iface)
+def _make_iface(**kwargs) -> LanguageInterface:
+    """Helper to build a LanguageInterface with defaults."""
+    defaults = dict(
+        language="python",
+        file_path="/src/trading/engine.py",
+        struct_name="TradingEngine",
+        fields=[
+            InterfaceField(name="price_delta", type_name="float", bit_width=64),
+            InterfaceField(name="volume_delta", type_name="int", bit_width=64),
+            InterfaceField(name="trade_flags", type_name="int", bit_width=32),
+        ],
+        operations=[
+            InterfaceOperation(name="accumulate", return_type="None"),
+            InterfaceOperation(name="get_state", return_type="dict"),
+            InterfaceOperation(name="rollback", return_type="None"),
+        ],
+        constants={"HISTORY_DEPTH": 512},
+    )
+    defaults.update(kwargs)
+    return LanguageInterface(**defaults)
 
-        assert "catalogue" in schema
-        assert "schema" in schema
-        assert "delta_fields" in schema["schema"]
-        assert "operations" in schema["schema"]
-        assert "constraints" in schema["schema"]
 
-    def test_catalogue_inference(self):
-        iface = self._make_iface()
-        inferrer = SchemaInferrer()
-        schema = inferrer.infer(iface)
+@pytest.fixture(scope="module")
+def inferrer():
+    # Stateless, so one instance serves the whole module
+    return SchemaInferrer()
 
-        cat = schema["catalogue"]
+
+@pytest.fixture(scope="module")
+def base_schema(inferrer):
+    """Schema inferred once from the default interface; read-only."""
+    return inferrer.infer(_make_iface())
+
+
+class TestSchemaInferrer:
+    def test_infer_produces_valid_schema(self, base_schema):
+        assert "catalogue" in base_schema
+        assert "schema" in base_schema
+        assert "delta_fields" in base_schema["schema"]
+        assert "operations" in base_schema["schema"]
+        assert "constraints" in base_schema["schema"]
+
+    def test_catalogue_inference(self, base_schema):
+        cat = base_schema["catalogue"]
         assert cat["object"] == "TradingEngine"
         assert cat["vertical"] == "Finance"
         assert cat["version"] == "1.0.0"
 
-    def test_vertical_override(self):
-        iface = self._make_iface()
-        inferrer = SchemaInferrer()
+    def test_vertical_override(self, inferrer):
+        iface = _make_iface()
         hints = InferenceHints(vertical="Edge")
         schema = inferrer.infer(iface, hints)
 
         assert schema["catalogue"]["vertical"] == "Edge"
 
-    def test_delta_fields_inferred(self):
-        iface = self._make_iface()
-        inferrer = SchemaInferrer()
-        schema = inferrer.infer(iface)
-
-        fields = schema["schema"]["delta_fields"]
+    def test_delta_fields_inferred(self, base_schema):
+        fields = base_schema["schema"]["delta_fields"]
         assert "price_delta" in fields
         assert "volume_delta" in fields
         assert "trade_flags" in fields
         assert fields["trade_flags"]["type"] == "bitmask_delta"
         assert fields["price_delta"]["type"] == "parameter_delta"
 
-    def test_excluded_fields_not_in_delta(self):
-        iface = self._make_iface(fields=[
+    def test_excluded_fields_not_in_delta(self, inferrer):
+        iface = _make_iface(fields=[
             InterfaceField(name="price_delta", type_name="float", bit_width=64),
             InterfaceField(name="name", type_name="str", bit_width=0),
             InterfaceField(name="logger", type_name="Logger", bit_width=0),
         ])
-        inferrer = SchemaInferrer()
         schema = inferrer.infer(iface)
 
         fields = schema["schema"]["delta_fields"]
@@ -202,12 +203,8 @@ class TestSchemaInferrer:
         assert "name" not in fields
         assert "logger" not in fields
 
-    def test_operations_inference(self):
-        iface = self._make_iface()
-        inferrer = SchemaInferrer()
-        schema = inferrer.infer(iface)
-
-        ops = schema["schema"]["operations"]
+    def test_operations_inference(self, base_schema):
+        ops = base_schema["schema"]["operations"]
         assert ops["accumulate"]["enabled"] is True
         assert "reconstruct" in ops  # from get_state
         assert ops["reconstruct"]["enabled"] is True
@@ -215,12 +212,11 @@ class TestSchemaInferrer:
         assert ops["rollback"]["enabled"] is True
         assert ops["rollback"]["history_depth"] == 512  # from constants
 
-    def test_operations_minimal(self):
+    def test_operations_minimal(self, inferrer):
         """Only accumulate when no matching method names."""
-        iface = self._make_iface(operations=[
+        iface = _make_iface(operations=[
             InterfaceOperation(name="compute", return_type="int"),
         ], constants={})
-        inferrer = SchemaInferrer()
         schema = inferrer.infer(iface)
 
         ops = schema["schema"]["operations"]
@@ -228,21 +224,16 @@ class TestSchemaInferrer:
         assert "reconstruct" not in ops
         assert "rollback" not in ops
 
-    def test_constraints_defaults(self):
-        iface = self._make_iface()
-        inferrer = SchemaInferrer()
-        schema = inferrer.infer(iface)
-
-        constraints = schema["schema"]["constraints"]
+    def test_constraints_defaults(self, base_schema):
+        constraints = base_schema["schema"]["constraints"]
         assert constraints["target_frequency_mhz"] == 94.5
         assert constraints["max_memory_mb"] == 64
 
-    def test_wide_stream_encoding(self):
+    def test_wide_stream_encoding(self, inferrer):
         """Wide delta_stream fields should get spatiotemporal encoding."""
-        iface = self._make_iface(fields=[
+        iface = _make_iface(fields=[
             InterfaceField(name="frame_buffer", type_name="bytes", bit_width=128),
         ])
-        inferrer = SchemaInferrer()
         schema = inferrer.infer(iface)
 
         field = schema["schema"]["delta_fields"]["frame_buffer"]
@@ -250,9 +241,8 @@ class TestSchemaInferrer:
         assert field["encoding"] == "spatiotemporal_4x4x4"
         assert field["compression"] == "xor"
 
-    def test_version_override(self):
-        iface = self._make_iface()
-        inferrer = SchemaInferrer()
+    def test_version_override(self, inferrer):
+        iface = _make_iface()
         hints = InferenceHints(version="2.5.0")
         schema = inferrer.infer(iface, hints)
 
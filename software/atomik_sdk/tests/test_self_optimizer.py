@@ -1,16 +1,14 @@
 """Tests for pipeline self-optimization engine."""
 
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from pipeline.consensus import ConsensusResolver
 from pipeline.context.intelligent_manager import IntelligentContextManager
 from pipeline.context.segment_tracker import SegmentTracker
 from pipeline.optimization.self_optimizer import OptimizationReport, SelfOptimizer
 from pipeline.optimization.tuner import ConfigTuner
-from pipeline.regression.baseline import BaselineManager
+from pipeline.regression.baseline import BaselineManager, InMemoryBaselineStorage
 from pipeline.regression.detector import RegressionGate
 
 
@@ -95,41 +93,44 @@ class TestBaselineManager:
         loaded = mgr.get_baseline("test_schema")
         assert loaded is not None
         assert loaded.metrics["fmax_mhz"] == 100.0
+        assert (tmp_path / "baselines" / "test_schema_baseline.json").is_file()
 
-    def test_create_if_missing(self, tmp_path):
-        mgr = BaselineManager(tmp_path / "baselines")
+    def test_create_if_missing(self):
+        mgr = BaselineManager(storage=InMemoryBaselineStorage())
         snap, created = mgr.create_if_missing("new", {"m": 1.0})
         assert created
         snap2, created2 = mgr.create_if_missing("new", {"m": 2.0})
         assert not created2
         assert snap2.metrics["m"] == 1.0  # Unchanged
 
-    def test_update_baseline_ema(self, tmp_path):
-        mgr = BaselineManager(tmp_path / "baselines")
+    def test_update_baseline_ema(self):
+        mgr = BaselineManager(storage=InMemoryBaselineStorage())
         mgr.create_baseline("test", {"value": 100.0})
         updated = mgr.update_baseline("test", {"value": 200.0})
         # EMA: 100*0.7 + 200*0.3 = 130
         assert 125 < updated.metrics["value"] < 135
 
-    def test_list_baselines(self, tmp_path):
-        mgr = BaselineManager(tmp_path / "baselines")
+    def test_list_baselines(self):
+        mgr = BaselineManager(storage=InMemoryBaselineStorage())
         mgr.create_baseline("schema_a", {"m": 1.0})
         mgr.create_baseline("schema_b", {"m": 2.0})
         names = mgr.list_baselines()
         assert len(names) == 2
+        assert mgr.delete_baseline("schema_a")
+        assert mgr.list_baselines() == ["schema_b"]
 
 
 class TestRegressionGate:
-    def test_first_run_creates_baseline(self, tmp_path):
+    def test_first_run_creates_baseline(self):
         gate = RegressionGate(
-            baseline_manager=BaselineManager(tmp_path / "baselines"),
+            baseline_manager=BaselineManager(storage=InMemoryBaselineStorage()),
         )
         result = gate.check("test", {"fmax_mhz": 100.0})
         assert result.baseline_created
         assert result.passed
 
-    def test_no_regression(self, tmp_path):
-        mgr = BaselineManager(tmp_path / "baselines")
+    def test_no_regression(self):
+        mgr = BaselineManager(storage=InMemoryBaselineStorage())
         mgr.create_baseline("test", {"fmax_mhz": 100.0})
         gate = RegressionGate(baseline_manager=mgr)
         result = gate.check("test", {"fmax_mhz": 100.0})
@@ -165,6 +166,21 @@ class TestConsensusResolver:
         })
         assert result.merged_output["field"] == "correct"
 
+    def test_subtree_conflicts_with_leaf(self):
+        resolver = ConsensusResolver()
+        result = resolver.resolve({
+            "agent_a": {"port": {"width": 8}},
+            "agent_b": {"port": 16},
+            "agent_c": {"port": {"width": 8}},
+        })
+        conflict = next(c for c in result.conflicts if c.field_path == "port")
+        assert conflict.values == {
+            "agent_a": {"width": 8},
+            "agent_b": 16,
+            "agent_c": {"width": 8},
+        }
+        assert result.merged_output["port"] == {"width": 8}
+
     def test_interface_field_check(self):
         resolver = ConsensusResolver()
         result = resolver.resolve_interface_fields({
@@ -190,6 +206,26 @@ class TestSegmentTracker:
         ranked = tracker.rank_by_relevance("generate")
         assert ranked[0].segment_id == "s1"  # Higher affinity
 
+    def test_rank_matches_scalar_relevance(self):
+        tracker = SegmentTracker()
+        for i in range(6):
+            tracker.add(f"s{i}", "content", "schema", ["generate"] if i % 2 else [])
+            tracker.advance_task()
+        for _ in range(3):
+            tracker.get("s4")
+        ranked = tracker.rank_by_relevance("generate")
+        expected = sorted(
+            tracker._segments.values(),
+            key=lambda s: tracker._compute_relevance(s, "generate"),
+            reverse=True,
+        )
+        assert [s.segment_id for s in ranked] == [s.segment_id for s in expected]
+        for seg in ranked:
+            assert seg.relevance_score == pytest.approx(
+                tracker._compute_relevance(seg, "generate")
+            )
+        assert SegmentTracker().rank_by_relevance("generate") == []
+
     def test_stale_eviction(self):
         tracker = SegmentTracker(stale_threshold_tasks=2)
         tracker.add("s1", "content", "schema")
@@ -1,18 +1,31 @@
 """Tests for token prediction, caching, and compression."""
 
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from pipeline.agents.context_compressor import ContextCompressor
 from pipeline.agents.prompt_cache import PromptCache
 from pipeline.agents.token_predictor import TokenPredictor
 
 
+@pytest.fixture
+def predictor():
+    return TokenPredictor()
+
+
+@pytest.fixture
+def cache():
+    return PromptCache()
+
+
+@pytest.fixture(scope="module")
+def compressor():
+    # Stateless, so one instance serves the whole module
+    return ContextCompressor()
+
+
 class TestTokenPredictor:
-    def test_predict_with_history(self):
-        predictor = TokenPredictor()
+    def test_predict_with_history(self, predictor):
         predictor.record_actual("gen", 1000)
         predictor.record_actual("gen", 1200)
         predictor.record_actual("gen", 1100)
@@ -24,13 +37,11 @@ class TestTokenPredictor:
         predicted = predictor.predict("gen")
         assert predicted == 2000
 
-    def test_predict_no_history_no_default(self):
-        predictor = TokenPredictor()
+    def test_predict_no_history_no_default(self, predictor):
         predicted = predictor.predict("gen")
         assert predicted == 0
 
-    def test_predict_and_track(self):
-        predictor = TokenPredictor()
+    def test_predict_and_track(self, predictor):
         predictor.record_actual("gen", 1000)
         predicted = predictor.predict_and_track("gen")
         assert isinstance(predicted, int)
@@ -39,8 +50,7 @@ class TestTokenPredictor:
         assert len(records) == 1
         assert records[0]["actual"] == 1050
 
-    def test_predict_remaining(self):
-        predictor = TokenPredictor()
+    def test_predict_remaining(self, predictor):
         predictor.record_actual("validate", 500)
         predictor.record_actual("generate", 3000)
         remaining = predictor.predict_remaining(["validate", "generate"])
@@ -48,35 +58,30 @@ class TestTokenPredictor:
 
 
 class TestPromptCache:
-    def test_cache_put_get(self):
-        cache = PromptCache()
+    def test_cache_put_get(self, cache):
         cache.put("task1", "schema_abc", "cached response")
         result = cache.get("task1", "schema_abc")
         assert result == "cached response"
 
-    def test_cache_miss(self):
-        cache = PromptCache()
+    def test_cache_miss(self, cache):
         result = cache.get("missing", "schema_abc")
         assert result is None
 
-    def test_cache_hit_rate(self):
-        cache = PromptCache()
+    def test_cache_hit_rate(self, cache):
         cache.put("t1", "s1", "val")
         cache.get("t1", "s1")  # hit
         cache.get("t2", "s2")  # miss
         rate = cache.hit_rate()
         assert 40 < rate < 60  # ~50% (returns percentage)
 
-    def test_cache_invalidation(self):
-        cache = PromptCache()
+    def test_cache_invalidation(self, cache):
         cache.put("t1", "s1", "val")
         removed = cache.invalidate_schema("s1")
         assert removed >= 1
         result = cache.get("t1", "s1")
         assert result is None
 
-    def test_cache_clear(self):
-        cache = PromptCache()
+    def test_cache_clear(self, cache):
         cache.put("t1", "s1", "val")
         cache.clear()
         result = cache.get("t1", "s1")
@@ -84,21 +89,18 @@ class TestPromptCache:
 
 
 class TestContextCompressor:
-    def test_strip_comments(self):
-        compressor = ContextCompressor()
+    def test_strip_comments(self, compressor):
         text = "code line\n# comment\nmore code\n// js comment"
         result = compressor.compress(text, budget_pressure=0.55)
         assert "code line" in result
 
-    def test_progressive_compression(self):
-        compressor = ContextCompressor()
+    def test_progressive_compression(self, compressor):
         text = "a " * 500
         result_light = compressor.compress(text, budget_pressure=0.55)
         result_heavy = compressor.compress(text, budget_pressure=0.95)
         assert len(result_heavy) <= len(result_light)
 
-    def test_schema_compression(self):
-        compressor = ContextCompressor()
+    def test_schema_compression(self, compressor):
         schema = {
             "name": "test",
             "description": "A long description that should be stripped",
@@ -110,8 +112,12 @@ class TestContextCompressor:
         assert isinstance(result, dict)
         assert "name" in result
 
-    def test_no_compression_low_pressure(self):
-        compressor = ContextCompressor()
+    def test_minimal_skeleton_keeps_signatures(self, compressor):
+        text = "import os\nclass A:\n    x = 1\n    def f(self):\n        return x\n"
+        result = compressor.compress(text, budget_pressure=0.95)
+        assert result.split("\n") == ["import os", "class A:", "    def f(self):"]
+
+    def test_no_compression_low_pressure(self, compressor):
         text = "unchanged text"
         result = compressor.compress(text, budget_pressure=0.1)
         assert result == text
@@ -14,6 +14,113 @@ from enum import Enum, auto
 import numpy as np
 
 
+def _read_gray_frames(cv2, cap) -> np.ndarray:
+    """
+    Decode every frame of an OpenCV capture into one (T, H, W) uint8 array.
+
+    Frames are converted straight into a buffer sized from the reported
+    frame count, which grows if the count turns out to be low.
+    """
+    ok, frame = cap.read()
+    if not ok:
+        return np.empty((0, 0, 0), dtype=np.uint8)
+
+    height, width = frame.shape[:2]
+    reported = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+    capacity = int(reported) if reported > 0 else 1
+    buf = np.empty((capacity, height, width), dtype=np.uint8)
+
+    count = 0
+    while ok:
+        if count == len(buf):
+            grown = np.empty((2 * len(buf), height, width), dtype=np.uint8)
+            grown[:count] = buf
+            buf = grown
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=buf[count])
+        count += 1
+        ok, frame = cap.read()
+
+    return buf[:count]
+
+
+def _level_histograms(rows: np.ndarray) -> np.ndarray:
+    """
+    256-bin histogram over [0, 256] of each row of a 2-D array.
+
+    Matches ``np.histogram(row, bins=256, range=(0, 256))`` per row:
+    values outside the range (and NaN) are not counted and 256 falls in
+    the last bin. 8-bit input is binned directly.
+    """
+    m = len(rows)
+    offsets = (np.arange(m) * 256)[:, None]
+    if rows.dtype == np.uint8:
+        hist = np.bincount((rows + offsets).ravel(), minlength=m * 256)
+    else:
+        values = rows.astype(np.float64)
+        in_range = (values >= 0) & (values <= 256)
+        levels = np.minimum(np.where(in_range, values, 0), 255).astype(np.intp)
+        hist = np.bincount(
+            (levels + offsets).ravel(), weights=in_range.ravel(), minlength=m * 256
+        ).astype(np.int64)
+    return hist.reshape(m, 256)
+
+
+def _block_moments(rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and population standard deviation of each row of a 2-D array.
+
+    8-bit rows take one pass of exact integer sums of x and x**2, which
+    cannot cancel; other dtypes use NumPy's two-pass mean and std.
+    """
+    if rows.dtype != np.uint8:
+        return rows.mean(axis=1), rows.std(axis=1)
+    n = rows.shape[1]
+    total = rows.sum(axis=1, dtype=np.int64)
+    squares = np.square(rows, dtype=np.uint16).sum(axis=1, dtype=np.int64)
+    return total / n, np.sqrt((n * squares - total * total) / (n * n))
+
+
+def _binarize(blocks: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """
+    Boolean mask of ``blocks > thresholds`` with one threshold per row.
+
+    For 8-bit blocks, ``x > t`` equals ``x > floor(t)``, so the
+    comparison runs on uint8 limits instead of promoting every pixel to
+    float64. Rows whose threshold is below zero are all set.
+    """
+    if blocks.dtype != np.uint8 or np.isnan(thresholds).any():
+        return blocks > thresholds[:, None]
+    floors = np.floor(thresholds)
+    limits = np.clip(floors, 0, 255).astype(np.uint8)
+    binary = blocks > limits[:, None]
+    below_zero = floors < 0
+    if below_zero.any():
+        binary[below_zero] = True
+    return binary
+
+
+def _otsu_scan(hist: np.ndarray, total: int) -> np.ndarray:
+    """
+    Otsu's threshold for each row of an (N, 256) histogram.
+
+    Evaluates the between-class variance at every level with cumulative
+    sums and returns the first level with the largest positive variance
+    (0 when no split separates the row).
+    """
+    weight_bg = np.cumsum(hist, axis=1)
+    weight_fg = total - weight_bg
+    sum_bg = np.cumsum(np.arange(256) * hist, axis=1)
+    sum_total = sum_bg[:, -1:]
+
+    # Empty classes get a variance of 0; clamping their weight to 1 only
+    # avoids dividing by zero, since the product is zero either way
+    mean_bg = sum_bg / np.maximum(weight_bg, 1)
+    mean_fg = (sum_total - sum_bg) / np.maximum(weight_fg, 1)
+    variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+
+    return variance.argmax(axis=1).astype(np.float64)
+
+
 class TileMethod(Enum):
     """Binarization methods for tile processing."""
 
@@ -52,6 +159,50 @@ class Voxel:
         return cls(word=word, position=position)
 
 
+@dataclass
+class VoxelBatch:
+    """
+    Voxels stored as parallel arrays rather than one object per voxel.
+
+    Attributes:
+        words: uint64 array of shape (N,) with the encoded voxel words.
+        positions: int64 array of shape (N, 3) with (t, y, x) positions.
+        stats: Per-voxel statistics arrays keyed like ``Voxel.tile_stats``,
+            or None when statistics were not collected.
+    """
+
+    words: np.ndarray
+    positions: np.ndarray
+    stats: dict[str, np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def deltas(self) -> np.ndarray:
+        """XOR deltas between consecutive words as a uint64 array."""
+        return np.bitwise_xor(self.words[1:], self.words[:-1])
+
+    def to_voxels(self) -> list[Voxel]:
+        """Materialize the batch as a list of Voxel objects."""
+        words = self.words.tolist()
+        positions = zip(*self.positions.T.tolist())
+        if self.stats is None:
+            return [
+                Voxel(word=word, position=position)
+                for word, position in zip(words, positions)
+            ]
+
+        # Fill the dicts column by column; cheaper than dict(zip(...)) per row
+        tile_stats: list[dict] = [{} for _ in words]
+        for name, column in self.stats.items():
+            for entry, value in zip(tile_stats, column.tolist()):
+                entry[name] = value
+        return [
+            Voxel(word=word, position=position, tile_stats=entry)
+            for word, position, entry in zip(words, positions, tile_stats)
+        ]
+
+
 class VoxelEncoder:
     """
     Encoder for converting video frames to 64-bit voxel words.
@@ -65,6 +216,7 @@ class VoxelEncoder:
         voxel_size: The (temporal, height, width) voxel dimensions.
         tile_method: The binarization method used.
         threshold: Fixed threshold value (only for FIXED method).
+        collect_stats: Whether voxels carry per-tile binarization statistics.
 
     Example:
         >>> encoder = VoxelEncoder(tile_method="otsu", voxel_size=(4,4,4))
@@ -78,6 +230,7 @@ class VoxelEncoder:
         tile_method: str | TileMethod = TileMethod.OTSU,
         voxel_size: tuple[int, int, int] = (4, 4, 4),
         threshold: float | None = None,
+        collect_stats: bool = True,
     ):
         """
         Initialize the VoxelEncoder.
@@ -86,6 +239,8 @@ class VoxelEncoder:
             tile_method: Binarization method ('otsu', 'mean', 'adaptive', 'fixed').
             voxel_size: Dimensions (temporal, height, width) for voxels.
             threshold: Fixed threshold value (required if tile_method='fixed').
+            collect_stats: Attach tile statistics to each voxel. Disable to
+                skip the per-tile mean/std and leave ``tile_stats`` as None.
 
         Raises:
             ValueError: If fixed method specified without threshold.
@@ -96,12 +251,11 @@ class VoxelEncoder:
         self.tile_method = tile_method
         self.voxel_size = voxel_size
         self.threshold = threshold
+        self.collect_stats = collect_stats
 
         if self.tile_method == TileMethod.FIXED and threshold is None:
             raise ValueError("Fixed method requires threshold parameter")
 
-        self._cache: dict = {}
-
     def encode_frames(self, frames: np.ndarray) -> list[Voxel]:
         """
         Encode a sequence of frames into voxels.
@@ -112,6 +266,24 @@ class VoxelEncoder:
         Returns:
             List of Voxel objects covering the entire video.
 
+        Raises:
+            ValueError: If frame dimensions are incompatible with voxel size.
+        """
+        return self.encode_frames_arrays(frames).to_voxels()
+
+    def encode_frames_arrays(self, frames: np.ndarray) -> VoxelBatch:
+        """
+        Encode a sequence of frames into a VoxelBatch.
+
+        Same encoding as encode_frames, without creating a Voxel object
+        per voxel.
+
+        Args:
+            frames: NumPy array of shape (T, H, W) containing grayscale frames.
+
+        Returns:
+            VoxelBatch covering the entire video, in (t, y, x) scan order.
+
         Raises:
             ValueError: If frame dimensions are incompatible with voxel size.
         """
@@ -123,21 +295,40 @@ class VoxelEncoder:
                 f"Frame dimensions {frames.shape} too small for voxel size {self.voxel_size}"
             )
 
-        voxels = []
-
-        for ti in range(0, frames_t - t + 1, t):
-            for yi in range(0, frames_h - h + 1, h):
-                for xi in range(0, frames_w - w + 1, w):
-                    # Extract voxel region
-                    region = frames[ti : ti + t, yi : yi + h, xi : xi + w]
-
-                    # Binarize and encode
-                    word, stats = self._encode_region(region)
-
-                    voxel = Voxel(word=word, position=(ti, yi, xi), tile_stats=stats)
-                    voxels.append(voxel)
-
-        return voxels
+        # Block view: one row per voxel, elements in (t, h, w) order,
+        # rows in the same (t, y, x) order as a nested scan of the grid
+        nt, nh, nw = frames_t // t, frames_h // h, frames_w // w
+        blocks = (
+            frames[: nt * t, : nh * h, : nw * w]
+            .reshape(nt, t, nh, h, nw, w)
+            .transpose(0, 2, 4, 1, 3, 5)
+            .reshape(-1, t * h * w)
+        )
+
+        moments = _block_moments(blocks) if self._needs_moments() else None
+        thresholds = self._block_thresholds(blocks, moments)
+        binary = _binarize(blocks, thresholds)
+
+        # Pack the first 64 elements of each block; packbits zero-fills the
+        # last byte, and voxels under 64 bits get zero high bytes
+        packed = np.packbits(binary[:, :64], axis=1, bitorder="little")
+        if packed.shape[1] < 8:
+            packed = np.pad(packed, ((0, 0), (0, 8 - packed.shape[1])))
+        words = packed.view("<u8")[:, 0]
+
+        grid = np.mgrid[0 : nt * t : t, 0 : nh * h : h, 0 : nw * w : w]
+        positions = grid.reshape(3, -1).T.astype(np.int64)
+
+        stats = None
+        if self.collect_stats:
+            stats = {
+                "threshold": thresholds.astype(np.float64),
+                "mean": moments[0],
+                "std": moments[1],
+                "ones_count": binary.sum(axis=1),
+            }
+
+        return VoxelBatch(words=words, positions=positions, stats=stats)
 
     def encode_video(self, path: str) -> list[Voxel]:
         """
@@ -155,115 +346,62 @@ class VoxelEncoder:
             raise ImportError("OpenCV required for video encoding")
 
         cap = cv2.VideoCapture(path)
-        frames = []
-
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            frames.append(gray)
+        try:
+            frames = _read_gray_frames(cv2, cap)
+        finally:
+            cap.release()
 
-        cap.release()
+        return self.encode_frames(frames)
 
-        return self.encode_frames(np.array(frames))
+    def _needs_moments(self) -> bool:
+        """Whether encoding uses per-block mean and std."""
+        return self.collect_stats or self.tile_method not in (
+            TileMethod.FIXED,
+            TileMethod.OTSU,
+        )
 
-    def _encode_region(self, region: np.ndarray) -> tuple[int, dict]:
-        """
-        Encode a single voxel region into a 64-bit word.
-
-        Args:
-            region: Array of shape (t, h, w) containing pixel values.
+    def _block_thresholds(
+        self,
+        blocks: np.ndarray,
+        moments: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> np.ndarray:
+        """Per-block binarization thresholds for an (N, voxel_elements) array.
 
-        Returns:
-            Tuple of (64-bit word, statistics dictionary).
+        *moments* are the blocks' (mean, std) when already computed.
         """
-        # Compute threshold based on method
         if self.tile_method == TileMethod.FIXED:
-            threshold = self.threshold
-        elif self.tile_method == TileMethod.MEAN:
-            threshold = np.mean(region)
-        elif self.tile_method == TileMethod.OTSU:
-            threshold = self._otsu_threshold(region)
-        elif self.tile_method == TileMethod.ADAPTIVE:
-            threshold = self._adaptive_threshold(region)
-        else:
-            threshold = np.mean(region)
-
-        # Binarize
-        binary = (region > threshold).astype(np.uint8)
-
-        # Pack into 64-bit word
-        flat = binary.flatten()[:64]  # Take first 64 bits
-
-        # Pad if necessary
-        if len(flat) < 64:
-            flat = np.pad(flat, (0, 64 - len(flat)))
-
-        word = 0
-        for i, bit in enumerate(flat):
-            if bit:
-                word |= 1 << i
-
-        stats = {
-            "threshold": float(threshold),
-            "mean": float(np.mean(region)),
-            "std": float(np.std(region)),
-            "ones_count": int(np.sum(binary)),
-        }
-
-        return word, stats
-
-    def _otsu_threshold(self, region: np.ndarray) -> float:
-        """Compute Otsu's threshold for the region."""
-        hist, _ = np.histogram(region.flatten(), bins=256, range=(0, 256))
-        total = region.size
-
-        sum_total = np.sum(np.arange(256) * hist)
-        sum_bg = 0
-        weight_bg = 0
-
-        max_variance = 0
-        threshold = 0
-
-        for t in range(256):
-            weight_bg += hist[t]
-            if weight_bg == 0:
-                continue
-
-            weight_fg = total - weight_bg
-            if weight_fg == 0:
-                break
-
-            sum_bg += t * hist[t]
-
-            mean_bg = sum_bg / weight_bg
-            mean_fg = (sum_total - sum_bg) / weight_fg
-
-            variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
-
-            if variance > max_variance:
-                max_variance = variance
-                threshold = t
-
-        return float(threshold)
-
-    def _adaptive_threshold(self, region: np.ndarray) -> float:
-        """Compute adaptive threshold based on local statistics."""
-        mean = np.mean(region)
-        std = np.std(region)
-        return mean - 0.5 * std
+            return np.full(len(blocks), self.threshold, dtype=np.float64)
+        if self.tile_method == TileMethod.OTSU:
+            return self._otsu_thresholds(blocks)
+        mean, std = moments if moments is not None else _block_moments(blocks)
+        if self.tile_method == TileMethod.ADAPTIVE:
+            return mean - 0.5 * std
+        return mean
+
+    def _otsu_thresholds(self, blocks: np.ndarray, chunk: int = 4096) -> np.ndarray:
+        """Otsu's threshold for every block.
+
+        Rows are histogrammed in chunks to bound the N x 256 histogram memory.
+        """
+        return np.concatenate([
+            _otsu_scan(_level_histograms(blocks[start : start + chunk]), blocks.shape[1])
+            for start in range(0, len(blocks), chunk)
+        ])
 
-    def deltas(self, voxels: list[Voxel]) -> Iterator[int]:
+    def deltas(self, voxels: list[Voxel] | VoxelBatch) -> Iterator[int]:
         """
         Compute deltas between consecutive voxels.
 
         Args:
-            voxels: List of voxels in temporal order.
+            voxels: List of voxels or a VoxelBatch, in temporal order.
 
         Yields:
             64-bit XOR delta values.
         """
+        if isinstance(voxels, VoxelBatch):
+            yield from voxels.deltas().tolist()
+            return
+
         prev = None
         for voxel in voxels:
             if prev is not None:
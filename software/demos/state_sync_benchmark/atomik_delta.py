@@ -7,7 +7,19 @@ current state as initial_state XOR accumulator.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import reduce
+from operator import xor
+
+import numpy as np
+
+
+def _xor_fold(deltas: np.ndarray | Sequence[int]) -> int:
+    """XOR all *deltas* together; an empty batch folds to 0."""
+    if isinstance(deltas, np.ndarray) and deltas.dtype == np.uint64:
+        return int(np.bitwise_xor.reduce(deltas)) if deltas.size else 0
+    return reduce(xor, deltas, 0)
 
 
 @dataclass
@@ -18,10 +30,11 @@ class AtomikAccumulator:
     initial_state: int = 0
     accumulator: int = 0
     delta_count: int = 0
+    # All-ones mask for ``width`` bits, fixed at construction
+    mask: int = field(init=False, repr=False, compare=False)
 
-    @property
-    def mask(self) -> int:
-        return (1 << self.width) - 1
+    def __post_init__(self) -> None:
+        self.mask = (1 << self.width) - 1
 
     def load(self, value: int) -> None:
         """LOAD: set initial state, reset accumulator."""
@@ -34,6 +47,16 @@ class AtomikAccumulator:
         self.accumulator = (self.accumulator ^ delta) & self.mask
         self.delta_count += 1
 
+    def accumulate_many(self, deltas: np.ndarray | Sequence[int]) -> None:
+        """ACCUMULATE a batch of deltas in one pass.
+
+        XOR is associative and commutative, so the batch folds to a single
+        delta. A ``uint64`` array is reduced in NumPy; any other sequence
+        falls back to a Python fold.
+        """
+        self.accumulator = (self.accumulator ^ _xor_fold(deltas)) & self.mask
+        self.delta_count += len(deltas)
+
     def read(self) -> int:
         """READ: reconstruct current state = initial XOR accumulator."""
         return (self.initial_state ^ self.accumulator) & self.mask
@@ -62,14 +85,13 @@ class AtomikParallelBank:
     banks: list[int] = field(default_factory=list)
     _next_bank: int = 0
     delta_count: int = 0
+    # All-ones mask for ``width`` bits, fixed at construction
+    mask: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.banks:
             self.banks = [0] * self.n_banks
-
-    @property
-    def mask(self) -> int:
-        return (1 << self.width) - 1
+        self.mask = (1 << self.width) - 1
 
     def load(self, value: int) -> None:
         self.initial_state = value & self.mask
@@ -85,9 +107,17 @@ class AtomikParallelBank:
         self._next_bank = (self._next_bank + 1) % self.n_banks
         self.delta_count += 1
 
+    def accumulate_many(self, deltas: np.ndarray | Sequence[int]) -> None:
+        """Round-robin distribute a batch of deltas, one fold per bank."""
+        for offset in range(min(self.n_banks, len(deltas))):
+            i = (self._next_bank + offset) % self.n_banks
+            self.banks[i] = (
+                self.banks[i] ^ _xor_fold(deltas[offset::self.n_banks])
+            ) & self.mask
+        self._next_bank = (self._next_bank + len(deltas)) % self.n_banks
+        self.delta_count += len(deltas)
+
     def read(self) -> int:
         """XOR merge tree: combine all banks then XOR with initial state."""
-        merged = 0
-        for bank in self.banks:
-            merged ^= bank
+        merged = reduce(xor, self.banks, 0)
         return (self.initial_state ^ merged) & self.mask
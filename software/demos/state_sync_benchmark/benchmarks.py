@@ -5,14 +5,17 @@ from __future__ import annotations
 from dataclasses import asdict
 from typing import Any
 
+from .delta_pool import DeltaPool
 from .scenarios import ALL_SCENARIOS
 
 
 def run_all() -> list[dict[str, Any]]:
     """Run every scenario and return results as dicts."""
     results: list[dict[str, Any]] = []
+    # One seeded pool serves every scenario's deltas
+    pool = DeltaPool.generate()
     for scenario_cls in ALL_SCENARIOS:
-        scenario = scenario_cls()
-        result = scenario.run()
+        # run() is a staticmethod on every scenario; no instance needed
+        result = scenario_cls.run(delta_pool=pool)
         results.append(asdict(result))
     return results
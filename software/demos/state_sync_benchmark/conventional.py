@@ -6,34 +6,45 @@ so benchmarks can measure ATOMiK's improvements against real alternatives.
 
 from __future__ import annotations
 
+import bisect
+import contextlib
 import copy
+import heapq
 import threading
 from dataclasses import dataclass, field
 
 
 @dataclass
 class FullStateCopy:
-    """Baseline: mutex-protected full-state copy on every update."""
+    """Baseline: mutex-protected full-state copy on every update.
+
+    ``use_lock=False`` elides the mutex for single-writer measurements
+    where no contention is possible.
+    """
 
     width: int = 64
     state: int = 0
+    use_lock: bool = True
     _lock: threading.Lock = field(default_factory=threading.Lock)
 
+    def __post_init__(self) -> None:
+        self._guard = self._lock if self.use_lock else contextlib.nullcontext()
+
     def load(self, value: int) -> None:
-        with self._lock:
+        with self._guard:
             self.state = value & ((1 << self.width) - 1)
 
     def update(self, new_state: int) -> None:
-        with self._lock:
+        with self._guard:
             self.state = new_state & ((1 << self.width) - 1)
 
     def read(self) -> int:
-        with self._lock:
+        with self._guard:
             return self.state
 
     def merge(self, other: FullStateCopy) -> None:
         """Merge by overwriting with other's state (last-writer-wins)."""
-        with self._lock:
+        with self._guard:
             self.state = other.read()
 
 
@@ -44,6 +55,7 @@ class EventSourcingStore:
     width: int = 64
     _events: list[int] = field(default_factory=list)
     _snapshots: dict[int, int] = field(default_factory=dict)
+    _snap_keys: list[int] = field(default_factory=list)  # sorted snapshot indices
     _snapshot_interval: int = 100
     _state: int = 0
 
@@ -51,6 +63,9 @@ class EventSourcingStore:
         self._events.append(event)
         self._state = event & ((1 << self.width) - 1)
         if len(self._events) % self._snapshot_interval == 0:
+            # Event counts only grow between rollbacks, so appending
+            # keeps the keys sorted
+            self._snap_keys.append(len(self._events))
             self._snapshots[len(self._events)] = self._state
 
     def read(self) -> int:
@@ -60,12 +75,9 @@ class EventSourcingStore:
         """Roll back by replaying from nearest snapshot. Returns ops count."""
         target = max(0, len(self._events) - steps)
         # Find nearest snapshot at or before target
-        snap_idx = 0
-        snap_state = 0
-        for idx, state in sorted(self._snapshots.items()):
-            if idx <= target:
-                snap_idx = idx
-                snap_state = state
+        pos = bisect.bisect_right(self._snap_keys, target)
+        snap_idx = self._snap_keys[pos - 1] if pos else 0
+        snap_state = self._snapshots.get(snap_idx, 0)
         # Replay from snapshot
         ops = 0
         state = snap_state
@@ -73,7 +85,11 @@ class EventSourcingStore:
             state = self._events[i] & ((1 << self.width) - 1)
             ops += 1
         self._state = state
-        self._events = self._events[:target]
+        del self._events[target:]
+        # Snapshots past the truncated log no longer describe it
+        for idx in self._snap_keys[pos:]:
+            del self._snapshots[idx]
+        del self._snap_keys[pos:]
         return ops + 1  # +1 for the snapshot lookup
 
 
@@ -82,7 +98,8 @@ class OrderedReplaySync:
     """Baseline: ordered message replay for distributed sync.
 
     Messages must be applied in causal order; out-of-order delivery
-    requires buffering and re-sorting.
+    requires buffering until the next sequence number arrives. The
+    buffer is a min-heap keyed on sequence number.
     """
 
     width: int = 64
@@ -92,12 +109,11 @@ class OrderedReplaySync:
 
     def apply_ordered(self, seq: int, value: int) -> int:
         """Apply a sequenced update. Returns number of messages processed."""
-        self._buffer.append((seq, value))
-        self._buffer.sort(key=lambda x: x[0])
+        heapq.heappush(self._buffer, (seq, value))
 
         processed = 0
         while self._buffer and self._buffer[0][0] == self._sequence + 1:
-            _, val = self._buffer.pop(0)
+            _, val = heapq.heappop(self._buffer)
             self._state = val & ((1 << self.width) - 1)
             self._sequence += 1
             processed += 1
@@ -0,0 +1,39 @@
+"""Shared pool of pre-generated 64-bit deltas.
+
+Scenarios draw their deltas from one seeded pool so ``run_all`` pays
+for random generation once instead of once per scenario.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+DEFAULT_POOL_SIZE = 100_000
+
+
+@dataclass(frozen=True)
+class DeltaPool:
+    """Seeded array of uniformly random 64-bit deltas."""
+
+    deltas: np.ndarray
+    seed: int = 42
+
+    @classmethod
+    def generate(
+        cls, size: int = DEFAULT_POOL_SIZE, seed: int = 42
+    ) -> DeltaPool:
+        rng = np.random.default_rng(seed)
+        deltas = rng.integers(0, 1 << 64, size=size, dtype=np.uint64)
+        return cls(deltas=deltas, seed=seed)
+
+    def take(self, n: int) -> np.ndarray:
+        """Return the first *n* deltas as a read-only ``uint64`` view."""
+        if n > self.deltas.size:
+            raise ValueError(
+                f"Requested {n} deltas from a pool of {self.deltas.size}"
+            )
+        view = self.deltas[:n]
+        view.flags.writeable = False
+        return view
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 
 from ..atomik_delta import AtomikAccumulator
 from ..conventional import OrderedReplaySync
+from ..delta_pool import DeltaPool
 
 
 @dataclass
@@ -39,7 +40,9 @@ class DistributedSyncScenario:
 
     @staticmethod
     def run(
-        n_nodes: int = 8, n_updates: int = 10_000
+        n_nodes: int = 8,
+        n_updates: int = 10_000,
+        delta_pool: DeltaPool | None = None,
     ) -> DistributedSyncResult:
         result = DistributedSyncResult(
             n_nodes=n_nodes, n_updates=n_updates
@@ -48,9 +51,12 @@ class DistributedSyncScenario:
         initial = rng.getrandbits(64)
 
         # Generate per-node deltas
+        per_node = n_updates // n_nodes
+        if delta_pool is None:
+            delta_pool = DeltaPool.generate(per_node * n_nodes)
+        pooled = delta_pool.take(per_node * n_nodes).tolist()
         node_deltas: list[list[int]] = [
-            [rng.getrandbits(64) for _ in range(n_updates // n_nodes)]
-            for _ in range(n_nodes)
+            pooled[i * per_node:(i + 1) * per_node] for i in range(n_nodes)
         ]
 
         # --- ATOMiK: each node accumulates independently, then merge ---
@@ -58,7 +64,7 @@ class DistributedSyncScenario:
         for node in nodes:
             node.load(initial)
 
-        t0 = time.perf_counter()
+        t0 = time.perf_counter_ns()
         for i, node in enumerate(nodes):
             for delta in node_deltas[i]:
                 node.accumulate(delta)
@@ -69,7 +75,7 @@ class DistributedSyncScenario:
         for node in nodes:
             merged.merge(node)
         atomik_final = merged.read()
-        atomik_time = time.perf_counter() - t0
+        atomik_ns = time.perf_counter_ns() - t0
 
         # Merge in reverse order to verify order-independence
         merged_reverse = AtomikAccumulator()
@@ -79,7 +85,7 @@ class DistributedSyncScenario:
 
         result.atomik_correct = atomik_final == merged_reverse.read()
         result.atomik_messages = n_nodes  # One merge message per node
-        result.atomik_time_us = atomik_time * 1_000_000
+        result.atomik_time_us = atomik_ns / 1_000
 
         # --- Conventional: ordered replay requires sequencing ---
         sync = OrderedReplaySync()
@@ -94,15 +100,15 @@ class DistributedSyncScenario:
         shuffled = list(all_updates)
         rng.shuffle(shuffled)
 
-        t0 = time.perf_counter()
+        t0 = time.perf_counter_ns()
         total_messages = 0
         for s, val in shuffled:
             processed = sync.apply_ordered(s, val)
             total_messages += 1
-        conventional_time = time.perf_counter() - t0
+        conventional_ns = time.perf_counter_ns() - t0
 
         result.conventional_correct = sync.pending == 0
         result.conventional_messages = total_messages
-        result.conventional_time_us = conventional_time * 1_000_000
+        result.conventional_time_us = conventional_ns / 1_000
 
         return result
@@ -6,12 +6,14 @@ dense full-state updates across N state updates.
 
 from __future__ import annotations
 
-import random
 import time
 from dataclasses import dataclass
 
+import numpy as np
+
 from ..atomik_delta import AtomikAccumulator, AtomikParallelBank
 from ..conventional import FullStateCopy
+from ..delta_pool import DeltaPool
 
 
 @dataclass
@@ -41,60 +43,66 @@ class MemoryTrafficScenario:
         n_updates: int = 100_000,
         state_width: int = 64,
         sparsity: float = 0.95,
+        delta_pool: DeltaPool | None = None,
     ) -> MemoryTrafficResult:
         result = MemoryTrafficResult(
             n_updates=n_updates,
             state_width=state_width,
             sparsity=sparsity,
         )
-        rng = random.Random(42)
+        if state_width % 8 or not 8 <= state_width <= 64:
+            raise ValueError(
+                f"state_width must be a multiple of 8 up to 64, got {state_width}"
+            )
+        rng = np.random.default_rng(42)
         width_bytes = state_width // 8
+        state_limit = 1 << state_width
+
+        # Generate sparse deltas (most bits zero): a sparse delta is a
+        # single random byte at a random byte lane, the rest are dense
+        sparse = rng.random(n_updates) < sparsity
+        lanes = rng.integers(0, width_bytes, size=n_updates, dtype=np.uint64)
+        sparse_vals = rng.integers(0, 256, size=n_updates, dtype=np.uint64) << (
+            lanes * np.uint64(8)
+        )
+        if delta_pool is None:
+            delta_pool = DeltaPool.generate(n_updates)
+        dense_vals = delta_pool.take(n_updates) & np.uint64(state_limit - 1)
+        delta_words = np.where(sparse, sparse_vals, dense_vals)
 
-        # Generate sparse deltas (most bits zero)
-        deltas = []
-        for _ in range(n_updates):
-            if rng.random() < sparsity:
-                # Sparse: only 1-2 non-zero bytes
-                d = rng.getrandbits(8) << (rng.randint(0, width_bytes - 1) * 8)
-            else:
-                d = rng.getrandbits(state_width)
-            deltas.append(d)
+        def random_state() -> int:
+            return int(rng.integers(0, state_limit, dtype=np.uint64))
 
         # --- ATOMiK: only the delta bytes matter ---
         acc = AtomikAccumulator(width=state_width)
-        acc.load(rng.getrandbits(state_width))
-
-        atomik_bytes = 0
-        for delta in deltas:
-            acc.accumulate(delta)
-            # Count non-zero bytes in delta
-            d = delta
-            nz_bytes = 0
-            while d:
-                if d & 0xFF:
-                    nz_bytes += 1
-                d >>= 8
-            atomik_bytes += max(nz_bytes, 1)  # At least 1 byte per op
+        acc.load(random_state())
+        acc.accumulate_many(delta_words)
+
+        # Non-zero bytes per delta, at least 1 byte per op
+        nz_bytes = np.count_nonzero(
+            delta_words.view(np.uint8).reshape(-1, 8), axis=1
+        )
+        atomik_bytes = int(np.maximum(nz_bytes, 1).sum())
 
         result.atomik_bytes_written = atomik_bytes
 
         # --- ATOMiK parallel (16 banks) ---
         bank = AtomikParallelBank(n_banks=16, width=state_width)
-        bank.load(rng.getrandbits(state_width))
-        for delta in deltas:
-            bank.accumulate(delta)
+        bank.load(random_state())
+        bank.accumulate_many(delta_words)
         # Same delta bytes, distributed across banks
         result.atomik_parallel_bytes = atomik_bytes
 
         # --- Conventional: full state copy every update ---
-        store = FullStateCopy(width=state_width)
-        store.load(rng.getrandbits(state_width))
-        conventional_bytes = 0
-        state = store.read()
-        for delta in deltas:
-            state ^= delta  # Simulate applying delta to get new state
-            store.update(state)
-            conventional_bytes += width_bytes  # Full state written every time
+        # Single writer, so the mutex is elided
+        store = FullStateCopy(width=state_width, use_lock=False)
+        store.load(random_state())
+        # Every update writes the full state; the state after update i is
+        # the initial state XOR the first i deltas (prefix XOR)
+        states = np.bitwise_xor.accumulate(delta_words) ^ np.uint64(store.read())
+        if states.size:
+            store.update(int(states[-1]))
+        conventional_bytes = states.size * width_bytes
 
         result.conventional_bytes_written = conventional_bytes
         result.reduction_pct = (
@@ -12,6 +12,11 @@ from dataclasses import dataclass
 
 from ..atomik_delta import AtomikAccumulator
 from ..conventional import EventSourcingStore
+from ..delta_pool import DeltaPool
+
+# Undo/redo rounds timed for the ATOMiK rollback, which is too short
+# (a few XORs) to time reliably as a single call
+_TIMING_ROUNDS = 1_000
 
 
 @dataclass
@@ -37,39 +42,51 @@ class RollbackScenario:
 
     @staticmethod
     def run(
-        n_deltas: int = 10_000, rollback_steps: int = 1
+        n_deltas: int = 10_000,
+        rollback_steps: int = 1,
+        delta_pool: DeltaPool | None = None,
     ) -> RollbackResult:
         result = RollbackResult(
             n_deltas=n_deltas, rollback_steps=rollback_steps
         )
         rng = random.Random(42)
-        deltas = [rng.getrandbits(64) for _ in range(n_deltas)]
+        if delta_pool is None:
+            delta_pool = DeltaPool.generate(n_deltas)
+        delta_words = delta_pool.take(n_deltas)
+        deltas = delta_words.tolist()
 
         # --- ATOMiK: accumulate all, then rollback via self-inverse ---
         acc = AtomikAccumulator()
         acc.load(rng.getrandbits(64))
-        for d in deltas:
-            acc.accumulate(d)
-
-        t0 = time.perf_counter()
-        # Rollback last delta: just XOR it again
-        for i in range(rollback_steps):
-            acc.rollback(deltas[-(i + 1)])
-        atomik_time = time.perf_counter() - t0
+        acc.accumulate_many(delta_words)
+
+        # Rollback last delta: just XOR it again. Rolling back twice
+        # restores the state, so timed rounds undo then redo.
+        undo = deltas[len(deltas) - rollback_steps:][::-1]
+        t0 = time.perf_counter_ns()
+        for _ in range(_TIMING_ROUNDS):
+            for d in undo:
+                acc.rollback(d)
+            for d in undo:
+                acc.rollback(d)
+        atomik_ns = (time.perf_counter_ns() - t0) / (2 * _TIMING_ROUNDS)
+        for d in undo:
+            acc.rollback(d)
 
         result.atomik_undo_ops = rollback_steps
-        result.atomik_latency_us = atomik_time * 1_000_000
+        result.atomik_latency_us = atomik_ns / 1_000
 
         # --- Event sourcing: replay from last snapshot ---
         store = EventSourcingStore()
         for d in deltas:
             store.apply(d)
 
-        t0 = time.perf_counter()
+        # Replay is destructive, so it is timed once
+        t0 = time.perf_counter_ns()
         replay_ops = store.rollback(rollback_steps)
-        conventional_time = time.perf_counter() - t0
+        conventional_ns = time.perf_counter_ns() - t0
 
         result.conventional_undo_ops = replay_ops
-        result.conventional_latency_us = conventional_time * 1_000_000
+        result.conventional_latency_us = conventional_ns / 1_000
 
         return result
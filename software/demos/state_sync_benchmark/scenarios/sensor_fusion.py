@@ -7,12 +7,13 @@ for merging N independent sensor streams into a single fused state.
 from __future__ import annotations
 
 import os
-import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from ..atomik_delta import AtomikAccumulator
 from ..conventional import FullStateCopy
+from ..delta_pool import DeltaPool
 
 
 @dataclass
@@ -27,6 +28,18 @@ class SensorFusionResult:
     n_updates: int = 100_000
 
 
+def _accumulate_stream(acc: AtomikAccumulator, deltas: list[int]) -> None:
+    """Worker: fold one stream's deltas into its own accumulator."""
+    for delta in deltas:
+        acc.accumulate(delta)
+
+
+def _update_stream(store: FullStateCopy, deltas: list[int]) -> None:
+    """Worker: apply one stream's updates to its own locked store."""
+    for delta in deltas:
+        store.update(delta)
+
+
 class SensorFusionScenario:
     """N-stream sensor fusion: lock-free XOR merge vs mutex full-copy."""
 
@@ -38,44 +51,54 @@ class SensorFusionScenario:
     )
 
     @staticmethod
-    def run(n_streams: int = 16, n_updates: int = 100_000) -> SensorFusionResult:
+    def run(
+        n_streams: int = 16,
+        n_updates: int = 100_000,
+        delta_pool: DeltaPool | None = None,
+    ) -> SensorFusionResult:
         result = SensorFusionResult(n_streams=n_streams, n_updates=n_updates)
-        rng = random.Random(42)
-        deltas = [rng.getrandbits(64) for _ in range(n_updates)]
-
-        # --- ATOMiK: N accumulators, merge via XOR ---
-        accumulators = [AtomikAccumulator() for _ in range(n_streams)]
-        for acc in accumulators:
-            acc.load(0)
-
-        t0 = time.perf_counter()
-        for i, delta in enumerate(deltas):
-            accumulators[i % n_streams].accumulate(delta)
-        # Merge all accumulators
-        merged = AtomikAccumulator()
-        for acc in accumulators:
-            merged.merge(acc)
-        _ = merged.read()
-        atomik_time = time.perf_counter() - t0
+        if delta_pool is None:
+            delta_pool = DeltaPool.generate(n_updates)
+        deltas = delta_pool.take(n_updates).tolist()
+        # Stream k receives every n_streams-th delta starting at k
+        streams = [deltas[k::n_streams] for k in range(n_streams)]
+
+        # One worker thread per stream; the pool is started before either
+        # timer so neither path pays thread start-up
+        with ThreadPoolExecutor(max_workers=n_streams) as pool:
+            # --- ATOMiK: N accumulators, merge via XOR ---
+            accumulators = [AtomikAccumulator() for _ in range(n_streams)]
+            for acc in accumulators:
+                acc.load(0)
+
+            t0 = time.perf_counter_ns()
+            list(pool.map(_accumulate_stream, accumulators, streams))
+            # Merge all accumulators
+            merged = AtomikAccumulator()
+            for acc in accumulators:
+                merged.merge(acc)
+            _ = merged.read()
+            atomik_ns = time.perf_counter_ns() - t0
+
+            # --- Conventional: mutex full-state copy ---
+            stores = [FullStateCopy() for _ in range(n_streams)]
+
+            t0 = time.perf_counter_ns()
+            list(pool.map(_update_stream, stores, streams))
+            # Merge by reading all and combining (last-writer-wins typical)
+            for store in stores:
+                _ = store.read()
+            conventional_ns = time.perf_counter_ns() - t0
 
         # Bytes: each delta is 8 bytes, no state copies needed
         result.atomik_bytes = n_updates * 8
-        result.atomik_ops_sec = n_updates / atomik_time
-
-        # --- Conventional: mutex full-state copy ---
-        stores = [FullStateCopy() for _ in range(n_streams)]
-
-        t0 = time.perf_counter()
-        for i, delta in enumerate(deltas):
-            stores[i % n_streams].update(delta)
-        # Merge by reading all and combining (last-writer-wins typical)
-        for store in stores:
-            _ = store.read()
-        conventional_time = time.perf_counter() - t0
+        result.atomik_ops_sec = n_updates * 1_000_000_000 / atomik_ns
 
         # Bytes: each update copies full 8-byte state + lock overhead
         result.conventional_bytes = n_updates * 8 * 2  # read + write
-        result.conventional_ops_sec = n_updates / conventional_time
+        result.conventional_ops_sec = (
+            n_updates * 1_000_000_000 / conventional_ns
+        )
 
         result.speedup = result.atomik_ops_sec / max(
             result.conventional_ops_sec, 1
@@ -4,7 +4,13 @@ Unit tests for the DeltaStream module.
 
 import numpy as np
 import pytest
-from atomik_sdk.delta_stream import DeltaStream, Delta, MotifType
+from atomik_sdk.delta_stream import (
+    Delta,
+    DeltaBatch,
+    DeltaStream,
+    MotifType,
+    _popcount64,
+)
 
 
 class TestDelta:
@@ -74,11 +80,16 @@ class TestDelta:
         assert len(result) == 8
         assert result == b'\x08\x07\x06\x05\x04\x03\x02\x01'
 
+    def test_delta_has_slots(self):
+        """Test Delta instances carry no per-instance __dict__."""
+        delta = Delta(0, (0, 0), 0, MotifType.STATIC, 0.0, 0.0)
+        assert not hasattr(delta, "__dict__")
+
 
 class TestDeltaStream:
     """Tests for the DeltaStream class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_frames(self):
         """Create sample frame data for testing."""
         # Create 8 frames of 8x8 pixels
@@ -86,7 +97,14 @@ class TestDeltaStream:
         # Add some variation
         frames[0:4, :, :] = 100
         frames[4:8, :, :] = 200
+        # Shared across the module, so guard against mutation
+        frames.flags.writeable = False
         return frames
+
+    @pytest.fixture(scope="module")
+    def sample_stream(self, sample_frames):
+        """Stream over sample_frames; iteration does not mutate it."""
+        return DeltaStream(sample_frames, voxel_size=(4, 4, 4))
     
     def test_stream_creation(self, sample_frames):
         """Test creating a DeltaStream from frames."""
@@ -107,30 +125,43 @@ class TestDeltaStream:
         with pytest.raises(ValueError):
             DeltaStream(frames)
     
-    def test_stream_iteration(self, sample_frames):
+    def test_stream_iteration(self, sample_stream):
         """Test iterating over the stream."""
-        stream = DeltaStream(sample_frames, voxel_size=(4, 4, 4))
-        deltas = list(stream)
+        deltas = list(sample_stream)
         assert len(deltas) >= 1
         assert all(isinstance(d, Delta) for d in deltas)
     
-    def test_stream_len(self, sample_frames):
+    def test_stream_len(self, sample_stream):
         """Test __len__ method."""
-        stream = DeltaStream(sample_frames, voxel_size=(4, 4, 4))
-        length = len(stream)
+        length = len(sample_stream)
         assert length >= 0
+        assert length == len(list(sample_stream))
+
+    def test_stream_independent_iterators(self, sample_stream):
+        """Test nested iteration gives each loop its own position."""
+        pairs = [(a, b) for a in sample_stream for b in sample_stream]
+        assert len(pairs) == len(sample_stream) ** 2
+
+    def test_stream_next(self, sample_frames):
+        """Test next() steps through the stream independently of for loops."""
+        stream = DeltaStream(sample_frames, voxel_size=(4, 4, 4))
+        expected = [d.delta_word for d in stream]
+        words = [next(stream).delta_word]
+        assert len(list(stream)) == len(expected)
+        words += [next(stream).delta_word for _ in range(len(expected) - 1)]
+        assert words == expected
+        with pytest.raises(StopIteration):
+            next(stream)
     
-    def test_stream_filter_motif(self, sample_frames):
+    def test_stream_filter_motif(self, sample_stream):
         """Test filtering by motif type."""
-        stream = DeltaStream(sample_frames, voxel_size=(4, 4, 4))
-        static_deltas = list(stream.filter_motif(MotifType.STATIC))
+        static_deltas = list(sample_stream.filter_motif(MotifType.STATIC))
         # First delta should be static (no previous frame)
         assert len(static_deltas) >= 0
     
-    def test_stream_events_only(self, sample_frames):
+    def test_stream_events_only(self, sample_stream):
         """Test filtering for events only."""
-        stream = DeltaStream(sample_frames, voxel_size=(4, 4, 4))
-        events = list(stream.events_only())
+        events = list(sample_stream.events_only())
         # All returned deltas should be events
         assert all(d.is_event for d in events)
     
@@ -150,6 +181,65 @@ class TestDeltaStream:
             for i in range(1, len(deltas)):
                 assert deltas[i].timestamp_ms >= deltas[i-1].timestamp_ms
 
+    def test_stream_deltas_match_window_encoding(self):
+        """Test batched deltas equal the XOR of per-window encodings."""
+        rng = np.random.default_rng(0)
+        frames = rng.integers(0, 256, (18, 6, 5), dtype=np.uint8)
+        stream = DeltaStream(frames, voxel_size=(4, 4, 4))
+        words = [
+            int(stream._encode_voxels(frames[i:i + 4])[0, 0])
+            for i in range(0, 16, 4)
+        ]
+        deltas = list(stream)
+        assert [d.frame_index for d in deltas] == [0, 4, 8, 12]
+        assert deltas[0].delta_word == 0
+        assert [d.delta_word for d in deltas[1:]] == [
+            a ^ b for a, b in zip(words[1:], words[:-1])
+        ]
+
+
+class TestDeltaBatch:
+    """Tests for the struct-of-arrays DeltaBatch."""
+
+    @pytest.fixture
+    def stream(self):
+        rng = np.random.default_rng(2)
+        frames = rng.integers(0, 256, (64, 8, 8), dtype=np.uint8)
+        return DeltaStream(frames, voxel_size=(4, 4, 4))
+
+    def test_batch_matches_iteration(self, stream):
+        """Test to_batch yields the same deltas as iterating the stream."""
+        batch = stream.to_batch()
+        assert isinstance(batch, DeltaBatch)
+        assert len(batch) == 16
+        assert batch.to_deltas() == list(stream)
+
+    def test_batch_select(self, stream):
+        """Test mask selection keeps aligned rows."""
+        batch = stream.to_batch()
+        events = batch.select(batch.is_event)
+        assert events.to_deltas() == [d for d in stream if d.is_event]
+
+    def test_filters_use_batch(self, stream):
+        """Test filter_motif and events_only match per-delta filtering."""
+        deltas = list(stream)
+        for motif in MotifType:
+            expected = [d for d in deltas if d.motif == motif]
+            assert list(stream.filter_motif(motif)) == expected
+        assert list(stream.events_only()) == [d for d in deltas if d.is_event]
+
+    def test_batch_to_bytes(self, stream):
+        """Test batch serialization concatenates Delta.to_bytes."""
+        batch = stream.to_batch()
+        expected = b"".join(d.to_bytes() for d in batch.to_deltas())
+        assert batch.to_bytes() == expected
+
+    def test_short_stream_is_empty(self):
+        """Test a stream shorter than one window has an empty batch."""
+        stream = DeltaStream(np.zeros((3, 4, 4), dtype=np.uint8))
+        assert len(stream.to_batch()) == 0
+        assert list(stream) == []
+
 
 class TestMotifClassification:
     """Tests for motif classification logic."""
@@ -173,3 +263,35 @@ class TestMotifClassification:
         # Many bits set (32+)
         motif = stream._classify_motif(0xFFFFFFFFFFFFFFFF)
         assert motif == MotifType.EXPANSION
+
+    def test_classify_motif_accepts_uint64(self):
+        """Test scalar classification of a DeltaBatch.delta_word entry."""
+        stream = DeltaStream.__new__(DeltaStream)
+        word = np.uint64(0x00FF00FF00FF00FF)
+        assert stream._classify_motif(word) == stream._classify_motif(int(word))
+
+    def test_classify_batch_matches_scalar(self):
+        """Test vectorized classification against _classify_motif."""
+        stream = DeltaStream.__new__(DeltaStream)
+        words = np.array([
+            0, 0x3, 0xFF, 0xFF00000000, 0xFFFFFFFF,
+            0x00FF00FF00FF00FF, 0xFFFFFFFFFFFFFFFF,
+        ], dtype=np.uint64)
+        codes = stream._classify_batch(words, _popcount64(words))
+        assert [MotifType(c) for c in codes.tolist()] == [
+            stream._classify_motif(int(w)) for w in words
+        ]
+
+
+class TestPopcount:
+    """Tests for the vectorized SWAR popcount."""
+
+    def test_popcount64_matches_scalar(self):
+        """Test SWAR popcount against a per-word bit count."""
+        rng = np.random.default_rng(1)
+        words = np.concatenate([
+            rng.integers(0, 1 << 64, 1000, dtype=np.uint64),
+            np.array([0, 1, 1 << 63, (1 << 64) - 1], dtype=np.uint64),
+        ])
+        expected = [bin(int(w)).count("1") for w in words]
+        assert _popcount64(words).tolist() == expected
@@ -2,12 +2,17 @@
 Unit tests for the Motifs module.
 """
 
+import numpy as np
 import pytest
+from atomik_sdk import motifs
 from atomik_sdk.motifs import (
     Motif,
     classify_delta,
     motif_to_bytes,
     bytes_to_motif,
+    bytes_to_motifs,
+    pack_motifs,
+    unpack_motifs,
     get_motif_name,
     get_compression_stats,
     MOTIF_SIGNATURES
@@ -39,6 +44,13 @@ class TestClassifyDelta:
         result = classify_delta(0)
         assert result == Motif.STATIC
     
+    def test_classify_numpy_uint64(self):
+        """Test numpy.uint64 words classify like the equal int."""
+        for word in (0x3, 0xFF00000000000000, 0x00FF00FF00FF00FF, (1 << 64) - 1):
+            expected = classify_delta.__wrapped__(word)
+            assert classify_delta.__wrapped__(np.uint64(word)) == expected
+            assert classify_delta(np.uint64(word)) == expected
+
     def test_classify_horizontal_signatures(self):
         """Test classification of horizontal motion signatures."""
         # Right motion signature
@@ -62,6 +74,17 @@ class TestClassifyDelta:
         result = classify_delta(0xFFFFFFFFFFFFFFFF)
         assert result in (Motif.EXPANSION, Motif.FLICKER)
 
+    def test_signature_lookup_matches_full_rules(self, monkeypatch):
+        """Test exact-signature lookups agree with the uncached rules."""
+        cached = dict(motifs._SIGNATURE_MOTIFS)
+        assert set(cached) == {
+            sig for sigs in MOTIF_SIGNATURES.values() for sig in sigs
+        }
+        monkeypatch.setattr(motifs, "_SIGNATURE_MOTIFS", {})
+        for sig, motif in cached.items():
+            # Bypass the memo so the full rules run
+            assert classify_delta.__wrapped__(sig) == motif
+
 
 class TestMotifSerialization:
     """Tests for motif serialization functions."""
@@ -101,6 +124,36 @@ class TestMotifSerialization:
         assert result == Motif.HORIZONTAL_MOTION
 
 
+    def test_bytes_to_motifs(self):
+        """Test batch decode masks upper bits like bytes_to_motif."""
+        data = b'\x00\xF1\x0E\x2B'
+        codes = bytes_to_motifs(data)
+        assert codes.tolist() == [bytes_to_motif(bytes([b])) for b in data]
+
+    def test_pack_motifs_roundtrip(self):
+        """Test nibble packing round-trips odd and even lengths."""
+        motifs = list(Motif) + [Motif.NOISE, Motif.STATIC, Motif.FLICKER]
+        for n in (0, 1, 2, len(motifs)):
+            packed = pack_motifs(motifs[:n])
+            assert len(packed) == (n + 1) // 2
+            assert unpack_motifs(packed, n) == motifs[:n]
+
+    def test_pack_motifs_layout(self):
+        """Test the first motif goes in the low nibble."""
+        assert pack_motifs([Motif.HORIZONTAL_MOTION, Motif.NOISE]) == b'\xE1'
+        assert pack_motifs([Motif.FLICKER]) == b'\x0B'
+
+    def test_unpack_motifs_short_data_raises(self):
+        """Test asking for more motifs than the data holds."""
+        with pytest.raises(ValueError):
+            unpack_motifs(b'\x00', 3)
+
+    def test_unpack_motifs_negative_count_raises(self):
+        """Test a negative count is rejected rather than sliced from the end."""
+        with pytest.raises(ValueError):
+            unpack_motifs(b'\x01', -1)
+
+
 class TestGetMotifName:
     """Tests for the get_motif_name function."""
     
@@ -150,6 +203,17 @@ class TestCompressionStats:
         result = get_compression_stats(motifs)
         assert result["dominant_motif"] == "STATIC"
 
+    def test_dominant_tie_goes_to_first_seen(self):
+        """Test ties in the histogram keep first-seen order."""
+        motifs = [Motif.NOISE, Motif.STATIC, Motif.STATIC, Motif.NOISE]
+        assert get_compression_stats(motifs)["dominant_motif"] == "NOISE"
+
+    def test_array_input_matches_list(self):
+        """Test an array of motif codes gives the same stats as a list."""
+        motifs = [Motif.FLICKER, Motif.STATIC, Motif.FLICKER, Motif.EXPANSION]
+        codes = np.array([int(m) for m in motifs], dtype=np.int64)
+        assert get_compression_stats(codes) == get_compression_stats(motifs)
+
 
 class TestMotifSignatures:
     """Tests for motif signature constants."""
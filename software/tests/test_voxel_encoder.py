@@ -0,0 +1,316 @@
+"""
+Unit tests for the VoxelEncoder module.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from atomik_sdk.voxel_encoder import (
+    TileMethod,
+    Voxel,
+    VoxelBatch,
+    VoxelEncoder,
+    _binarize,
+    _read_gray_frames,
+)
+
+
+def _reference_word(binary):
+    """Bit i of the word is element i of the flattened region."""
+    word = 0
+    for i, bit in enumerate(binary.flatten()[:64]):
+        if bit:
+            word |= 1 << i
+    return word
+
+
+def _reference_otsu(region):
+    """Otsu's threshold by a direct scan over the 256 levels."""
+    hist, _ = np.histogram(region.flatten(), bins=256, range=(0, 256))
+    total = region.size
+    sum_total = np.sum(np.arange(256) * hist)
+    sum_bg = weight_bg = 0
+    max_variance = threshold = 0
+    for t in range(256):
+        weight_bg += hist[t]
+        if weight_bg == 0:
+            continue
+        weight_fg = total - weight_bg
+        if weight_fg == 0:
+            break
+        sum_bg += t * hist[t]
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_total - sum_bg) / weight_fg
+        variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        if variance > max_variance:
+            max_variance = variance
+            threshold = t
+    return float(threshold)
+
+
+def _otsu(encoder, region):
+    """Otsu's threshold of one region through the batch path."""
+    return float(encoder._otsu_thresholds(region.reshape(1, -1))[0])
+
+
+def _encode_one(encoder, region):
+    """Encode a region of exactly one voxel; returns (word, tile_stats)."""
+    (voxel,) = encoder.encode_frames(region)
+    return voxel.word, voxel.tile_stats
+
+
+def _reference_threshold(encoder, region):
+    """Per-region threshold computed directly with NumPy."""
+    if encoder.tile_method is TileMethod.FIXED:
+        return encoder.threshold
+    if encoder.tile_method is TileMethod.OTSU:
+        return _reference_otsu(region)
+    if encoder.tile_method is TileMethod.ADAPTIVE:
+        return np.mean(region) - 0.5 * np.std(region)
+    return np.mean(region)
+
+
+class TestOtsuThreshold:
+    """Tests for the cumulative-sum Otsu scan."""
+
+    def test_matches_direct_scan(self):
+        """Thresholds agree with a level-by-level scan."""
+        rng = np.random.default_rng(3)
+        encoder = VoxelEncoder()
+        regions = [rng.integers(0, 256, size=(4, 4, 4), dtype=np.uint8) for _ in range(100)]
+        regions += [rng.uniform(-20, 280, size=(4, 4, 4)) for _ in range(100)]
+        regions += [
+            np.full((4, 4, 4), 9, dtype=np.uint8),
+            np.where(rng.random((4, 4, 4)) < 0.5, 10, 200).astype(np.uint8),
+        ]
+        for region in regions:
+            assert _otsu(encoder, region) == _reference_otsu(region)
+
+    def test_range_edges_and_nan(self):
+        """Out-of-range values and NaN are skipped; 256 lands in the top bin."""
+        rng = np.random.default_rng(4)
+        region = rng.uniform(0, 256, size=(4, 4, 4))
+        region.flat[:6] = [256.0, np.nan, 255.5, -0.5, 0.0, 300.0]
+        assert _otsu(VoxelEncoder(), region) == _reference_otsu(region)
+
+    def test_batch_matches_single_region(self):
+        """Chunked batch thresholds equal the per-region thresholds."""
+        rng = np.random.default_rng(5)
+        encoder = VoxelEncoder()
+        blocks = rng.integers(0, 256, size=(50, 64), dtype=np.uint8)
+        expected = [_otsu(encoder, block) for block in blocks]
+        assert encoder._otsu_thresholds(blocks, chunk=7).tolist() == expected
+
+
+class TestEncodeSingleVoxel:
+    """Tests for the bit packing of one voxel."""
+
+    def test_single_bit_positions(self):
+        """Each voxel element maps to the matching bit of the word."""
+        encoder = VoxelEncoder(tile_method="fixed", threshold=0.5)
+        for i in (0, 1, 7, 8, 31, 32, 63):
+            region = np.zeros(64, dtype=np.uint8)
+            region[i] = 1
+            word, stats = _encode_one(encoder, region.reshape(4, 4, 4))
+            assert word == 1 << i
+            assert stats["ones_count"] == 1
+
+    def test_all_ones(self):
+        """A fully set region packs to the maximum 64-bit value."""
+        encoder = VoxelEncoder(tile_method="fixed", threshold=0)
+        word, _ = _encode_one(encoder, np.full((4, 4, 4), 255, dtype=np.uint8))
+        assert word == (1 << 64) - 1
+
+    @pytest.mark.parametrize("method", ["otsu", "mean", "adaptive"])
+    def test_random_regions_match_reference(self, method):
+        """Packed words match bit-by-bit packing for every method."""
+        rng = np.random.default_rng(0)
+        encoder = VoxelEncoder(tile_method=method)
+        for _ in range(50):
+            region = rng.integers(0, 256, size=(4, 4, 4), dtype=np.uint8)
+            word, stats = _encode_one(encoder, region)
+            binary = region > stats["threshold"]
+            assert word == _reference_word(binary)
+
+    @pytest.mark.parametrize("dtype", [np.uint8, np.float64])
+    def test_stats_match_numpy(self, dtype):
+        """Single-pass mean/std agree with np.mean/np.std."""
+        rng = np.random.default_rng(10)
+        encoder = VoxelEncoder(tile_method="adaptive")
+        for _ in range(50):
+            region = rng.integers(0, 256, size=(4, 4, 4)).astype(dtype)
+            _, stats = _encode_one(encoder, region)
+            assert stats["mean"] == pytest.approx(np.mean(region), rel=1e-12)
+            assert stats["std"] == pytest.approx(np.std(region), rel=1e-12)
+            expected = np.mean(region) - 0.5 * np.std(region)
+            assert stats["threshold"] == pytest.approx(expected, rel=1e-12)
+
+    def test_small_voxel_is_zero_padded(self):
+        """Voxels with fewer than 64 elements leave the high bits clear."""
+        encoder = VoxelEncoder(tile_method="fixed", voxel_size=(2, 2, 2), threshold=0)
+        word, _ = _encode_one(encoder, np.ones((2, 2, 2), dtype=np.uint8))
+        assert word == 0xFF
+
+    def test_word_round_trips_through_bytes(self):
+        """Encoded words survive Voxel.to_bytes / from_bytes."""
+        rng = np.random.default_rng(1)
+        frames = rng.integers(0, 256, size=(4, 8, 8), dtype=np.uint8)
+        voxels = VoxelEncoder(tile_method="mean").encode_frames(frames)
+        assert len(voxels) == 4
+        for voxel in voxels:
+            assert Voxel.from_bytes(voxel.to_bytes()).word == voxel.word
+
+
+class TestEncodeFrames:
+    """Tests for the vectorized VoxelEncoder.encode_frames."""
+
+    @pytest.mark.parametrize("dtype", [np.uint8, np.float64])
+    @pytest.mark.parametrize("method", ["otsu", "mean", "adaptive", "fixed"])
+    def test_matches_per_region_reference(self, method, dtype):
+        """Batch encoding agrees with a per-region NumPy reference."""
+        rng = np.random.default_rng(2)
+        # Ragged edges are dropped; one constant tile exercises Otsu's fallback
+        frames = rng.integers(0, 256, size=(9, 10, 14)).astype(dtype)
+        frames[:4, :4, :4] = 7
+        encoder = VoxelEncoder(tile_method=method, threshold=100.0)
+
+        voxels = encoder.encode_frames(frames)
+
+        assert len(voxels) == 2 * 2 * 3
+        for voxel in voxels:
+            ti, yi, xi = voxel.position
+            region = frames[ti:ti + 4, yi:yi + 4, xi:xi + 4]
+            stats = voxel.tile_stats
+            binary = region > stats["threshold"]
+            assert voxel.word == _reference_word(binary)
+            assert stats["threshold"] == pytest.approx(_reference_threshold(encoder, region))
+            assert stats["mean"] == pytest.approx(np.mean(region))
+            assert stats["std"] == pytest.approx(np.std(region))
+            assert stats["ones_count"] == int(binary.sum())
+
+    def test_too_small_raises(self):
+        """Frames smaller than one voxel are rejected."""
+        with pytest.raises(ValueError):
+            VoxelEncoder().encode_frames(np.zeros((3, 4, 4), dtype=np.uint8))
+
+    def test_collect_stats_disabled(self):
+        """Without stats, voxels keep their words and carry no tile_stats."""
+        rng = np.random.default_rng(6)
+        frames = rng.integers(0, 256, size=(4, 8, 8), dtype=np.uint8)
+        with_stats = VoxelEncoder(tile_method="adaptive").encode_frames(frames)
+        without = VoxelEncoder(tile_method="adaptive", collect_stats=False).encode_frames(frames)
+
+        assert [v.word for v in without] == [v.word for v in with_stats]
+        assert [v.position for v in without] == [v.position for v in with_stats]
+        assert all(v.tile_stats is None for v in without)
+
+
+class TestBinarize:
+    """Tests for the per-row threshold comparison."""
+
+    def test_uint8_matches_float_comparison(self):
+        """Integer limits give the same mask as comparing against floats."""
+        rng = np.random.default_rng(11)
+        blocks = rng.integers(0, 256, size=(200, 64), dtype=np.uint8)
+        thresholds = np.concatenate([
+            rng.uniform(-5, 260, 190),
+            [-1.0, -0.5, 0.0, 0.5, 127.0, 254.5, 255.0, 300.0, np.inf, -np.inf],
+        ])
+        expected = blocks > thresholds[:, None]
+        assert np.array_equal(_binarize(blocks, thresholds), expected)
+
+    def test_nan_threshold_sets_nothing(self):
+        """A NaN threshold compares false, as with plain NumPy."""
+        blocks = np.full((2, 64), 200, dtype=np.uint8)
+        binary = _binarize(blocks, np.array([np.nan, 100.0]))
+        assert not binary[0].any()
+        assert binary[1].all()
+
+
+class TestVoxelBatch:
+    """Tests for the array-based VoxelBatch output."""
+
+    @pytest.mark.parametrize("collect_stats", [True, False])
+    def test_batch_matches_voxels(self, collect_stats):
+        """Batch arrays hold the same words, positions and stats as Voxels."""
+        rng = np.random.default_rng(7)
+        frames = rng.integers(0, 256, size=(8, 12, 8), dtype=np.uint8)
+        encoder = VoxelEncoder(collect_stats=collect_stats)
+
+        batch = encoder.encode_frames_arrays(frames)
+        voxels = encoder.encode_frames(frames)
+
+        assert isinstance(batch, VoxelBatch)
+        assert len(batch) == len(voxels) == 2 * 3 * 2
+        assert batch.words.dtype == np.uint64
+        assert batch.positions.shape == (len(voxels), 3)
+        assert batch.words.tolist() == [v.word for v in voxels]
+        assert [tuple(p) for p in batch.positions.tolist()] == [v.position for v in voxels]
+        if collect_stats:
+            for i, voxel in enumerate(voxels):
+                assert voxel.tile_stats == {k: col[i] for k, col in batch.stats.items()}
+        else:
+            assert batch.stats is None
+
+    def test_deltas_match_voxel_list(self):
+        """Batch deltas equal the XOR of consecutive Voxel words."""
+        rng = np.random.default_rng(8)
+        frames = rng.integers(0, 256, size=(16, 8, 8), dtype=np.uint8)
+        encoder = VoxelEncoder(tile_method="mean")
+
+        batch = encoder.encode_frames_arrays(frames)
+        expected = list(encoder.deltas(encoder.encode_frames(frames)))
+
+        assert batch.deltas().tolist() == expected
+        assert list(encoder.deltas(batch)) == expected
+
+
+class _FakeCapture:
+    """Stand-in for cv2.VideoCapture over a list of BGR frames."""
+
+    def __init__(self, frames, reported_count):
+        self._frames = iter(frames)
+        self._reported_count = reported_count
+        self.released = False
+
+    def read(self):
+        frame = next(self._frames, None)
+        return frame is not None, frame
+
+    def get(self, prop):
+        return self._reported_count
+
+    def release(self):
+        self.released = True
+
+
+def _fake_cv2():
+    def cvt_color(frame, code, dst):
+        dst[...] = frame[..., 0]
+        return dst
+
+    return SimpleNamespace(CAP_PROP_FRAME_COUNT=7, COLOR_BGR2GRAY=6, cvtColor=cvt_color)
+
+
+class TestReadGrayFrames:
+    """Tests for decoding capture frames into one buffer."""
+
+    @pytest.mark.parametrize("reported_count", [5, 2, 0, 40])
+    def test_frames_stacked_whatever_the_reported_count(self, reported_count):
+        """Under-, over- and unreported frame counts all yield every frame."""
+        rng = np.random.default_rng(9)
+        bgr = [rng.integers(0, 256, size=(6, 8, 3), dtype=np.uint8) for _ in range(5)]
+        cap = _FakeCapture(bgr, reported_count)
+
+        frames = _read_gray_frames(_fake_cv2(), cap)
+
+        assert frames.shape == (5, 6, 8)
+        assert frames.dtype == np.uint8
+        assert np.array_equal(frames, np.stack([f[..., 0] for f in bgr]))
+
+    def test_empty_capture(self):
+        """A capture with no frames gives an empty (0, 0, 0) array."""
+        frames = _read_gray_frames(_fake_cv2(), _FakeCapture([], 0))
+        assert frames.shape == (0, 0, 0)